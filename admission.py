@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Admission control for the Learning Objectives Generator web servers
+Limits how many generation requests run at once and how many may wait, so
+an overloaded server answers 503 quickly instead of queueing without bound.
+"""
+
+import threading
+import time
+from typing import Dict, List
+
+from config import env_int, env_float
+
+# Defaults, overridable through the environment
+DEFAULT_MAX_IN_FLIGHT = env_int('LEARNING_OBJECTIVES_MAX_IN_FLIGHT', 4, minimum=1)
+DEFAULT_MAX_QUEUE = env_int('LEARNING_OBJECTIVES_MAX_QUEUE', 8)
+DEFAULT_QUEUE_TIMEOUT = env_float('LEARNING_OBJECTIVES_QUEUE_TIMEOUT', 5.0)
+DEFAULT_RETRY_AFTER = env_int('LEARNING_OBJECTIVES_RETRY_AFTER', 1)
+
+OVERLOADED_MESSAGE = 'Server is busy, please retry later'
+
+class AdmissionController:
+    """A bounded number of running requests plus a bounded, timed wait queue"""
+
+    def __init__(self, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT, max_queue: int = DEFAULT_MAX_QUEUE,
+                 queue_timeout: float = DEFAULT_QUEUE_TIMEOUT, retry_after: int = DEFAULT_RETRY_AFTER):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self._condition = threading.Condition()
+        self.in_flight = 0
+        self.queued = 0
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+
+    def acquire(self) -> bool:
+        """Wait for a free slot; returns False when the request should get a 503"""
+        with self._condition:
+            if self.in_flight < self.max_in_flight and not self.queued:
+                self.in_flight += 1
+                self.admitted += 1
+                return True
+
+            if self.queued >= self.max_queue:
+                self.rejected_queue_full += 1
+                return False
+
+            self.queued += 1
+            deadline = time.monotonic() + self.queue_timeout
+            try:
+                while self.in_flight >= self.max_in_flight:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.rejected_timeout += 1
+                        return False
+                    self._condition.wait(remaining)
+            finally:
+                self.queued -= 1
+
+            self.in_flight += 1
+            self.admitted += 1
+            return True
+
+    def release(self) -> None:
+        """Free the slot taken by a successful acquire()"""
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify()
+
+    def stats(self) -> Dict[str, int]:
+        """Return the current load and rejection counts for health reporting"""
+        with self._condition:
+            return {
+                'in_flight': self.in_flight,
+                'queue_depth': self.queued,
+                'max_in_flight': self.max_in_flight,
+                'max_queue': self.max_queue,
+                'admitted': self.admitted,
+                'rejected_queue_full': self.rejected_queue_full,
+                'rejected_timeout': self.rejected_timeout,
+            }
+
+    def render_metrics(self) -> List[str]:
+        """Render the admission state in the Prometheus text format"""
+        stats = self.stats()
+        prefix = "learning_objectives_admission"
+        return [
+            f"# HELP {prefix}_in_flight Generation requests currently admitted",
+            f"# TYPE {prefix}_in_flight gauge",
+            f"{prefix}_in_flight {stats['in_flight']}",
+            f"# HELP {prefix}_queue_depth Generation requests waiting for a slot",
+            f"# TYPE {prefix}_queue_depth gauge",
+            f"{prefix}_queue_depth {stats['queue_depth']}",
+            f"# HELP {prefix}_rejected_total Generation requests answered with 503, by reason",
+            f"# TYPE {prefix}_rejected_total counter",
+            f'{prefix}_rejected_total{{reason="queue_full"}} {stats["rejected_queue_full"]}',
+            f'{prefix}_rejected_total{{reason="timeout"}} {stats["rejected_timeout"]}',
+        ]
@@ -3,17 +3,26 @@
 Web interface for the Learning Objectives Generator
 """
 
-from flask import Flask, request, render_template_string, jsonify
+from flask import Flask, request, jsonify, Response, g, make_response
+from werkzeug.exceptions import RequestEntityTooLarge
 import sys
 import os
 
 # Add the current directory to Python path to import our generator
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from learning_objectives_generator import LearningObjectivesGenerator
+from learning_objectives_generator import get_generator, parse_goal_batch, BatchTooLargeError
+from prepared_page import PreparedPage
+from metrics import ServerMetrics, StageTimer, PROMETHEUS_CONTENT_TYPE, server_timing_header
+from admission import AdmissionController, OVERLOADED_MESSAGE
+from config import DEFAULT_MAX_BODY_SIZE
+from profiling import PROFILING_ENABLED, PROFILE_ID_HEADER, wants_profile, request_id_from, run_profiled
 
 app = Flask(__name__)
 
+# Werkzeug answers 413 from the Content-Length header, or stops reading a chunked body, past this size
+app.config['MAX_CONTENT_LENGTH'] = DEFAULT_MAX_BODY_SIZE
+
 # HTML template for the web interface
 HTML_TEMPLATE = '''
 <!DOCTYPE html>
@@ -297,23 +306,98 @@ HTML_TEMPLATE = '''
 </html>
 '''
 
+# The page has no template variables, so it is encoded and compressed once at startup
+INDEX_PAGE = PreparedPage(HTML_TEMPLATE)
+
+# Request counts and latencies, exposed on /metrics
+METRICS = ServerMetrics(('/', '/health', '/metrics', '/api/generate', '/api/generate/batch'))
+
+# Limits on concurrent and waiting generation requests, configured from the environment
+ADMISSION = AdmissionController()
+METRICS.add_collector(ADMISSION.render_metrics)
+
+@app.before_request
+def start_request_metrics():
+    """Start timing the request and count it as in flight"""
+    g.metrics_endpoint = METRICS.endpoint_label(request.path)
+    g.timer = StageTimer()
+    METRICS.request_started(g.metrics_endpoint)
+
+@app.after_request
+def record_response_status(response):
+    """Remember the status code for the request metrics and report stage timings"""
+    g.status_code = response.status_code
+    if g.timer.durations:
+        response.headers['Server-Timing'] = server_timing_header(g.timer)
+    return response
+
+@app.teardown_request
+def finish_request_metrics(exception=None):
+    """Record the finished request, including ones that raised"""
+    if 'timer' in g:
+        METRICS.request_finished(g.metrics_endpoint, g.get('status_code', 500), g.timer)
+
+def _overloaded_response():
+    """Tell the client the server is overloaded and when to retry"""
+    response = jsonify({
+        'success': False,
+        'error': OVERLOADED_MESSAGE
+    })
+    response.status_code = 503
+    response.headers['Retry-After'] = str(ADMISSION.retry_after)
+    return response
+
 @app.route('/')
 def index():
     """Main page with the form"""
-    return render_template_string(HTML_TEMPLATE)
+    encoding, body, etag = INDEX_PAGE.select(request.headers.get('Accept-Encoding'))
+    headers = INDEX_PAGE.headers(encoding, etag)
+    
+    if INDEX_PAGE.is_not_modified(request.headers.get('If-None-Match'), etag):
+        return Response(status=304, headers={
+            name: headers[name] for name in ('ETag', 'Cache-Control', 'Vary')
+        })
+    
+    return Response(body, status=200, headers=headers)
 
 @app.route('/api/generate', methods=['POST'])
 def generate_objectives():
     """API endpoint to generate learning objectives"""
+    if PROFILING_ENABLED and wants_profile(request.headers):
+        profile_id = request_id_from(request.headers)
+        result, path = run_profiled(_generate_objectives, request_id=profile_id)
+        app.logger.info("Profile written to %s", path)
+        response = make_response(result)
+        response.headers[PROFILE_ID_HEADER] = profile_id
+        return response
+    return _generate_objectives()
+
+def _generate_objectives():
+    """Generate learning objectives for the goal in the request body"""
     try:
-        data = request.get_json()
+        request.get_data(cache=True)
+        g.timer.lap('read')
+        data = request.get_json(silent=True)
+        g.timer.lap('parse')
         
-        if not data or 'goal' not in data:
+        if data is None:
+            return jsonify({
+                'success': False,
+                'error': 'Invalid JSON data'
+            }), 400
+        
+        if not isinstance(data, dict) or 'goal' not in data:
             return jsonify({
                 'success': False,
                 'error': 'No goal provided'
             }), 400
         
+        if not isinstance(data['goal'], str):
+            return jsonify({
+                'success': False,
+                'error': 'Goal must be a string'
+            }), 400
+        
         goal = data['goal'].strip()
         
         if not goal:
@@ -322,15 +406,78 @@ def generate_objectives():
                 'error': 'Goal cannot be empty'
             }), 400
         
-        # Generate objectives using our existing generator
-        generator = LearningObjectivesGenerator()
-        result = generator.generate_learning_objectives(goal)
+        # Generate objectives using the shared generator, once a slot is free
+        if not ADMISSION.acquire():
+            return _overloaded_response()
+        try:
+            result = get_generator().generate_learning_objectives(goal, g.timer)
+        finally:
+            ADMISSION.release()
         
-        return jsonify({
+        response = jsonify({
             'success': True,
             'result': result
         })
+        g.timer.lap('serialize')
+        return response
         
+    except RequestEntityTooLarge:
+        return jsonify({
+            'success': False,
+            'error': f'Request body cannot be larger than {DEFAULT_MAX_BODY_SIZE} bytes'
+        }), 413
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/generate/batch', methods=['POST'])
+def generate_objectives_batch():
+    """API endpoint to generate learning objectives for a JSON array of goals"""
+    try:
+        request.get_data(cache=True)
+        g.timer.lap('read')
+        # Decoded one goal at a time, stopping as soon as the batch is too large
+        try:
+            goals = parse_goal_batch(request.get_data(as_text=True))
+        except BatchTooLargeError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 413
+        except ValueError:
+            return jsonify({
+                'success': False,
+                'error': 'Invalid JSON data'
+            }), 400
+        g.timer.lap('parse')
+        
+        if goals is None:
+            return jsonify({
+                'success': False,
+                'error': 'Request body must be a JSON array of goals'
+            }), 400
+        
+        if not ADMISSION.acquire():
+            return _overloaded_response()
+        try:
+            results = get_generator().generate_learning_objectives_batch(goals, g.timer)
+        finally:
+            ADMISSION.release()
+        
+        response = jsonify({
+            'success': True,
+            'results': results
+        })
+        g.timer.lap('serialize')
+        return response
+        
+    except RequestEntityTooLarge:
+        return jsonify({
+            'success': False,
+            'error': f'Request body cannot be larger than {DEFAULT_MAX_BODY_SIZE} bytes'
+        }), 413
     except Exception as e:
         return jsonify({
             'success': False,
@@ -340,7 +487,18 @@ def generate_objectives():
 @app.route('/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({'status': 'healthy'})
+    generator = get_generator()
+    return jsonify({
+        'status': 'healthy',
+        'cache': generator.cache.stats(),
+        'persistent_cache': generator.persistent_cache.stats() if generator.persistent_cache else None,
+        'admission': ADMISSION.stats()
+    })
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus metrics endpoint"""
+    return Response(METRICS.render(), content_type=PROMETHEUS_CONTENT_TYPE)
 
 # For deployment (Vercel, Heroku, etc.)
 application = app
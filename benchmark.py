@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the Learning Objectives Generator
+Times each generation stage on a fixed goal corpus and compares the results
+with a stored baseline so slowdowns show up in review.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+# Add the current directory to Python path to import our generator
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from learning_objectives_generator import LearningObjectivesGenerator
+
+DEFAULT_OUTPUT = "benchmark_results.json"
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+DEFAULT_TOLERANCE = 0.3  # allowed fractional slowdown of the mean call time
+
+# Shortest timed pass; sub-microsecond stages repeat their calls until a pass
+# takes this long, so timer resolution and overhead stay out of the mean
+MIN_PASS_NS = 200_000
+
+# Runs whose per-stage median becomes a saved baseline, and how many times a
+# stage that looks slower is measured again before it counts as a regression
+BASELINE_RUNS = 3
+RECHECKS = 2
+
+# Short goals, one or two clauses
+SHORT_GOALS = [
+    "learn python",
+    "know the tools",
+    "understand fractions",
+    "students will summarize the main ideas",
+    "learners will explain photosynthesis",
+    "Students will list the bones of the hand",
+]
+
+# Goals aimed at each Bloom's level, in level order
+LEVEL_GOALS = [
+    "Students will recall the dates of major world wars",
+    "Learners will describe the water cycle and its stages",
+    "The goal is for learners to know the supplies needed for each emergency procedure",
+    "Learners will analyze data to identify trends and patterns",
+    "Students will evaluate research methods used in clinical trials",
+    "Students will design a user interface for a mobile application",
+    "Students will create a marketing plan for a new product",
+]
+
+# Long, paragraph-style goals as exported from course catalogues
+PARAGRAPH_GOALS = [
+    "The goal is for students to be able to critically examine primary and secondary historical "
+    "sources from the industrial revolution, compare the perspectives of workers and factory owners, "
+    "and explain how these perspectives shaped the labour reforms that followed in the late nineteenth "
+    "century across several European countries.",
+    "Learners will develop a working understanding of statistical inference, including sampling "
+    "distributions, confidence intervals and hypothesis testing, and will apply these methods to real "
+    "public health data sets in order to judge whether observed differences between groups are likely "
+    "to reflect genuine effects rather than random variation.",
+    "Students will plan, organize and carry out a small field investigation of a local freshwater "
+    "ecosystem, collecting and tabulating measurements of water quality, identifying the organisms "
+    "present, and producing a written report that recommends practical conservation measures to the "
+    "community council.",
+]
+
+CORPUS = {
+    'short': SHORT_GOALS,
+    'levels': LEVEL_GOALS,
+    'paragraph': PARAGRAPH_GOALS,
+}
+
+def build_stages(generator: LearningObjectivesGenerator, goals: List[str]) -> Dict[str, List[Callable[[], object]]]:
+    """Build one zero-argument call per goal for every stage being measured"""
+    analyses = [generator.analyze_goal(goal) for goal in goals]
+
+    stages = {
+        'identify_bloom_level': [],
+        'analyze_goal': [],
+        'generate_objective_text': [],
+        'generate_supporting_objectives': [],
+        '_extract_key_concepts': [],
+        '_format_objectives': [],
+        'generate_learning_objectives_uncached': [],
+    }
+    for goal, analysis in zip(goals, analyses):
+        level = analysis.target_level
+        main_objective = generator.generate_objective_text(goal, level, analysis=analysis)
+        supporting = generator.generate_supporting_objectives(main_objective, level, goal, analysis=analysis)
+
+        stages['identify_bloom_level'].append(lambda goal=goal: generator.identify_bloom_level(goal))
+        stages['analyze_goal'].append(lambda goal=goal: generator.analyze_goal(goal))
+        stages['generate_objective_text'].append(
+            lambda goal=goal, level=level, analysis=analysis:
+                generator.generate_objective_text(goal, level, analysis=analysis))
+        stages['generate_supporting_objectives'].append(
+            lambda goal=goal, level=level, analysis=analysis, main=main_objective:
+                generator.generate_supporting_objectives(main, level, goal, analysis=analysis))
+        stages['_extract_key_concepts'].append(
+            lambda cleaned=analysis.cleaned_goal: generator._extract_key_concepts(cleaned))
+        stages['_format_objectives'].append(
+            lambda main=main_objective, supporting=supporting: generator._format_objectives(main, supporting))
+        stages['generate_learning_objectives_uncached'].append(
+            lambda goal=goal: generator._generate_learning_objectives(goal))
+
+    return stages
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Return the value at the given fraction of an ascending list"""
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def _repeat_count(calls: List[Callable[[], object]], clock) -> int:
+    """How many times to repeat the calls so one timed pass takes at least MIN_PASS_NS"""
+    start = clock()
+    for call in calls:
+        call()
+    return max(1, MIN_PASS_NS // max(1, clock() - start))
+
+def _timed_pass(calls: List[Callable[[], object]], repeat: int, clock) -> float:
+    """Mean nanoseconds per call over one pass of the calls, repeated"""
+    start = clock()
+    for _ in range(repeat):
+        for call in calls:
+            call()
+    return (clock() - start) / (len(calls) * repeat)
+
+def measure(calls: List[Callable[[], object]], rounds: int, warmup: int,
+            reference: Callable[[], object] = None) -> Dict[str, float]:
+    """Time the calls in batches for throughput and one by one for latency percentiles
+
+    With a reference call, a pass of it follows every timed pass, and
+    'relative' is the median ratio of the two; a machine slowing down part
+    way through a run slows both, so the ratio stays put.
+    """
+    for _ in range(warmup):
+        for call in calls:
+            call()
+        if reference is not None:
+            reference()
+
+    clock = time.perf_counter_ns
+    repeat = _repeat_count(calls, clock)
+    reference_calls = [reference] if reference is not None else []
+    reference_repeat = _repeat_count(reference_calls, clock) if reference_calls else 0
+
+    # Whole passes over the calls: the timer cost is spread over the batch
+    pass_means = []
+    reference_means = []
+    ratios = []
+    for _ in range(rounds):
+        pass_means.append(_timed_pass(calls, repeat, clock))
+        if reference_calls:
+            reference_means.append(_timed_pass(reference_calls, reference_repeat, clock))
+            ratios.append(pass_means[-1] / reference_means[-1])
+    pass_means.sort()
+    mean_ns = pass_means[len(pass_means) // 2]
+
+    # Individual calls, for the latency distribution
+    samples = []
+    for _ in range(rounds):
+        for call in calls:
+            start = clock()
+            call()
+            samples.append(clock() - start)
+    samples.sort()
+
+    stats = {
+        'calls': len(samples),
+        'ops_per_sec': round(1e9 / mean_ns, 1) if mean_ns else 0.0,
+        'mean_us': round(mean_ns / 1000, 3),
+        'p50_us': round(percentile(samples, 0.50) / 1000, 3),
+        'p90_us': round(percentile(samples, 0.90) / 1000, 3),
+        'p99_us': round(percentile(samples, 0.99) / 1000, 3),
+        'max_us': round(samples[-1] / 1000, 3),
+    }
+    if ratios:
+        ratios.sort()
+        reference_means.sort()
+        stats['relative'] = round(ratios[len(ratios) // 2], 6)
+        stats['calibration_us'] = round(reference_means[len(reference_means) // 2] / 1000, 3)
+    return stats
+
+def _calibration_workload() -> str:
+    """Fixed pure-Python work used to gauge the speed of the current machine"""
+    words = []
+    for i in range(200):
+        words.append(str(i).lower())
+    return " ".join(words).upper()
+
+def run_benchmarks(rounds: int, warmup: int, only: Optional[Iterable[str]] = None) -> Dict[str, any]:
+    """Benchmark every stage on every corpus group, or just the named benchmarks"""
+    generator = LearningObjectivesGenerator(cache_size=0)
+    only = set(only) if only is not None else None
+    results = {}
+    for group, goals in CORPUS.items():
+        for stage, calls in build_stages(generator, goals).items():
+            name = f"{stage}[{group}]"
+            if only is None or name in only:
+                # Calibrated next to every stage so drift during the run averages out
+                results[name] = measure(calls, rounds, warmup, reference=_calibration_workload)
+    calibrations = sorted(stats['calibration_us'] for stats in results.values())
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'rounds': rounds,
+        'calibration_us': calibrations[len(calibrations) // 2],
+        'results': results,
+    }
+
+def median_report(reports: List[Dict[str, any]]) -> Dict[str, any]:
+    """Combine several runs, keeping each benchmark's run with the median relative time"""
+    combined = dict(reports[len(reports) // 2], results={})
+    for name in reports[0]['results']:
+        runs = sorted((report['results'][name] for report in reports), key=lambda stats: stats['relative'])
+        combined['results'][name] = runs[len(runs) // 2]
+    return combined
+
+def _change(stats: Dict[str, float], base: Dict[str, float], speed_ratio: float) -> float:
+    if 'relative' in stats and 'relative' in base:
+        return stats['relative'] / base['relative'] - 1
+    return stats['mean_us'] / (base['mean_us'] * speed_ratio) - 1
+
+def regressed(current: Dict[str, any], baseline: Dict[str, any], tolerance: float) -> Dict[str, float]:
+    """Return the fractional slowdown of every benchmark slower than the baseline allows
+    
+    Each time is taken relative to the calibration loop measured beside it,
+    or for older baselines divided by the run's calibration time, so a
+    baseline recorded on a faster or less loaded machine can still be compared.
+    """
+    speed_ratio = current['calibration_us'] / baseline['calibration_us']
+    changes = {}
+    for name, stats in current['results'].items():
+        base = baseline.get('results', {}).get(name)
+        if not base or not base.get('mean_us'):
+            continue
+        change = _change(stats, base, speed_ratio)
+        if change > tolerance:
+            changes[name] = change
+    return changes
+
+def compare(current: Dict[str, any], baseline: Dict[str, any], tolerance: float) -> List[str]:
+    """Return a description of every benchmark whose mean call time regressed"""
+    return [f"{name}: mean {baseline['results'][name]['mean_us']}us -> "
+            f"{current['results'][name]['mean_us']}us (+{change:.0%})"
+            for name, change in regressed(current, baseline, tolerance).items()]
+
+def recheck(report: Dict[str, any], baseline: Dict[str, any], tolerance: float,
+            rounds: int, warmup: int) -> None:
+    """Measure apparently slower benchmarks again, keeping their fastest run
+
+    A noisy neighbour can slow a single stage for a moment; a real
+    regression stays slow every time.
+    """
+    for _ in range(RECHECKS):
+        names = regressed(report, baseline, tolerance)
+        if not names:
+            return
+        again = run_benchmarks(rounds, warmup, only=names)
+        for name, stats in again['results'].items():
+            if stats['relative'] < report['results'][name]['relative']:
+                report['results'][name] = stats
+
+def print_report(report: Dict[str, any]) -> None:
+    """Print the results as a table"""
+    print(f"{'benchmark':<52} {'ops/sec':>12} {'p50 us':>9} {'p90 us':>9} {'p99 us':>9}")
+    print("-" * 95)
+    for name, stats in report['results'].items():
+        print(f"{name:<52} {stats['ops_per_sec']:>12,.0f} {stats['p50_us']:>9.2f} "
+              f"{stats['p90_us']:>9.2f} {stats['p99_us']:>9.2f}")
+
+def main(argv=None):
+    """Run the benchmarks, save the results and compare them with the baseline"""
+    parser = argparse.ArgumentParser(
+        description="Benchmark each stage of learning objective generation"
+    )
+    parser.add_argument("--rounds", type=int, default=200, help="Timed passes over the corpus (default: 200)")
+    parser.add_argument("--warmup", type=int, default=20, help="Untimed passes before measuring (default: 20)")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT,
+                        help=f"Where to write the results as JSON (default: {DEFAULT_OUTPUT})")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="Baseline results to compare against (default: benchmark_baseline.json)")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"Allowed slowdown before failing, as a fraction (default: {DEFAULT_TOLERANCE})")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Store these results as the new baseline instead of comparing")
+    args = parser.parse_args(argv)
+
+    if args.save_baseline:
+        report = median_report([run_benchmarks(args.rounds, args.warmup) for _ in range(BASELINE_RUNS)])
+        baseline = None
+    elif os.path.exists(args.baseline):
+        report = run_benchmarks(args.rounds, args.warmup)
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        recheck(report, baseline, args.tolerance, args.rounds, args.warmup)
+    else:
+        report = run_benchmarks(args.rounds, args.warmup)
+        baseline = None
+    print_report(report)
+    print(f"\nCalibration loop: {report['calibration_us']:.2f} us")
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline} (median of {BASELINE_RUNS} runs)")
+        return 0
+
+    if baseline is None:
+        print("No baseline found; run with --save-baseline to create one")
+        return 0
+
+    regressions = compare(report, baseline, args.tolerance)
+    if regressions:
+        print(f"\nSlower than baseline by more than {args.tolerance:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+
+    print(f"\nNo benchmark is more than {args.tolerance:.0%} slower than the baseline")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Warm daemon for the Learning Objectives Generator command line
+Keeps a generator running behind a Unix domain socket so repeated single-goal
+invocations skip building it. learning_objectives_cli.py imports this module
+before the generator, so it must stay cheap to import.
+"""
+
+import os
+import stat
+import sys
+
+def _default_socket_path() -> str:
+    directory = os.environ.get('XDG_RUNTIME_DIR')
+    if not directory:
+        # A directory of our own: anyone can create a socket directly in /tmp
+        uid = os.getuid() if hasattr(os, 'getuid') else 'user'
+        directory = os.path.join(os.environ.get('TMPDIR') or '/tmp', f"learning-objectives-{uid}")
+    return os.path.join(directory, "learning-objectives.sock")
+
+# Where the daemon listens and the command line looks for it
+DEFAULT_SOCKET_PATH = os.environ.get('LEARNING_OBJECTIVES_SOCKET') or _default_socket_path()
+
+# Longest goal the daemon accepts, in bytes
+MAX_GOAL_BYTES = 1024 * 1024
+
+# Longest reply the client accepts; the goal appears in several objectives
+MAX_REPLY_BYTES = 16 * MAX_GOAL_BYTES
+
+# Seconds the client waits for the daemon before doing the work itself
+CLIENT_TIMEOUT = 10.0
+
+def read_all(connection, limit: int) -> bytes:
+    """Read from a socket until the peer stops sending, refusing more than limit bytes"""
+    chunks = []
+    size = 0
+    while True:
+        chunk = connection.recv(65536)
+        if not chunk:
+            return b''.join(chunks)
+        size += len(chunk)
+        if size > limit:
+            raise ValueError(f"Message larger than {limit} bytes")
+        chunks.append(chunk)
+
+def check_private(path: str) -> None:
+    """Raise PermissionError unless path belongs to the current user and no one else can write to it"""
+    info = os.lstat(path)
+    if info.st_uid != os.getuid():
+        raise PermissionError(f"{path} is owned by another user")
+    if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(f"{path} is writable by other users")
+
+def check_socket(socket_path: str) -> None:
+    """Raise OSError unless socket_path is a socket the current user created in a private directory
+
+    Otherwise another user could plant a socket there and answer in the daemon's place.
+    """
+    check_private(os.path.dirname(os.path.abspath(socket_path)))
+    check_private(socket_path)
+    if not stat.S_ISSOCK(os.lstat(socket_path).st_mode):
+        raise PermissionError(f"{socket_path} is not a socket")
+
+def serve_daemon(handle_goal, socket_path: str = DEFAULT_SOCKET_PATH) -> int:
+    """Answer single-goal requests on a Unix domain socket until interrupted
+
+    handle_goal(goal) returns the exact text the command line would print.
+    """
+    import signal
+    import socket
+    import socketserver
+
+    class GoalHandler(socketserver.BaseRequestHandler):
+        def handle(self):
+            self.request.settimeout(CLIENT_TIMEOUT)
+            try:
+                goal = read_all(self.request, MAX_GOAL_BYTES).decode('utf-8', 'surrogateescape')
+                self.request.sendall(handle_goal(goal).encode('utf-8', 'surrogateescape'))
+            except (OSError, ValueError):
+                pass  # the client falls back to generating in-process
+
+    class DaemonServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+    directory = os.path.dirname(os.path.abspath(socket_path))
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        check_private(directory)
+    except OSError as e:
+        print(f"Error: cannot use {directory} for the daemon socket: {e}", file=sys.stderr)
+        return 1
+
+    if os.path.lexists(socket_path):
+        # Refuse to replace a daemon that is still answering; remove a stale socket
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(socket_path)
+            except OSError:
+                try:
+                    os.unlink(socket_path)
+                except OSError as e:
+                    print(f"Error: cannot remove the stale socket {socket_path}: {e}", file=sys.stderr)
+                    return 1
+            else:
+                print(f"Error: a daemon is already listening on {socket_path}", file=sys.stderr)
+                return 1
+
+    # Only the current user may connect
+    old_umask = os.umask(0o177)
+    try:
+        server = DaemonServer(socket_path, GoalHandler)
+    except OSError as e:
+        print(f"Error: cannot listen on {socket_path}: {e}", file=sys.stderr)
+        return 1
+    finally:
+        os.umask(old_umask)
+
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    print(f"Daemon listening on {socket_path}", file=sys.stderr)
+    try:
+        with server:
+            server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        try:
+            os.unlink(socket_path)
+        except FileNotFoundError:
+            pass
+    return 0
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Cold start measurement for the Learning Objectives Generator WSGI apps
+Starts a fresh interpreter per run, imports wsgi.py or the Flask app, and
+times the import and the first /api/generate response, as a serverless
+platform would on a cold start.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Deployment targets: name -> module exposing a WSGI callable named application
+TARGETS = {
+    'wsgi': 'wsgi',
+    'flask': 'app',
+}
+
+# Runs inside each fresh interpreter and prints its timings as JSON
+CHILD_SCRIPT = '''
+import time
+started = time.perf_counter()
+import io, json, sys
+sys.path.insert(0, {project_dir!r})
+import {module} as target
+imported = time.perf_counter()
+
+body = json.dumps({{"goal": "Students will explain the causes of the French Revolution"}}).encode("utf-8")
+environ = {{
+    "REQUEST_METHOD": "POST", "PATH_INFO": "/api/generate", "SCRIPT_NAME": "", "QUERY_STRING": "",
+    "SERVER_NAME": "localhost", "SERVER_PORT": "80", "SERVER_PROTOCOL": "HTTP/1.1",
+    "CONTENT_TYPE": "application/json", "CONTENT_LENGTH": str(len(body)),
+    "wsgi.version": (1, 0), "wsgi.url_scheme": "http", "wsgi.input": io.BytesIO(body),
+    "wsgi.errors": sys.stderr, "wsgi.multithread": False, "wsgi.multiprocess": False,
+    "wsgi.run_once": True,
+}}
+status = []
+response = b"".join(target.application(environ, lambda line, headers, exc_info=None: status.append(line)))
+responded = time.perf_counter()
+
+print(json.dumps({{
+    "status": status[0],
+    "import_ms": (imported - started) * 1000,
+    "first_response_ms": (responded - imported) * 1000,
+    "total_ms": (responded - started) * 1000,
+}}))
+'''
+
+def measure_run(module: str) -> Dict[str, float]:
+    """Time one cold start of a module in a new interpreter"""
+    script = CHILD_SCRIPT.format(project_dir=PROJECT_DIR, module=module)
+    started = time.perf_counter()
+    completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True,
+                               cwd=PROJECT_DIR)
+    wall_ms = (time.perf_counter() - started) * 1000
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr.strip()
+                           else f"exit status {completed.returncode}")
+    timings = json.loads(completed.stdout.strip().splitlines()[-1])
+    timings['process_ms'] = wall_ms
+    return timings
+
+def measure_target(module: str, runs: int) -> Optional[Dict[str, float]]:
+    """Median timings over several cold starts, or None if the module cannot be imported"""
+    results = []
+    for _ in range(runs):
+        try:
+            results.append(measure_run(module))
+        except RuntimeError as e:
+            print(f"  {module}: {e}")
+            return None
+
+    statuses = {result['status'] for result in results}
+    summary = {'status': ", ".join(sorted(statuses)), 'runs': runs}
+    for key in ('import_ms', 'first_response_ms', 'total_ms', 'process_ms'):
+        summary[key] = round(statistics.median(result[key] for result in results), 2)
+    return summary
+
+def print_report(report: Dict[str, Optional[Dict[str, float]]]) -> None:
+    """Print the median timings of each target as a table"""
+    print(f"{'target':<8} {'import ms':>10} {'first resp ms':>14} {'total ms':>9} {'process ms':>11}  status")
+    print("-" * 70)
+    for name, summary in report.items():
+        if summary is None:
+            print(f"{name:<8} {'not available':>10}")
+            continue
+        print(f"{name:<8} {summary['import_ms']:>10.1f} {summary['first_response_ms']:>14.1f} "
+              f"{summary['total_ms']:>9.1f} {summary['process_ms']:>11.1f}  {summary['status']}")
+
+def main(argv=None):
+    """Measure cold starts of each deployment target"""
+    parser = argparse.ArgumentParser(
+        description="Compare import-to-first-response time of the WSGI and Flask entry points"
+    )
+    parser.add_argument("-n", "--runs", type=int, default=10,
+                        help="Cold starts per target; the median is reported (default: 10)")
+    parser.add_argument("--target", choices=sorted(TARGETS), action="append",
+                        help="Target to measure; repeat for several (default: all)")
+    parser.add_argument("--json", metavar="PATH", help="Also write the report as JSON to PATH")
+    args = parser.parse_args(argv)
+
+    report = {}
+    for name in args.target or TARGETS:
+        report[name] = measure_target(TARGETS[name], args.runs)
+
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.json}")
+    return 0 if any(report.values()) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
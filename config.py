@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Environment configuration for the Learning Objectives Generator
+Reads numeric settings from environment variables, failing with a message
+that names the variable when a value is malformed or out of range, and
+holds the settings every server shares.
+"""
+
+import os
+
+class ConfigError(ValueError):
+    """An environment variable whose value cannot be used"""
+
+def _env_number(name: str, default, minimum, convert, kind: str):
+    value = os.environ.get(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        number = convert(value)
+    except ValueError:
+        raise ConfigError(f"{name} must be {kind}, got {value!r}") from None
+    if minimum is not None and number < minimum:
+        raise ConfigError(f"{name} must be at least {minimum}, got {value!r}")
+    return number
+
+def env_int(name: str, default: int, minimum: int = 0) -> int:
+    """Read an integer setting, or return default when the variable is unset"""
+    return _env_number(name, default, minimum, int, "an integer")
+
+def env_float(name: str, default: float, minimum: float = 0.0) -> float:
+    """Read a number setting, or return default when the variable is unset"""
+    return _env_number(name, default, minimum, float, "a number")
+
+# Largest request body accepted, in bytes; bigger requests get 413 before the body is read
+DEFAULT_MAX_BODY_SIZE = env_int('LEARNING_OBJECTIVES_MAX_BODY_SIZE', 1024 * 1024, minimum=1)
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+Background batch jobs for the Learning Objectives Generator web server
+Goal lists too large for one request are spooled to disk, processed by a
+small pool of worker threads, and their results written to disk as JSON
+lines with an offset index, so progress and result pages can be read by any
+server process while a job runs and memory use does not grow with job size.
+"""
+
+import json
+import os
+import queue
+import re
+import shutil
+import stat
+import struct
+import tempfile
+import threading
+import time
+import uuid
+from typing import Dict, Iterable, List, Tuple
+
+from config import env_float, env_int
+from learning_objectives_generator import get_generator, generate_record, MAX_BATCH_SIZE
+from prefork import process_exists
+
+DEFAULT_JOBS_DIR = os.environ.get('LEARNING_OBJECTIVES_JOBS_DIR') or os.path.join(
+    tempfile.gettempdir(), f"learning-objectives-jobs-{os.getuid() if hasattr(os, 'getuid') else 'user'}"
+)
+DEFAULT_JOB_WORKERS = 1
+DEFAULT_MAX_QUEUED_JOBS = 16
+DEFAULT_MAX_UPLOAD_SIZE = env_int('LEARNING_OBJECTIVES_MAX_UPLOAD_SIZE', 64 * 1024 * 1024, minimum=1)
+
+# Seconds finished jobs are kept on disk before the next submission removes them
+DEFAULT_JOB_RETENTION = env_float('LEARNING_OBJECTIVES_JOB_RETENTION', 24 * 3600)
+
+# Records between flushing results, saving progress and checking for cancellation
+CHECKPOINT_EVERY = 256
+
+# Result page size when the client does not ask for one, and the largest allowed
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = MAX_BATCH_SIZE
+
+QUEUED, RUNNING, COMPLETED, FAILED, CANCELLED = 'queued', 'running', 'completed', 'failed', 'cancelled'
+FINISHED_STATES = frozenset([COMPLETED, FAILED, CANCELLED])
+
+JOB_ID_PATTERN = re.compile(r"[0-9a-f]{32}")
+
+STOPPED_ERROR = "Server stopped before the job finished"
+
+# Byte offset of each record in results.jsonl
+OFFSET = struct.Struct('<Q')
+
+class JobError(Exception):
+    """A job request that cannot be served, with the status code to answer it with"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+def _write_json(path: str, data: Dict) -> None:
+    """Replace a JSON file atomically, so readers never see half of it"""
+    temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temporary, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(temporary, path)
+
+def _is_goal_line(line: bytes) -> bool:
+    """Whether generate_record() turns the line into a record rather than skipping it as blank"""
+    # \n never occurs inside a UTF-8 sequence, so lines split as bytes decode as they will in _run()
+    return bool(line.strip()) and bool(line.decode('utf-8', errors='replace').strip())
+
+def check_private_dir(path: str) -> None:
+    """Raise PermissionError unless path is a directory of the current user that no one else can write to
+
+    Otherwise another user could create the shared default directory first and
+    read the goals, or plant results, of every job.
+    """
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode):
+        raise PermissionError(f"{path} is not a directory")
+    if hasattr(os, 'getuid') and info.st_uid != os.getuid():
+        raise PermissionError(f"{path} is owned by another user")
+    if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(f"{path} is writable by other users")
+
+class JobManager:
+    """Queue, run and report on batch jobs spooled under one directory
+
+    Each job is a directory holding its input goals (input.txt, one goal per
+    line in any format generate_record accepts), status.json, results.jsonl
+    and results.idx. Jobs run on worker threads of the process that accepted
+    them; everything else reads the files, so with prefork workers any
+    process can report progress, serve results or cancel a job.
+    """
+
+    def __init__(self, directory: str = DEFAULT_JOBS_DIR, workers: int = DEFAULT_JOB_WORKERS,
+                 max_queued: int = DEFAULT_MAX_QUEUED_JOBS, retention: float = DEFAULT_JOB_RETENTION):
+        self.directory = directory
+        self.workers = workers
+        self.max_queued = max_queued
+        self.retention = retention
+        self._lock = threading.Lock()
+        self._queue = None
+        self._threads = []
+        self._stopping = threading.Event()
+        self._deadline = 0.0
+        self._pid = None
+        self._running = 0
+        self._last_cleanup = 0.0
+        self._checked_directory = None
+
+    def _check_directory(self) -> None:
+        """Check the jobs directory once per path, answering 404 while it does not exist"""
+        if self._checked_directory == self.directory:
+            return
+        try:
+            check_private_dir(self.directory)
+        except FileNotFoundError:
+            raise JobError(404, "Job not found")
+        except PermissionError as e:
+            raise JobError(500, f"Refusing to use the jobs directory: {e}")
+        self._checked_directory = self.directory
+
+    def _job_dir(self, job_id: str) -> str:
+        if not JOB_ID_PATTERN.fullmatch(job_id):
+            raise JobError(404, "Job not found")
+        self._check_directory()
+        return os.path.join(self.directory, job_id)
+
+    def _ensure_workers(self) -> queue.Queue:
+        """Start the worker threads on first use in this process (threads do not survive fork)"""
+        with self._lock:
+            if self._stopping.is_set() and self._pid == os.getpid():
+                raise JobError(503, "The server is shutting down")
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._running = 0
+                self._stopping = threading.Event()
+                self._queue = queue.Queue(maxsize=self.max_queued)
+                # Daemon threads, so a stuck job cannot hold the process open; shutdown() drains them
+                self._threads = [threading.Thread(target=self._work, args=(self._queue, self._stopping), daemon=True,
+                                                  name=f"job-worker-{index}") for index in range(self.workers)]
+                for thread in self._threads:
+                    thread.start()
+            return self._queue
+
+    def _create(self) -> Tuple[str, str]:
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        self._check_directory()
+        self.cleanup()
+        job_id = uuid.uuid4().hex
+        job_dir = os.path.join(self.directory, job_id)
+        os.mkdir(job_dir, mode=0o700)
+        return job_id, job_dir
+
+    def _enqueue(self, job_id: str, job_dir: str, total: int) -> Dict[str, any]:
+        if total == 0:
+            shutil.rmtree(job_dir, ignore_errors=True)
+            raise JobError(400, "No goals provided")
+
+        jobs = self._ensure_workers()
+        status = {
+            'id': job_id,
+            'state': QUEUED,
+            'total': total,
+            'processed': 0,
+            'errors': 0,
+            'pid': os.getpid(),
+            'created_at': time.time(),
+            'started_at': None,
+            'finished_at': None
+        }
+        _write_json(os.path.join(job_dir, 'status.json'), status)
+        try:
+            jobs.put_nowait(job_id)
+        except queue.Full:
+            shutil.rmtree(job_dir, ignore_errors=True)
+            raise JobError(503, f"{self.max_queued} jobs are already waiting; try again later")
+        return self._public(status)
+
+    def submit_goals(self, goals: List) -> Dict[str, any]:
+        """Queue a job for a list of goals; items that are not strings become error records"""
+        job_id, job_dir = self._create()
+        try:
+            with open(os.path.join(job_dir, 'input.txt'), 'w', encoding='utf-8') as f:
+                for goal in goals:
+                    # One JSON value per line keeps goals containing newlines intact
+                    f.write(json.dumps(goal if isinstance(goal, str) else {'goal': goal}) + "\n")
+        except BaseException:
+            shutil.rmtree(job_dir, ignore_errors=True)
+            raise
+        return self._enqueue(job_id, job_dir, len(goals))
+
+    def submit_upload(self, chunks: Iterable[bytes]) -> Dict[str, any]:
+        """Queue a job for an uploaded goal file, written to disk as it arrives
+
+        Lines end at \n, and blank lines are skipped as in the command line's
+        file mode; total counts the lines with the same test _run() applies.
+        """
+        job_id, job_dir = self._create()
+        total = 0
+        partial = b''
+        try:
+            with open(os.path.join(job_dir, 'input.txt'), 'wb') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    lines = (partial + chunk).split(b'\n')
+                    partial = lines.pop()
+                    total += sum(1 for line in lines if _is_goal_line(line))
+            if _is_goal_line(partial):
+                total += 1
+        except BaseException:
+            shutil.rmtree(job_dir, ignore_errors=True)
+            raise
+        return self._enqueue(job_id, job_dir, total)
+
+    def _read_status(self, job_dir: str) -> Dict[str, any]:
+        try:
+            with open(os.path.join(job_dir, 'status.json'), encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise JobError(404, "Job not found")
+
+    def _available(self, job_dir: str) -> int:
+        """Number of records written and flushed so far"""
+        try:
+            return os.path.getsize(os.path.join(job_dir, 'results.idx')) // OFFSET.size
+        except FileNotFoundError:
+            return 0
+
+    def _public(self, status: Dict[str, any]) -> Dict[str, any]:
+        return {key: value for key, value in status.items() if key != 'pid'}
+
+    def status(self, job_id: str) -> Dict[str, any]:
+        """Return a job's state and progress"""
+        job_dir = self._job_dir(job_id)
+        status = self._read_status(job_dir)
+        if status['state'] not in FINISHED_STATES:
+            status['processed'] = self._available(job_dir)
+            if os.path.exists(os.path.join(job_dir, 'cancel')):
+                status['state'] = 'cancelling'
+            elif status['pid'] != os.getpid() and not process_exists(status['pid']):
+                # The server process running the job exited before finishing it
+                status['state'] = FAILED
+                status['error'] = STOPPED_ERROR
+        return self._public(status)
+
+    def results(self, job_id: str, offset: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> Tuple[Dict[str, any], List[bytes]]:
+        """Return a job's status and the raw JSON records of one page of its results"""
+        if offset < 0 or not 0 < limit <= MAX_PAGE_SIZE:
+            raise JobError(400, f"offset must be at least 0 and limit between 1 and {MAX_PAGE_SIZE}")
+
+        status = self.status(job_id)
+        job_dir = self._job_dir(job_id)
+        available = self._available(job_dir)
+        if offset >= available:
+            return status, []
+
+        count = min(limit, available - offset)
+        with open(os.path.join(job_dir, 'results.idx'), 'rb') as f:
+            f.seek(offset * OFFSET.size)
+            index = f.read((count + 1) * OFFSET.size)
+        starts = [OFFSET.unpack_from(index, i * OFFSET.size)[0] for i in range(len(index) // OFFSET.size)]
+
+        with open(os.path.join(job_dir, 'results.jsonl'), 'rb') as f:
+            f.seek(starts[0])
+            if len(starts) > count:
+                data = f.read(starts[count] - starts[0])
+            else:
+                # The page ends at the last record written so far; read just up to its newline
+                data = b''.join(f.readline() for _ in range(count))
+        return status, data.splitlines()[:count]
+
+    def cancel(self, job_id: str) -> Dict[str, any]:
+        """Ask a job to stop; records produced so far stay available"""
+        job_dir = self._job_dir(job_id)
+        status = self._read_status(job_dir)
+        if status['state'] not in FINISHED_STATES:
+            with open(os.path.join(job_dir, 'cancel'), 'w'):
+                pass
+        return self.status(job_id)
+
+    def cleanup(self) -> None:
+        """Remove finished jobs older than the retention period, at most once a minute"""
+        now = time.time()
+        with self._lock:
+            if now - self._last_cleanup < 60:
+                return
+            self._last_cleanup = now
+
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if not JOB_ID_PATTERN.fullmatch(name):
+                continue
+            job_dir = os.path.join(self.directory, name)
+            try:
+                status = self._read_status(job_dir)
+            except (JobError, ValueError, OSError):
+                continue
+            finished_at = status.get('finished_at') or status.get('created_at') or now
+            stale = status['state'] in FINISHED_STATES or not process_exists(status['pid'])
+            if stale and now - finished_at > self.retention:
+                shutil.rmtree(job_dir, ignore_errors=True)
+
+    def stats(self) -> Dict[str, any]:
+        """Return this process's job counters for health reporting"""
+        with self._lock:
+            return {
+                'workers': self.workers,
+                'running': self._running,
+                'queued': self._queue.qsize() if self._queue is not None and self._pid == os.getpid() else 0,
+                'max_queued': self.max_queued
+            }
+
+    def shutdown(self, timeout: float) -> None:
+        """Stop this process's job workers, giving queued and running jobs up to timeout seconds to finish
+
+        Jobs still going at the deadline stop at their next checkpoint and
+        fail, keeping the results produced so far; jobs not started by then fail.
+        """
+        with self._lock:
+            if self._pid != os.getpid() or self._stopping.is_set():
+                return
+            self._deadline = time.monotonic() + timeout
+            self._stopping.set()
+            jobs, threads = self._queue, self._threads
+
+        for _ in threads:
+            try:
+                # Behind the queued jobs, so each worker ends once the queue is drained
+                jobs.put(None, timeout=max(0.0, self._deadline - time.monotonic()) + 1.0)
+            except queue.Full:
+                break
+        for thread in threads:
+            thread.join(max(0.0, self._deadline - time.monotonic()) + 1.0)
+
+        with self._lock:
+            # The next submission starts fresh workers, as when the server is started again;
+            # a worker still stuck in a goal keeps its own stop event and quits at its next checkpoint
+            self._pid = None
+
+    def _out_of_time(self, stopping: threading.Event) -> bool:
+        return stopping.is_set() and time.monotonic() >= self._deadline
+
+    def _fail(self, job_id: str, error: str) -> None:
+        try:
+            status = self._read_status(os.path.join(self.directory, job_id))
+            status.update(state=FAILED, error=error, finished_at=time.time())
+            _write_json(os.path.join(self.directory, job_id, 'status.json'), status)
+        except (JobError, OSError, ValueError):
+            pass  # the job directory was removed while it ran
+
+    def _work(self, jobs: queue.Queue, stopping: threading.Event) -> None:
+        while True:
+            job_id = jobs.get()
+            if job_id is None:
+                return
+            if self._out_of_time(stopping):
+                self._fail(job_id, STOPPED_ERROR)
+                continue
+            with self._lock:
+                self._running += 1
+            try:
+                self._run(job_id, stopping)
+            except Exception as e:
+                self._fail(job_id, str(e))
+            finally:
+                with self._lock:
+                    self._running -= 1
+
+    def _run(self, job_id: str, stopping: threading.Event) -> None:
+        """Generate every goal of a job, appending records and their offsets as they finish"""
+        job_dir = os.path.join(self.directory, job_id)
+        status_path = os.path.join(job_dir, 'status.json')
+        cancel_path = os.path.join(job_dir, 'cancel')
+        status = self._read_status(job_dir)
+
+        if os.path.exists(cancel_path):
+            status.update(state=CANCELLED, finished_at=time.time())
+            _write_json(status_path, status)
+            return
+
+        status.update(state=RUNNING, started_at=time.time())
+        _write_json(status_path, status)
+
+        generator = get_generator()
+        position = processed = errors = 0
+        # Files close in reverse order: results before index, so readers never index past the data
+        # Lines end at \n only, as submit_upload() counted them
+        with open(os.path.join(job_dir, 'input.txt'), encoding='utf-8', errors='replace', newline='\n') as lines, \
+             open(os.path.join(job_dir, 'results.idx'), 'wb') as index, \
+             open(os.path.join(job_dir, 'results.jsonl'), 'wb') as results:
+            for line_number, line in enumerate(lines, 1):
+                record = generate_record(generator, line_number, line)
+                if record is None:
+                    continue
+                data = (json.dumps(record) + "\n").encode('utf-8')
+                results.write(data)
+                index.write(OFFSET.pack(position))
+                position += len(data)
+                processed += 1
+                if not record['success']:
+                    errors += 1
+
+                if processed % CHECKPOINT_EVERY == 0:
+                    # Results before their offsets, so readers never index past the data;
+                    # a checkpoint's offsets fit in the index's buffer, so it never flushes early
+                    results.flush()
+                    index.flush()
+                    status.update(processed=processed, errors=errors)
+                    _write_json(status_path, status)
+                    if os.path.exists(cancel_path):
+                        status.update(state=CANCELLED, finished_at=time.time())
+                        _write_json(status_path, status)
+                        return
+                    if self._out_of_time(stopping):
+                        status.update(state=FAILED, error=STOPPED_ERROR, finished_at=time.time())
+                        _write_json(status_path, status)
+                        return
+
+        status.update(state=COMPLETED, processed=processed, errors=errors, finished_at=time.time())
+        _write_json(status_path, status)
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Fast command line launcher for the Learning Objectives Generator
+Hands a single goal to a running --daemon before importing the generator, and
+otherwise runs learning_objectives_generator.py's command line as usual.
+"""
+
+import sys
+
+# The C module underneath socket; importing socket itself (with enum and
+# selectors) would double the time this launcher takes to answer
+import _socket
+
+from cli_daemon import DEFAULT_SOCKET_PATH, CLIENT_TIMEOUT, MAX_REPLY_BYTES, check_socket, read_all
+
+def run_client(argv: list, socket_path: str = DEFAULT_SOCKET_PATH):
+    """Send a single-goal invocation to the daemon and print its reply
+
+    Returns the exit status, or None when the arguments are not a single goal
+    or no trusted daemon answered, in which case the caller does the work itself.
+    """
+    if len(argv) != 1 or not argv[0] or argv[0].startswith('-') or not hasattr(_socket, 'AF_UNIX'):
+        return None
+
+    try:
+        check_socket(socket_path)
+    except OSError:
+        return None
+
+    connection = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+    try:
+        connection.settimeout(CLIENT_TIMEOUT)
+        connection.connect(socket_path)
+        connection.sendall(argv[0].encode('utf-8', 'surrogateescape'))
+        connection.shutdown(_socket.SHUT_WR)
+        reply = read_all(connection, MAX_REPLY_BYTES)
+    except (OSError, ValueError):
+        return None
+    finally:
+        connection.close()
+
+    # An empty reply means the daemon failed; nothing has been printed yet
+    if not reply:
+        return None
+    sys.stdout.buffer.write(reply)
+    sys.stdout.flush()
+    return 0
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    status = run_client(argv)
+    if status is None:
+        from learning_objectives_generator import main as generator_main
+        status = generator_main(argv)
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,226 +5,500 @@ A program that helps instructional designers write clear and concise learning ob
 aligned to Bloom's Taxonomy levels.
 """
 
+import io
+import os
+import sys
+
+if __name__ == "__main__":
+    # Hand a single goal to a running --daemon before paying for the imports and tables below;
+    # scripts call this file directly, so it cannot rely on learning_objectives_cli.py being used
+    from learning_objectives_cli import run_client
+    _status = run_client(sys.argv[1:])
+    if _status is not None:
+        sys.exit(_status)
+
 import re
+import json
+import hashlib
+import time
+import string
 import argparse
-from typing import List, Dict, Tuple
+import threading
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import List, Dict, Tuple, NamedTuple, Optional, Iterable, Iterator, TextIO
+
+from config import env_int, env_float
+from cli_daemon import DEFAULT_SOCKET_PATH, serve_daemon
+
+WORD_PATTERN = re.compile(r"[a-z]+")
+
+VOWELS = "aeiou"
+
+# Largest number of goals accepted by generate_learning_objectives_batch
+MAX_BATCH_SIZE = 1000
+
+# Number of input lines sent to a worker process at a time by --jobs
+DEFAULT_CHUNK_SIZE = 500
+
+# Result cache defaults, overridable through the environment for the shared generator
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_CACHE_TTL = 3600  # seconds; 0 keeps entries until they are evicted
+
+def _inflections(verb: str) -> List[str]:
+    """Return the base form of a verb with its common inflected forms"""
+    forms = [verb]
+    
+    if verb.endswith('e'):
+        stem = verb[:-1]
+        forms += [verb + 's', verb + 'd', stem + 'ing']
+    elif verb.endswith('y') and len(verb) > 1 and verb[-2] not in VOWELS:
+        stem = verb[:-1]
+        forms += [stem + 'ies', stem + 'ied', verb + 'ing']
+    elif verb.endswith(('s', 'x', 'z', 'ch', 'sh')):
+        forms += [verb + 'es', verb + 'ed', verb + 'ing']
+    elif (3 <= len(verb) <= 4 and verb[-1] not in VOWELS + 'wxy'
+            and verb[-2] in VOWELS and verb[-3] not in VOWELS):
+        # Short consonant-vowel-consonant verbs double the final letter (plan -> planned)
+        forms += [verb + 's', verb + verb[-1] + 'ed', verb + verb[-1] + 'ing']
+    else:
+        forms += [verb + 's', verb + 'ed', verb + 'ing']
+    
+    return forms
 
-class BloomsLevel:
+class BloomsLevel(NamedTuple):
     """Represents a level in Bloom's Taxonomy with associated action verbs"""
     
-    def __init__(self, name: str, level: int, verbs: List[str], description: str):
-        self.name = name
-        self.level = level
-        self.verbs = verbs
-        self.description = description
+    name: str
+    level: int
+    verbs: Tuple[str, ...]
+    description: str
 
-class LearningObjectivesGenerator:
-    """Generates learning objectives from course goals using Bloom's Taxonomy"""
-    
-    def __init__(self):
-        # Define Bloom's Taxonomy levels with action verbs
-        self.blooms_levels = {
-            1: BloomsLevel("remember", 1, [
-                "list", "name", "identify", "show", "label", "collect", "examine", 
-                "tabulate", "quote", "recall", "define", "recognize", "match"
-            ], "Recall facts and basic concepts"),
-            
-            2: BloomsLevel("understand", 2, [
-                "explain", "describe", "interpret", "summarize", "paraphrase", 
-                "classify", "compare", "contrast", "demonstrate", "illustrate"
-            ], "Explain ideas or concepts"),
-            
-            3: BloomsLevel("apply", 3, [
-                "use", "solve", "apply", "construct", "choose", "make", "develop", 
-                "organize", "plan", "select", "utilize", "model", "identify"
-            ], "Use information in new situations"),
-            
-            4: BloomsLevel("analyze", 4, [
-                "analyze", "examine", "compare", "contrast", "investigate", 
-                "categorize", "identify", "separate", "advertise"
-            ], "Draw connections among ideas"),
+# Bloom's Taxonomy levels with action verbs, shared by every generator
+BLOOMS_LEVELS = MappingProxyType({
+    1: BloomsLevel("remember", 1, (
+        "list", "name", "identify", "show", "label", "collect", "examine", 
+        "tabulate", "quote", "recall", "define", "recognize", "match"
+    ), "Recall facts and basic concepts"),
+    
+    2: BloomsLevel("understand", 2, (
+        "explain", "describe", "interpret", "summarize", "paraphrase", 
+        "classify", "compare", "contrast", "demonstrate", "illustrate"
+    ), "Explain ideas or concepts"),
+    
+    3: BloomsLevel("apply", 3, (
+        "use", "solve", "apply", "construct", "choose", "make", "develop", 
+        "organize", "plan", "select", "utilize", "model", "identify"
+    ), "Use information in new situations"),
+    
+    4: BloomsLevel("analyze", 4, (
+        "analyze", "examine", "compare", "contrast", "investigate", 
+        "categorize", "identify", "separate", "advertise"
+    ), "Draw connections among ideas"),
+    
+    5: BloomsLevel("evaluate", 5, (
+        "critique", "defend", "judge", "select", "support", "value", 
+        "evaluate", "prioritize", "recommend"
+    ), "Justify a stand or decision"),
+    
+    6: BloomsLevel("create", 6, (
+        "design", "construct", "create", "develop", "formulate", "author", 
+        "investigate", "compose", "plan", "produce", "generate"
+    ), "Produce new or original work")
+})
+
+# Context clues that suggest a level even when they are not listed as level verbs
+CONTEXT_CLUES = MappingProxyType({
+    6: ("create", "design", "develop", "formulate", "generate"),
+    5: ("evaluate", "assess", "judge", "critique"),
+    4: ("analyze", "compare", "examine", "investigate"),
+    3: ("apply", "use", "implement", "practice", "demonstrate", "layout"),
+    2: ("explain", "describe", "interpret", "understand"),
+})
+
+# Leading phrases removed from a goal before it is turned into objectives
+GOAL_PREFIX_PATTERN = re.compile(
+    r'^(?:the goal is )?'
+    r'(?:for learners to |for students to |students to |learners to |students will |learners will )?'
+    r'(?:know |understand |learn |be able to )?'
+)
+
+# Main objective verb for each level: the first rule whose keywords all
+# appear in the cleaned goal wins, and a rule with no keywords always matches
+MAIN_VERB_RULES = {
+    1: (
+        (("supplies",), "List"),
+        (("steps",), "Identify"),
+        (("procedure",), "Identify"),
+        ((), "Recall"),
+    ),
+    2: (
+        (("purpose",), "Explain"),
+        ((), "Describe"),
+    ),
+    3: (
+        (("supplies",), "Layout"),
+        (("procedure",), "Demonstrate"),
+        ((), "Apply"),
+    ),
+    4: (
+        ((), "Analyze"),
+    ),
+    5: (
+        ((), "Evaluate"),
+    ),
+    6: (
+        (("create",), "Create"),
+        (("design",), "Design"),
+        ((), "Develop"),
+    ),
+}
+
+# Supporting objective templates for each level below the target, matched the
+# same way; {cleaned_goal} and {key_concepts} are filled in from the goal
+SUPPORTING_RULES = {
+    1: (
+        (("supplies",), "List the supplies needed for each emergency procedure"),
+        (("procedure",), "Identify the steps in {cleaned_goal}"),
+        (("design", "interface"), "Recall the principles of user interface design"),
+        (("marketing",), "Identify the components of marketing strategy"),
+        ((), "Recall key concepts of {key_concepts}"),
+    ),
+    2: (
+        (("supplies",), "Explain the purpose of each supply item"),
+        (("procedure",), "Describe the rationale for {cleaned_goal}"),
+        (("design", "interface"), "Explain user experience design principles"),
+        (("marketing",), "Explain marketing principles and strategies"),
+        ((), "Explain the principles of {key_concepts}"),
+    ),
+    3: (
+        (("design", "interface"), "Apply design principles to create interface prototypes"),
+        (("marketing plan",), "Apply marketing concepts to develop campaign strategies"),
+        ((), "Apply knowledge to {cleaned_goal}"),
+    ),
+    4: (
+        (("design", "interface"), "Analyze existing applications for design patterns"),
+        (("marketing plan",), "Analyze market conditions and competitive landscape"),
+        ((), "Analyze different approaches to {cleaned_goal}"),
+    ),
+    5: (
+        (("design", "interface"), "Evaluate the effectiveness of different UI approaches"),
+        (("marketing plan",), "Evaluate the potential success of marketing strategies"),
+        ((), "Evaluate the effectiveness of {cleaned_goal}"),
+    ),
+}
+
+# "know" combined with one of these words suggests application level
+KNOW_WORDS = frozenset(["know", "knows", "knowing"])
+PRACTICAL_WORDS = frozenset(["procedure", "procedures", "supplies", "equipment", "tools"])
+
+def _build_verb_index(blooms_levels, context_clues) -> Dict[str, int]:
+    """Map every verb form to the highest Bloom's level it indicates"""
+    index = {}
+    sources = [(level, bloom_level.verbs) for level, bloom_level in blooms_levels.items()]
+    sources.extend(context_clues.items())
+    
+    for level, verbs in sources:
+        for verb in verbs:
+            for form in _inflections(verb):
+                if index.get(form, 0) < level:
+                    index[form] = level
+    
+    return index
+
+# Precomputed word -> level lookup used by identify_bloom_level
+VERB_INDEX = MappingProxyType(_build_verb_index(BLOOMS_LEVELS, CONTEXT_CLUES))
+
+def _finish_objective(text: str, suffix: str) -> str:
+    """Capitalize an objective, end it with a period and add its level suffix"""
+    text = text.strip().capitalize()
+    if not text.endswith('.'):
+        text += '.'
+    return text + suffix
+
+class ObjectiveTemplate:
+    """A supporting objective template parsed once into literal text and fields"""
+    
+    def __init__(self, template: str, suffix: str):
+        self.segments = tuple(
+            (literal, field) for literal, field, _, _ in string.Formatter().parse(template)
+        )
+        self.suffix = suffix
+        
+        # Templates without fields are rendered completely up front
+        if all(field is None for _, field in self.segments):
+            self.rendered = _finish_objective(template, suffix)
+        else:
+            self.rendered = None
+    
+    def render(self, values: Dict[str, str]) -> str:
+        """Fill in the template from the goal's values"""
+        if self.rendered is not None:
+            return self.rendered
+        
+        parts = []
+        for literal, field in self.segments:
+            parts.append(literal)
+            if field is not None:
+                parts.append(values[field])
+        return _finish_objective("".join(parts), self.suffix)
+
+class ObjectiveRuleEngine:
+    """Chooses main objective verbs and supporting objective templates by keyword
+    
+    The rules that apply depend only on which keywords a goal contains, so the
+    choice for every level is resolved once per keyword combination and reused.
+    Adding rules therefore adds no work for goals whose combination was seen.
+    """
+    
+    def __init__(self, main_verb_rules, supporting_rules, blooms_levels):
+        self.suffixes = {level: f" ({info.name})" for level, info in blooms_levels.items()}
+        self.main_verb_rules = {
+            level: tuple((frozenset(keywords), verb) for keywords, verb in rules)
+            for level, rules in main_verb_rules.items()
+        }
+        self.supporting_rules = {
+            level: tuple(
+                (frozenset(keywords), ObjectiveTemplate(template, self.suffixes[level]))
+                for keywords, template in rules
+            )
+            for level, rules in supporting_rules.items()
+        }
+        
+        # Every keyword any rule depends on, for goal analysis to look for
+        keywords = set()
+        for rules in list(self.main_verb_rules.values()) + list(self.supporting_rules.values()):
+            for required, _ in rules:
+                keywords |= required
+        self.keywords = tuple(sorted(keywords))
+        
+        # keyword set -> (verb per level, template per level)
+        self._selections = {}
+    
+    def _select(self, keywords: frozenset) -> Tuple[Dict[int, str], Dict[int, ObjectiveTemplate]]:
+        """Resolve the rule for every level for one combination of keywords"""
+        selection = self._selections.get(keywords)
+        if selection is None:
+            verbs = {
+                level: next(verb for required, verb in rules if required <= keywords)
+                for level, rules in self.main_verb_rules.items()
+            }
+            templates = {
+                level: next(template for required, template in rules if required <= keywords)
+                for level, rules in self.supporting_rules.items()
+            }
+            selection = (verbs, templates)
+            self._selections[keywords] = selection
+        return selection
+    
+    def main_objective(self, analysis: "GoalAnalysis", level: int) -> str:
+        """Build the main objective for a goal at the given level"""
+        verb = self._select(analysis.keywords)[0][level]
+        cleaned_goal = analysis.cleaned_goal
+        
+        # Avoid a repeated verb (e.g., "Design design...")
+        first_word = cleaned_goal.split(' ', 1)[0]
+        if first_word and first_word.lower() == verb.lower():
+            text = cleaned_goal
+        else:
+            text = f"{verb} {cleaned_goal}"
+        return _finish_objective(text, self.suffixes[level])
+    
+    def supporting_objectives(self, analysis: "GoalAnalysis", target_level: int) -> List[str]:
+        """Build the supporting objectives for every level below the target"""
+        templates = self._select(analysis.keywords)[1]
+        values = {'cleaned_goal': analysis.cleaned_goal, 'key_concepts': analysis.key_concepts}
+        return [templates[level].render(values) for level in range(1, target_level)]
+
+# Compiled rules shared by every generator
+OBJECTIVE_RULES = ObjectiveRuleEngine(MAIN_VERB_RULES, SUPPORTING_RULES, BLOOMS_LEVELS)
+
+# Words and phrases in the cleaned goal that select domain-specific objectives
+GOAL_KEYWORDS = OBJECTIVE_RULES.keywords
+
+# Bump when generation changes in a way the tables below ruleset_version() do not capture
+RULESET_REVISION = 1
+
+def ruleset_version() -> str:
+    """Fingerprint the taxonomy and rule tables, for keying persistent cached results"""
+    tables = {
+        'revision': RULESET_REVISION,
+        'blooms_levels': list(BLOOMS_LEVELS.items()),
+        'context_clues': list(CONTEXT_CLUES.items()),
+        'goal_prefix': GOAL_PREFIX_PATTERN.pattern,
+        'main_verb_rules': list(MAIN_VERB_RULES.items()),
+        'supporting_rules': list(SUPPORTING_RULES.items()),
+        'know_words': sorted(KNOW_WORDS),
+        'practical_words': sorted(PRACTICAL_WORDS),
+    }
+    return hashlib.sha256(json.dumps(tables).encode('utf-8')).hexdigest()[:16]
+
+def normalize_goal(goal: str) -> str:
+    """Lowercase a goal and collapse its whitespace"""
+    return " ".join(goal.lower().split())
+
+class ResultCache:
+    """Thread-safe LRU cache with an optional time-to-live per entry"""
+    
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE, ttl: float = DEFAULT_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key: str):
+        """Return the cached value for key, or None when absent or expired"""
+        if self.max_entries <= 0:
+            return None  # disabled; nothing to count
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
             
-            5: BloomsLevel("evaluate", 5, [
-                "critique", "defend", "judge", "select", "support", "value", 
-                "evaluate", "prioritize", "recommend"
-            ], "Justify a stand or decision"),
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
             
-            6: BloomsLevel("create", 6, [
-                "design", "construct", "create", "develop", "formulate", "author", 
-                "investigate", "compose", "plan", "produce", "generate"
-            ], "Produce new or original work")
-        }
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def put(self, key: str, value) -> None:
+        """Store value under key, evicting the least recently used entries"""
+        if self.max_entries <= 0:
+            return
+        
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self) -> None:
+        """Remove every entry, keeping the counters"""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, any]:
+        """Return the cache counters for health reporting"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+class GoalAnalysis(NamedTuple):
+    """Everything derived from a goal's text, computed once per goal"""
+    
+    goal: str
+    cleaned_goal: str
+    tokens: Tuple[str, ...]
+    keywords: frozenset
+    key_concepts: str
+    target_level: int
+
+class LearningObjectivesGenerator:
+    """Generates learning objectives from course goals using Bloom's Taxonomy
+    
+    Instances hold no per-request state apart from a thread-safe result
+    cache, so one generator can be shared by every thread (see get_generator).
+    """
+    
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE, cache_ttl: float = DEFAULT_CACHE_TTL,
+                 persistent_cache=None, shared_cache=None):
+        # The taxonomy tables are immutable and shared between instances
+        self.blooms_levels = BLOOMS_LEVELS
+        self._verb_index = VERB_INDEX
+        self.rules = OBJECTIVE_RULES
+        
+        # Results keyed on the normalized goal text; a size of 0 disables caching
+        self.cache = ResultCache(cache_size, cache_ttl)
+        
+        # Optional caches behind the in-memory one: a shared_cache.SharedResultCache
+        # for prefork web workers, then a persistent_cache.PersistentCache on disk
+        # that also survives restarts
+        self.shared_cache = shared_cache
+        self.persistent_cache = persistent_cache
+    
+    def analyze_goal(self, goal: str) -> GoalAnalysis:
+        """Normalize and tokenize a goal once for every generation stage"""
+        goal_lower = normalize_goal(goal)
+        tokens = tuple(WORD_PATTERN.findall(goal_lower))
+        
+        # Remove common prefixes and clean up the text
+        cleaned_goal = GOAL_PREFIX_PATTERN.sub('', goal_lower, count=1).strip()
+        keywords = frozenset(keyword for keyword in GOAL_KEYWORDS if keyword in cleaned_goal)
+        
+        return GoalAnalysis(
+            goal=goal,
+            cleaned_goal=cleaned_goal,
+            tokens=tokens,
+            keywords=keywords,
+            key_concepts=self._extract_key_concepts(cleaned_goal),
+            target_level=self._level_from_tokens(tokens)
+        )
     
     def identify_bloom_level(self, goal_text: str) -> int:
         """Identify the highest Bloom's level indicated by the goal text"""
-        goal_lower = goal_text.lower()
+        return self._level_from_tokens(WORD_PATTERN.findall(goal_text.lower()))
+    
+    def _level_from_tokens(self, tokens: Tuple[str, ...]) -> int:
+        """Identify the highest Bloom's level indicated by the goal's words"""
         highest_level = 2  # Default to understand level for better learning progression
         
-        # Look for action verbs in the goal text
-        for level, bloom_level in self.blooms_levels.items():
-            for verb in bloom_level.verbs:
-                if verb in goal_lower:
-                    highest_level = max(highest_level, level)
-        
-        # Look for context clues that suggest higher levels
-        if any(word in goal_lower for word in ["create", "design", "develop", "formulate", "generate"]):
-            highest_level = max(highest_level, 6)
-        elif any(word in goal_lower for word in ["evaluate", "assess", "judge", "critique"]):
-            highest_level = max(highest_level, 5)
-        elif any(word in goal_lower for word in ["analyze", "compare", "examine", "investigate"]):
-            highest_level = max(highest_level, 4)
-        elif any(word in goal_lower for word in ["apply", "use", "implement", "practice", "demonstrate", "layout"]):
-            highest_level = max(highest_level, 3)
-        elif any(word in goal_lower for word in ["explain", "describe", "interpret", "understand"]):
-            highest_level = max(highest_level, 2)
+        # Look up each word in the verb index (action verbs and context clues)
+        verb_index = self._verb_index
+        for token in tokens:
+            level = verb_index.get(token)
+            if level is not None and level > highest_level:
+                highest_level = level
         
         # Special case: "know" with procedures or supplies suggests application level
-        if "know" in goal_lower and any(word in goal_lower for word in ["procedure", "supplies", "equipment", "tools"]):
-            highest_level = max(highest_level, 3)
+        if highest_level < 3:
+            token_set = set(tokens)
+            if token_set & KNOW_WORDS and token_set & PRACTICAL_WORDS:
+                highest_level = 3
         
         # If it's a very simple goal, ensure we have at least understand level
-        if len(goal_lower.split()) <= 3 and highest_level == 1:
+        if len(tokens) <= 3 and highest_level == 1:
             highest_level = 2
         
         return highest_level
     
-    def generate_objective_text(self, goal: str, bloom_level: int, context: str = "") -> str:
+    def generate_objective_text(self, goal: str, bloom_level: int, context: str = "",
+                                analysis: GoalAnalysis = None) -> str:
         """Generate an objective for a specific Bloom's level"""
-        level_info = self.blooms_levels[bloom_level]
-        
-        # Extract the main concept from the goal
-        # Remove common prefixes and clean up the text
-        cleaned_goal = goal.lower().strip()
-        cleaned_goal = re.sub(r'^(the goal is )', '', cleaned_goal)
-        cleaned_goal = re.sub(r'^(for learners to |for students to |students to |learners to |students will |learners will )', '', cleaned_goal)
-        cleaned_goal = re.sub(r'^(know |understand |learn |be able to )', '', cleaned_goal)
-        cleaned_goal = cleaned_goal.strip()
-        
-        # Select an appropriate action verb for this level
-        if bloom_level == 1:  # Remember
-            if "supplies" in cleaned_goal:
-                verb = "List"
-            elif "steps" in cleaned_goal or "procedure" in cleaned_goal:
-                verb = "Identify"
-            else:
-                verb = "Recall"
-        elif bloom_level == 2:  # Understand
-            if "purpose" in cleaned_goal:
-                verb = "Explain"
-            else:
-                verb = "Describe"
-        elif bloom_level == 3:  # Apply
-            if "supplies" in cleaned_goal:
-                verb = "Layout"
-            elif "procedure" in cleaned_goal:
-                verb = "Demonstrate"
-            else:
-                verb = "Apply"
-        elif bloom_level == 4:  # Analyze
-            verb = "Analyze"
-        elif bloom_level == 5:  # Evaluate
-            verb = "Evaluate"
-        else:  # Create
-            if "create" in cleaned_goal:
-                verb = "Create"
-            elif "design" in cleaned_goal:
-                verb = "Design"
-            else:
-                verb = "Develop"
-        
-        # Build the objective text
-        objective = f"{verb} {cleaned_goal}"
-        
-        # Remove duplicate words (e.g., "Design design...")
-        words = objective.split()
-        if len(words) > 1 and words[0].lower() == words[1].lower():
-            objective = " ".join(words[1:])
-        
-        # Clean up and capitalize
-        objective = objective.strip().capitalize()
-        if not objective.endswith('.'):
-            objective += '.'
-        
-        # Add Bloom's level in parentheses
-        objective += f" ({level_info.name})"
-        
-        return objective
+        # Reuse the caller's analysis of the goal when one is available
+        if analysis is None:
+            analysis = self.analyze_goal(goal)
+        return self.rules.main_objective(analysis, bloom_level)
     
-    def generate_supporting_objectives(self, main_objective: str, target_level: int, original_goal: str) -> List[str]:
+    def generate_supporting_objectives(self, main_objective: str, target_level: int, original_goal: str,
+                                       analysis: GoalAnalysis = None) -> List[str]:
         """Generate supporting objectives for levels below the target level"""
-        objectives = []
-        
-        # Extract the core concept from the original goal
-        cleaned_goal = original_goal.lower().strip()
-        cleaned_goal = re.sub(r'^(the goal is )', '', cleaned_goal)
-        cleaned_goal = re.sub(r'^(for learners to |for students to |students to |learners to |students will |learners will )', '', cleaned_goal)
-        cleaned_goal = re.sub(r'^(know |understand |learn |be able to )', '', cleaned_goal)
-        cleaned_goal = cleaned_goal.strip()
-        
-        # Generate objectives for each level below the target
-        for level in range(1, target_level):
-            level_info = self.blooms_levels[level]
-            
-            if level == 1:  # Remember
-                if "supplies" in cleaned_goal:
-                    obj = f"List the supplies needed for each emergency procedure"
-                elif "procedure" in cleaned_goal:
-                    obj = f"Identify the steps in {cleaned_goal}"
-                elif "design" in cleaned_goal and "interface" in cleaned_goal:
-                    obj = f"Recall the principles of user interface design"
-                elif "marketing" in cleaned_goal:
-                    obj = f"Identify the components of marketing strategy"
-                else:
-                    # Extract key noun phrases for better objectives
-                    key_concepts = self._extract_key_concepts(cleaned_goal)
-                    obj = f"Recall key concepts of {key_concepts}"
-            
-            elif level == 2:  # Understand
-                if "supplies" in cleaned_goal:
-                    obj = f"Explain the purpose of each supply item"
-                elif "procedure" in cleaned_goal:
-                    obj = f"Describe the rationale for {cleaned_goal}"
-                elif "design" in cleaned_goal and "interface" in cleaned_goal:
-                    obj = f"Explain user experience design principles"
-                elif "marketing" in cleaned_goal:
-                    obj = f"Explain marketing principles and strategies"
-                else:
-                    key_concepts = self._extract_key_concepts(cleaned_goal)
-                    obj = f"Explain the principles of {key_concepts}"
-            
-            elif level == 3:  # Apply
-                if "design" in cleaned_goal and "interface" in cleaned_goal:
-                    obj = f"Apply design principles to create interface prototypes"
-                elif "marketing plan" in cleaned_goal:
-                    obj = f"Apply marketing concepts to develop campaign strategies"
-                else:
-                    obj = f"Apply knowledge to {cleaned_goal}"
-            
-            elif level == 4:  # Analyze
-                if "design" in cleaned_goal and "interface" in cleaned_goal:
-                    obj = f"Analyze existing applications for design patterns"
-                elif "marketing plan" in cleaned_goal:
-                    obj = f"Analyze market conditions and competitive landscape"
-                else:
-                    obj = f"Analyze different approaches to {cleaned_goal}"
-            
-            elif level == 5:  # Evaluate
-                if "design" in cleaned_goal and "interface" in cleaned_goal:
-                    obj = f"Evaluate the effectiveness of different UI approaches"
-                elif "marketing plan" in cleaned_goal:
-                    obj = f"Evaluate the potential success of marketing strategies"
-                else:
-                    obj = f"Evaluate the effectiveness of {cleaned_goal}"
-            
-            # Clean up and format
-            obj = obj.strip().capitalize()
-            if not obj.endswith('.'):
-                obj += '.'
-            obj += f" ({level_info.name})"
-            
-            objectives.append(obj)
-        
-        return objectives
+        # Reuse the caller's analysis of the goal when one is available
+        if analysis is None:
+            analysis = self.analyze_goal(original_goal)
+        return self.rules.supporting_objectives(analysis, target_level)
     
     def _extract_key_concepts(self, cleaned_goal: str) -> str:
         """Extract key concepts from a cleaned goal for better objective generation"""
@@ -246,17 +520,71 @@ class LearningObjectivesGenerator:
         
         return " ".join(filtered_words) if filtered_words else cleaned_goal
     
-    def generate_learning_objectives(self, goal: str) -> Dict[str, any]:
-        """Generate a complete set of learning objectives from a course goal"""
+    def generate_learning_objectives(self, goal: str, timer=None) -> Dict[str, any]:
+        """Generate a complete set of learning objectives from a course goal
         
-        # Identify the highest appropriate Bloom's level
-        target_level = self.identify_bloom_level(goal)
+        timer, when given, is a metrics.StageTimer whose lap() is called as
+        each stage finishes.
+        """
+        key = normalize_goal(goal)
+        result = self.cache.get(key)
+        if result is None:
+            result = self._lookup_shared_caches(key)
+            if result is not None:
+                self.cache.put(key, result)
+        if timer is not None:
+            timer.lap('cache_lookup')
+        if result is None:
+            result = self._generate_learning_objectives(goal, timer)
+            self.cache.put(key, result)
+            for cache in (self.shared_cache, self.persistent_cache):
+                if cache is not None:
+                    cache.put(key, result)
+        
+        # Callers get their own copy carrying the goal exactly as they sent it
+        result = dict(result)
+        result['goal'] = goal
+        result['supporting_objectives'] = list(result['supporting_objectives'])
+        return result
+    
+    def _lookup_shared_caches(self, key: str) -> Optional[Dict[str, any]]:
+        """Look a key up in the caches shared between processes, filling the nearer ones on a hit"""
+        missed = []
+        for cache in (self.shared_cache, self.persistent_cache):
+            if cache is None:
+                continue
+            result = cache.get(key)
+            if result is not None:
+                for nearer in missed:
+                    nearer.put(key, result)
+                return result
+            missed.append(cache)
+        return None
+    
+    def _generate_learning_objectives(self, goal: str, timer=None) -> Dict[str, any]:
+        """Generate learning objectives without consulting the result cache"""
+        
+        # Normalize the goal and identify the highest appropriate Bloom's level
+        analysis = self.analyze_goal(goal)
+        target_level = analysis.target_level
+        if timer is not None:
+            timer.lap('analyze_goal')
         
         # Generate the main objective at the target level
-        main_objective = self.generate_objective_text(goal, target_level)
+        main_objective = self.generate_objective_text(goal, target_level, analysis=analysis)
+        if timer is not None:
+            timer.lap('main_objective')
         
         # Generate supporting objectives for lower levels
-        supporting_objectives = self.generate_supporting_objectives(main_objective, target_level, goal)
+        supporting_objectives = self.generate_supporting_objectives(
+            main_objective, target_level, goal, analysis=analysis
+        )
+        if timer is not None:
+            timer.lap('supporting_objectives')
+        
+        formatted_output = self._format_objectives(main_objective, supporting_objectives)
+        if timer is not None:
+            timer.lap('format')
         
         return {
             'goal': goal,
@@ -264,9 +592,38 @@ class LearningObjectivesGenerator:
             'target_level_name': self.blooms_levels[target_level].name,
             'main_objective': main_objective,
             'supporting_objectives': supporting_objectives,
-            'formatted_output': self._format_objectives(main_objective, supporting_objectives)
+            'formatted_output': formatted_output
         }
     
+    def generate_learning_objectives_batch(self, goals: List[str], timer=None) -> List[Dict[str, any]]:
+        """Generate learning objectives for many goals, keeping input order
+        
+        Each item is either {'success': True, 'result': ...} or
+        {'success': False, 'error': ...}, so one bad goal does not fail the batch.
+        """
+        if len(goals) > MAX_BATCH_SIZE:
+            raise ValueError(f"Batch contains {len(goals)} goals; the maximum is {MAX_BATCH_SIZE}")
+        
+        results = []
+        for goal in goals:
+            if not isinstance(goal, str):
+                results.append({'success': False, 'error': 'Goal must be a string'})
+                continue
+            
+            goal = goal.strip()
+            if not goal:
+                results.append({'success': False, 'error': 'Goal cannot be empty'})
+                continue
+            
+            if timer is not None:
+                timer.restart()  # the previous goal's bookkeeping is not part of this one's stages
+            try:
+                results.append({'success': True, 'result': self.generate_learning_objectives(goal, timer)})
+            except Exception as e:
+                results.append({'success': False, 'error': str(e)})
+        
+        return results
+    
     def _format_objectives(self, main_objective: str, supporting_objectives: List[str]) -> str:
         """Format objectives in the hierarchical numbering system"""
         output = []
@@ -283,7 +640,230 @@ class LearningObjectivesGenerator:
         
         return "\n".join(output)
 
-def main():
+_shared_generator = None
+_shared_generator_lock = threading.Lock()
+
+class BatchTooLargeError(ValueError):
+    """A batch with more goals than MAX_BATCH_SIZE"""
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+def parse_goal_batch(text: str, max_goals: int = MAX_BATCH_SIZE) -> Optional[list]:
+    """Decode a JSON array of goals one item at a time
+    
+    Stops with BatchTooLargeError as soon as more than max_goals items have
+    been decoded, instead of building the whole list first. Returns None for
+    valid JSON that is not an array; raises json.JSONDecodeError for invalid JSON.
+    """
+    skip = _JSON_WHITESPACE.match
+    index = skip(text, 0).end()
+    if not text.startswith('[', index):
+        json.loads(text)
+        return None
+    
+    goals = []
+    index = skip(text, index + 1).end()
+    if text.startswith(']', index):
+        index += 1
+    else:
+        while True:
+            goal, index = _JSON_DECODER.raw_decode(text, index)
+            goals.append(goal)
+            if len(goals) > max_goals:
+                raise BatchTooLargeError(f"Batch cannot contain more than {max_goals} goals")
+            index = skip(text, index).end()
+            if text.startswith(']', index):
+                index += 1
+                break
+            if not text.startswith(',', index):
+                raise json.JSONDecodeError("Expecting ',' delimiter", text, index)
+            index = skip(text, index + 1).end()
+    
+    if skip(text, index).end() != len(text):
+        raise json.JSONDecodeError("Extra data", text, index)
+    return goals
+
+def get_generator(persistent_cache_path: Optional[str] = None) -> LearningObjectivesGenerator:
+    """Return the process-wide generator, creating it on first use
+    
+    persistent_cache_path, when given, is used instead of
+    $LEARNING_OBJECTIVES_PERSISTENT_CACHE by the call that creates it.
+    """
+    global _shared_generator
+    if _shared_generator is None:
+        with _shared_generator_lock:
+            if _shared_generator is None:
+                persistent_cache = None
+                path = persistent_cache_path or os.environ.get('LEARNING_OBJECTIVES_PERSISTENT_CACHE')
+                if path:
+                    # Imported only when configured; sqlite3 would slow every start
+                    from persistent_cache import PersistentCache, DEFAULT_PERSISTENT_CACHE_SIZE
+                    persistent_cache = PersistentCache(path, ruleset_version(), env_int(
+                        'LEARNING_OBJECTIVES_PERSISTENT_CACHE_SIZE', DEFAULT_PERSISTENT_CACHE_SIZE))
+                _shared_generator = LearningObjectivesGenerator(
+                    cache_size=env_int('LEARNING_OBJECTIVES_CACHE_SIZE', DEFAULT_CACHE_SIZE),
+                    cache_ttl=env_float('LEARNING_OBJECTIVES_CACHE_TTL', DEFAULT_CACHE_TTL),
+                    persistent_cache=persistent_cache
+                )
+    return _shared_generator
+
+def single_goal_output(generator: LearningObjectivesGenerator, goal: str) -> str:
+    """Return the text single goal mode prints for a goal"""
+    try:
+        return generator.generate_learning_objectives(goal)['formatted_output'] + "\n"
+    except Exception as e:
+        return f"Error: {e}\n"
+
+def parse_goal_line(line: str) -> str:
+    """Extract the goal from one input line
+    
+    A line is either plain goal text, a JSON string, or a JSON object with a
+    "goal" key. A line that merely starts like JSON (such as a goal opening
+    with a quoted word) is plain text. Raises ValueError when the line cannot
+    be used.
+    """
+    text = line.strip()
+    if text[:1] in ('{', '"'):
+        try:
+            value = json.loads(text)
+        except json.JSONDecodeError:
+            value = text
+        if isinstance(value, dict):
+            value = value.get('goal')
+        if not isinstance(value, str):
+            raise ValueError("Goal must be a string")
+        text = value.strip()
+    
+    if not text:
+        raise ValueError("Goal cannot be empty")
+    return text
+
+def generate_record(generator: LearningObjectivesGenerator, line_number: int, line: str) -> Optional[Dict[str, any]]:
+    """Turn one input line into an output record, or None for a blank line"""
+    if not line.strip():
+        return None
+    
+    try:
+        goal = parse_goal_line(line)
+        return {'line': line_number, 'success': True, 'result': generator.generate_learning_objectives(goal)}
+    except Exception as e:
+        return {'line': line_number, 'success': False, 'error': str(e)}
+
+def format_record(record: Dict[str, any], output_format: str) -> str:
+    """Render a record as a JSON line or as formatted objectives"""
+    if output_format == 'json':
+        return json.dumps(record) + "\n"
+    if record['success']:
+        return record['result']['formatted_output'] + "\n\n"
+    return f"Line {record['line']}: Error: {record['error']}\n\n"
+
+def stream_objectives(generator: LearningObjectivesGenerator, lines: Iterable[str], output: TextIO,
+                      output_format: str = 'json') -> Tuple[int, int]:
+    """Generate objectives for each input line, writing every record as it is produced
+    
+    Lines are read one at a time, so memory use does not grow with the input.
+    Returns the number of goals processed and how many of them failed.
+    """
+    processed = errors = 0
+    for line_number, line in enumerate(lines, 1):
+        record = generate_record(generator, line_number, line)
+        if record is None:
+            continue
+        processed += 1
+        if not record['success']:
+            errors += 1
+        output.write(format_record(record, output_format))
+    
+    output.flush()
+    return processed, errors
+
+def _warm_worker(persistent_cache_path: Optional[str] = None) -> None:
+    """Build the worker process's generator before any chunk arrives"""
+    get_generator(persistent_cache_path)
+
+def _process_chunk(chunk: List[Tuple[int, str]], output_format: str) -> Tuple[str, int, int]:
+    """Generate and format the records for one chunk of numbered lines in a worker"""
+    generator = get_generator()
+    parts = []
+    processed = errors = 0
+    for line_number, line in chunk:
+        record = generate_record(generator, line_number, line)
+        if record is None:
+            continue
+        processed += 1
+        if not record['success']:
+            errors += 1
+        parts.append(format_record(record, output_format))
+    
+    # Write the chunk's new results in one transaction
+    if generator.persistent_cache is not None:
+        generator.persistent_cache.flush()
+    return "".join(parts), processed, errors
+
+def _iter_chunks(lines: Iterable[str], chunk_size: int) -> Iterator[List[Tuple[int, str]]]:
+    """Group input lines into lists of (line number, line) pairs"""
+    chunk = []
+    for line_number, line in enumerate(lines, 1):
+        chunk.append((line_number, line))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def stream_objectives_parallel(lines: Iterable[str], output: TextIO, output_format: str = 'json',
+                               jobs: int = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                               persistent_cache_path: Optional[str] = None) -> Tuple[int, int]:
+    """Like stream_objectives, but spread chunks of lines over a pool of processes
+    
+    Each worker keeps one warm generator, using the persistent cache at
+    persistent_cache_path when one is given. Results are written in input
+    order, and only a few chunks per worker are in flight, so memory stays bounded.
+    """
+    # Imported here because multiprocessing is slow to import and most runs never need it
+    from concurrent.futures import ProcessPoolExecutor
+    
+    jobs = jobs or os.cpu_count() or 1
+    processed = errors = 0
+    pending = deque()
+    
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_warm_worker,
+                             initargs=(persistent_cache_path,)) as executor:
+        for chunk in _iter_chunks(lines, chunk_size):
+            pending.append(executor.submit(_process_chunk, chunk, output_format))
+            
+            # Write finished chunks in order once enough work is queued
+            while len(pending) >= jobs * 2:
+                text, chunk_processed, chunk_errors = pending.popleft().result()
+                output.write(text)
+                processed += chunk_processed
+                errors += chunk_errors
+        
+        while pending:
+            text, chunk_processed, chunk_errors = pending.popleft().result()
+            output.write(text)
+            processed += chunk_processed
+            errors += chunk_errors
+    
+    output.flush()
+    return processed, errors
+
+@contextmanager
+def open_goal_file(path: str) -> Iterator[TextIO]:
+    """Open a goal file for line-by-line reading; "-" means standard input"""
+    if path == '-':
+        lines = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8', errors='replace')
+        try:
+            yield lines
+        finally:
+            # Leave standard input open for the caller
+            lines.detach()
+    else:
+        with open(path, encoding='utf-8', errors='replace') as lines:
+            yield lines
+
+def main(argv=None):
     """Main function to run the learning objectives generator"""
     parser = argparse.ArgumentParser(
         description="Generate learning objectives from course goals using Bloom's Taxonomy"
@@ -298,11 +878,97 @@ def main():
         action="store_true", 
         help="Run in interactive mode"
     )
+    parser.add_argument(
+        "-f", "--file",
+        metavar="PATH",
+        help="Read one goal per line from PATH ('-' for standard input) and stream the results"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["json", "text"],
+        default="json",
+        help="Output format for --file: one JSON record per line, or formatted objectives (default: json)"
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Worker processes for --file; 0 uses every CPU core (default: 1)"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        metavar="LINES",
+        help=f"Lines sent to a worker process at a time with --jobs (default: {DEFAULT_CHUNK_SIZE})"
+    )
+    parser.add_argument(
+        "--cache-db",
+        metavar="PATH",
+        default=os.environ.get('LEARNING_OBJECTIVES_PERSISTENT_CACHE'),
+        help="Keep results in an SQLite file shared across runs and processes "
+             "(default: $LEARNING_OBJECTIVES_PERSISTENT_CACHE)"
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep a warm generator answering single-goal invocations on a Unix socket"
+    )
+    parser.add_argument(
+        "--socket",
+        default=DEFAULT_SOCKET_PATH,
+        metavar="PATH",
+        help=f"Socket for --daemon; clients use $LEARNING_OBJECTIVES_SOCKET (default: {DEFAULT_SOCKET_PATH})"
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const='',
+        metavar="DIR",
+        help="Run under cProfile and save a .pstats file in DIR (default: $LEARNING_OBJECTIVES_PROFILE_DIR "
+             "or ./profiles); with --jobs only the parent process is profiled"
+    )
+    
+    args = parser.parse_args(argv)
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 (every core) or a positive number of processes")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+    if args.profile is not None:
+        from profiling import run_profiled
+        status, path = run_profiled(run, args, directory=args.profile or None)
+        print(f"Profile written to {path}", file=sys.stderr)
+        return status
+    return run(args)
+
+def run(args: argparse.Namespace):
+    """Run the mode selected by the parsed command line arguments"""
+    generator = get_generator(args.cache_db)
     
-    args = parser.parse_args()
-    generator = LearningObjectivesGenerator()
+    if args.daemon:
+        return serve_daemon(lambda goal: single_goal_output(generator, goal), args.socket)
     
-    if args.interactive or not args.goal:
+    if args.file:
+        # Streaming batch mode
+        try:
+            with open_goal_file(args.file) as lines:
+                if args.jobs == 1:
+                    processed, errors = stream_objectives(generator, lines, sys.stdout, args.format)
+                else:
+                    processed, errors = stream_objectives_parallel(
+                        lines, sys.stdout, args.format, jobs=args.jobs, chunk_size=args.chunk_size,
+                        persistent_cache_path=args.cache_db
+                    )
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        finally:
+            if generator.persistent_cache is not None:
+                generator.persistent_cache.flush()
+        print(f"Processed {processed} goals ({errors} errors)", file=sys.stderr)
+    
+    elif args.interactive or not args.goal:
         print("Learning Objectives Generator")
         print("=" * 50)
         print("Enter a course goal and I'll generate learning objectives aligned to Bloom's Taxonomy.")
@@ -332,11 +998,7 @@ def main():
     
     else:
         # Single goal mode
-        try:
-            result = generator.generate_learning_objectives(args.goal)
-            print(result['formatted_output'])
-        except Exception as e:
-            print(f"Error: {e}")
+        sys.stdout.write(single_goal_output(generator, args.goal))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Load generator for the Learning Objectives Generator web servers
+Starts simple_web_server.py or the Flask app locally (or targets a running
+server), drives it at a fixed concurrency, and reports throughput, latency
+percentiles, error rate and the server's peak memory.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import resource
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+from typing import Dict, List, Optional, Tuple
+
+# Add the current directory to Python path to import the benchmark corpus
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark import CORPUS
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_MIX = "generate:9,batch:1"
+DEFAULT_BATCH_SIZE = 20
+
+# Request kinds the mix can contain: (method, path)
+REQUEST_KINDS = {
+    'generate': ('POST', '/api/generate'),
+    'batch': ('POST', '/api/generate/batch'),
+    'health': ('GET', '/health'),
+    'page': ('GET', '/'),
+}
+
+def parse_mix(mix: str) -> List[Tuple[str, int]]:
+    """Parse "generate:9,batch:1" into [(kind, weight), ...]"""
+    weights = []
+    for part in mix.split(','):
+        kind, _, weight = part.strip().partition(':')
+        if kind not in REQUEST_KINDS:
+            raise ValueError(f"Unknown request kind '{kind}'; choose from {', '.join(REQUEST_KINDS)}")
+        weights.append((kind, int(weight or 1)))
+    return weights
+
+def load_corpus(path: Optional[str]) -> List[str]:
+    """Read goals from a file, one per line, or use the benchmark corpus"""
+    if path:
+        with open(path, encoding='utf-8') as f:
+            goals = [line.strip() for line in f if line.strip()]
+    else:
+        goals = [goal for group in CORPUS.values() for goal in group]
+    if not goals:
+        raise ValueError("The goal corpus is empty")
+    return goals
+
+def free_port() -> int:
+    """Ask the OS for an unused local port"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def start_server(kind: str, port: int, server_args: List[str]) -> subprocess.Popen:
+    """Start a local server process of the given kind"""
+    if kind == 'simple':
+        command = [sys.executable, os.path.join(PROJECT_DIR, 'simple_web_server.py'), '--port', str(port)]
+        command += server_args
+    else:
+        # Run the Flask app without the debug reloader, which would fork a second process
+        command = [sys.executable, '-c',
+                   f"import app; app.app.run(host='127.0.0.1', port={port}, debug=False, threaded=True)"]
+    return subprocess.Popen(command, cwd=PROJECT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def wait_until_ready(host: str, port: int, process: Optional[subprocess.Popen], timeout: float = 15.0) -> None:
+    """Poll /health until the server answers"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"Server exited with status {process.returncode} before it was ready")
+        try:
+            connection = http.client.HTTPConnection(host, port, timeout=1)
+            connection.request('GET', '/health')
+            if connection.getresponse().status == 200:
+                connection.close()
+                return
+        except OSError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"Server on port {port} did not become ready within {timeout} seconds")
+
+def peak_rss_kb(pid: int) -> Optional[int]:
+    """Return a live process's peak resident set size in KiB (Linux only)"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+def descendant_pids(pid: int) -> List[int]:
+    """Return the pids of every live descendant of a process (Linux only)"""
+    children = {}
+    try:
+        entries = os.listdir('/proc')
+    except OSError:
+        return []
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # The command name may contain spaces, so read the fields after its closing parenthesis
+                parent = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(parent, []).append(int(entry))
+
+    descendants = []
+    pending = [pid]
+    while pending:
+        for child in children.get(pending.pop(), ()):
+            descendants.append(child)
+            pending.append(child)
+    return descendants
+
+def server_peak_rss_kb(pid: int) -> Optional[int]:
+    """Sum the peak RSS of a server process and its workers, in KiB (Linux only)
+
+    Each process's peak is counted in full, so pages the workers share with
+    the supervisor are counted once per process and the result is an upper bound.
+    """
+    peaks = [peak_rss_kb(process) for process in [pid] + descendant_pids(pid)]
+    peaks = [peak for peak in peaks if peak is not None]
+    return sum(peaks) if peaks else None
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Return the value at the given fraction of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+class LoadWorker(threading.Thread):
+    """Sends requests over one keep-alive connection until the run ends"""
+
+    def __init__(self, host: str, port: int, plan: List[Tuple[str, bytes]], stop: threading.Event,
+                 remaining: List[int], lock: threading.Lock, timeout: float):
+        super().__init__(daemon=True)
+        self.host = host
+        self.port = port
+        self.plan = plan
+        self.stop = stop
+        self.remaining = remaining
+        self.lock = lock
+        self.timeout = timeout
+        self.latencies = {kind: [] for kind in REQUEST_KINDS}
+        self.errors = {kind: 0 for kind in REQUEST_KINDS}
+        self.statuses = {}
+
+    def _take_request(self) -> bool:
+        """Claim one request from the shared budget, if there is a budget"""
+        if self.remaining[0] < 0:
+            return True
+        with self.lock:
+            if self.remaining[0] == 0:
+                return False
+            self.remaining[0] -= 1
+            return True
+
+    def run(self):
+        connection = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        index = 0
+        while not self.stop.is_set() and self._take_request():
+            kind, body = self.plan[index % len(self.plan)]
+            index += 1
+            method, path = REQUEST_KINDS[kind]
+            headers = {'Content-Type': 'application/json'} if body is not None else {}
+
+            start = time.perf_counter()
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+                response.read()
+                status = response.status
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                status = 'connection error'
+            elapsed = time.perf_counter() - start
+
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            if status == 200 or status == 304:
+                self.latencies[kind].append(elapsed)
+            else:
+                self.errors[kind] += 1
+        connection.close()
+
+def build_plan(mix: List[Tuple[str, int]], goals: List[str], batch_size: int, seed: int,
+               length: int = 1000) -> List[Tuple[str, bytes]]:
+    """Build a repeatable sequence of (kind, body) requests following the mix"""
+    rng = random.Random(seed)
+    kinds = [kind for kind, _ in mix]
+    weights = [weight for _, weight in mix]
+    plan = []
+    for kind in rng.choices(kinds, weights=weights, k=length):
+        if kind == 'generate':
+            body = json.dumps({'goal': rng.choice(goals)}).encode('utf-8')
+        elif kind == 'batch':
+            body = json.dumps([rng.choice(goals) for _ in range(batch_size)]).encode('utf-8')
+        else:
+            body = None
+        plan.append((kind, body))
+    return plan
+
+def run_load(host: str, port: int, plan: List[Tuple[str, bytes]], concurrency: int,
+             duration: float, requests: int, timeout: float) -> Dict[str, any]:
+    """Drive the server with concurrent workers and collect their results"""
+    stop = threading.Event()
+    remaining = [requests if requests else -1]
+    lock = threading.Lock()
+    workers = []
+    for number in range(concurrency):
+        # Each worker starts at a different point of the plan
+        offset = number * len(plan) // concurrency
+        workers.append(LoadWorker(host, port, plan[offset:] + plan[:offset], stop, remaining, lock, timeout))
+
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    if not requests:
+        time.sleep(duration)
+        stop.set()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+
+    latencies = {kind: sorted(sum((w.latencies[kind] for w in workers), [])) for kind in REQUEST_KINDS}
+    errors = {kind: sum(w.errors[kind] for w in workers) for kind in REQUEST_KINDS}
+    statuses = {}
+    for worker in workers:
+        for status, count in worker.statuses.items():
+            statuses[str(status)] = statuses.get(str(status), 0) + count
+
+    all_latencies = sorted(value for values in latencies.values() for value in values)
+    total = len(all_latencies) + sum(errors.values())
+
+    def summarize(values: List[float], failed: int) -> Dict[str, float]:
+        count = len(values) + failed
+        return {
+            'requests': count,
+            'rps': round(count / elapsed, 1) if elapsed else 0.0,
+            'p50_ms': round(percentile(values, 0.50) * 1000, 3),
+            'p95_ms': round(percentile(values, 0.95) * 1000, 3),
+            'p99_ms': round(percentile(values, 0.99) * 1000, 3),
+            'error_rate': round(failed / count, 4) if count else 0.0,
+        }
+
+    return {
+        'elapsed_seconds': round(elapsed, 3),
+        'concurrency': concurrency,
+        'overall': summarize(all_latencies, sum(errors.values())),
+        'by_kind': {kind: summarize(latencies[kind], errors[kind])
+                    for kind in REQUEST_KINDS if latencies[kind] or errors[kind]},
+        'statuses': statuses,
+        'total_requests': total,
+    }
+
+def print_report(report: Dict[str, any]) -> None:
+    """Print the load test results as a table"""
+    print(f"Server: {report['server']}   concurrency: {report['concurrency']}   "
+          f"elapsed: {report['elapsed_seconds']}s")
+    print()
+    print(f"{'requests':<10} {'count':>8} {'rps':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>8}")
+    print("-" * 69)
+    rows = list(report['by_kind'].items()) + [('overall', report['overall'])]
+    for name, stats in rows:
+        print(f"{name:<10} {stats['requests']:>8} {stats['rps']:>10,.1f} {stats['p50_ms']:>9.2f} "
+              f"{stats['p95_ms']:>9.2f} {stats['p99_ms']:>9.2f} {stats['error_rate']:>8.2%}")
+    print()
+    print(f"Status codes: {report['statuses']}")
+    if report.get('server_peak_rss_kb') is not None:
+        print(f"Server peak RSS (all processes): {report['server_peak_rss_kb'] / 1024:.1f} MiB")
+
+def main(argv=None):
+    """Start or target a server, run the load, and report the results"""
+    parser = argparse.ArgumentParser(
+        description="Load test the Learning Objectives Generator web servers"
+    )
+    parser.add_argument("--server", choices=["simple", "flask"], default="simple",
+                        help="Which server to start locally (default: simple)")
+    parser.add_argument("--url", help="Load an already running server instead, e.g. http://localhost:8080")
+    parser.add_argument("-c", "--concurrency", type=int, default=8,
+                        help="Concurrent client connections (default: 8)")
+    parser.add_argument("-d", "--duration", type=float, default=10.0,
+                        help="Seconds to run for (default: 10)")
+    parser.add_argument("-n", "--requests", type=int, default=0,
+                        help="Stop after this many requests instead of after --duration")
+    parser.add_argument("--mix", default=DEFAULT_MIX,
+                        help=f"Weighted request kinds from {', '.join(REQUEST_KINDS)} (default: {DEFAULT_MIX})")
+    parser.add_argument("--corpus", help="File with one goal per line (default: the benchmark corpus)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"Goals per batch request (default: {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds (default: 30)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the request sequence (default: 1)")
+    parser.add_argument("--json", metavar="PATH", help="Also write the report as JSON to PATH")
+    parser.add_argument("server_args", nargs=argparse.REMAINDER,
+                        help="Arguments after -- are passed to simple_web_server.py, e.g. -- --workers 4")
+    args = parser.parse_args(argv)
+
+    server_args = args.server_args[1:] if args.server_args[:1] == ['--'] else args.server_args
+    if server_args and (args.url or args.server != 'simple'):
+        parser.error("arguments after -- are only passed to a locally started --server simple")
+    plan = build_plan(parse_mix(args.mix), load_corpus(args.corpus), args.batch_size, args.seed)
+
+    process = None
+    if args.url:
+        parsed = urllib.parse.urlsplit(args.url)
+        host, port = parsed.hostname, parsed.port or 80
+        server = args.url
+    else:
+        host, port = "127.0.0.1", free_port()
+        process = start_server(args.server, port, server_args)
+        server = f"{args.server} ({' '.join(server_args) or 'default options'})"
+
+    try:
+        wait_until_ready(host, port, process)
+        report = run_load(host, port, plan, args.concurrency, args.duration, args.requests, args.timeout)
+        report['server'] = server
+        report['mix'] = args.mix
+        report['server_peak_rss_kb'] = server_peak_rss_kb(process.pid) if process else None
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    # Fall back to the kernel's record of the finished child where /proc is unavailable
+    if process is not None and report['server_peak_rss_kb'] is None:
+        max_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        report['server_peak_rss_kb'] = max_rss // 1024 if sys.platform == 'darwin' else max_rss
+
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.json}")
+    return 1 if report['overall']['error_rate'] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
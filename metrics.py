@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Metrics for the Learning Objectives Generator web servers
+Thread-safe counters, gauges and fixed-bucket histograms rendered in the
+Prometheus text exposition format.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import List, Tuple
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds in seconds; generation stages take microseconds, whole requests milliseconds
+LATENCY_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5
+)
+
+class StageTimer:
+    """Records how long each stage of one request takes
+
+    Call lap(stage) as each stage finishes; the time since the previous lap is
+    added to that stage, so repeated stages (one per goal in a batch) add up.
+    """
+
+    def __init__(self):
+        self.started = self._last = time.perf_counter()
+        self.durations = {}
+
+    def lap(self, stage: str) -> None:
+        now = time.perf_counter()
+        self.durations[stage] = self.durations.get(stage, 0.0) + (now - self._last)
+        self._last = now
+
+    def restart(self) -> None:
+        """Start the next lap now, leaving the time since the last lap out of every stage"""
+        self._last = time.perf_counter()
+
+    def elapsed(self) -> float:
+        """Seconds since the timer was created"""
+        return time.perf_counter() - self.started
+
+# Order and descriptions of stages in the Server-Timing response header
+SERVER_TIMING_STAGES = (
+    ('read', 'Read request body'),
+    ('parse', 'JSON decode'),
+    ('cache_lookup', 'Result cache lookup'),
+    ('analyze_goal', 'Goal analysis and Bloom level'),
+    ('main_objective', 'Main objective'),
+    ('supporting_objectives', 'Supporting objectives'),
+    ('format', 'Format objectives'),
+    ('serialize', 'JSON encode'),
+)
+
+def server_timing_header(timer: StageTimer) -> str:
+    """Render a timer's stages as a Server-Timing header value, in milliseconds"""
+    durations = timer.durations
+    entries = [
+        f'{stage};desc="{description}";dur={durations[stage] * 1000:.3f}'
+        for stage, description in SERVER_TIMING_STAGES
+        if stage in durations
+    ]
+    entries.append(f'total;dur={timer.elapsed() * 1000:.3f}')
+    return ", ".join(entries)
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class Counter:
+    """A monotonically increasing count per label combination"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def value(self, *label_values: str) -> float:
+        with self._lock:
+            return self._values.get(label_values, 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labels, labels)} {_format_value(value)}"
+                for labels, value in values]
+
+class Gauge(Counter):
+    """A value that can go up and down, such as requests in flight"""
+
+    kind = "gauge"
+
+    def dec(self, *label_values: str, amount: float = 1) -> None:
+        self.inc(*label_values, amount=-amount)
+
+class Histogram:
+    """Observations counted into fixed buckets per label combination"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.buckets = tuple(buckets)
+        self._series = {}  # label values -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+            series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> List[str]:
+        with self._lock:
+            snapshot = sorted((labels, list(series)) for labels, series in self._series.items())
+
+        lines = []
+        for labels, series in snapshot:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), series):
+                cumulative += count
+                le = 'le="+Inf"' if bound == float('inf') else f'le="{bound!r}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labels, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, labels)} {series[-2]!r}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, labels)} {series[-1]}")
+        return lines
+
+class ServerMetrics:
+    """The metrics a web server exposes on /metrics"""
+
+    def __init__(self, endpoints: Tuple[str, ...]):
+        # Only known paths become label values, so unknown URLs cannot grow the series
+        self.endpoints = frozenset(endpoints)
+        self.requests = Counter(
+            "learning_objectives_requests_total",
+            "HTTP requests handled, by endpoint and status code",
+            ("endpoint", "status")
+        )
+        self.in_flight = Gauge(
+            "learning_objectives_requests_in_flight",
+            "HTTP requests currently being handled, by endpoint",
+            ("endpoint",)
+        )
+        self.request_seconds = Histogram(
+            "learning_objectives_request_duration_seconds",
+            "Time to handle an HTTP request, by endpoint",
+            ("endpoint",)
+        )
+        self.stage_seconds = Histogram(
+            "learning_objectives_stage_duration_seconds",
+            "Time spent in each stage of generating objectives, per request",
+            ("stage",)
+        )
+        self._metrics = [self.requests, self.in_flight, self.request_seconds, self.stage_seconds]
+        self._collectors = []
+
+    def add_collector(self, collector) -> None:
+        """Include the Prometheus lines returned by collector() in every render"""
+        self._collectors.append(collector)
+
+    def endpoint_label(self, path: str) -> str:
+        """Return the label used for a request path"""
+        path = path.split('?', 1)[0]
+        return path if path in self.endpoints else "other"
+
+    def request_started(self, endpoint: str) -> None:
+        self.in_flight.inc(endpoint)
+
+    def request_finished(self, endpoint: str, status: int, timer: StageTimer) -> None:
+        """Record a finished request with its status and stage timings"""
+        self.in_flight.dec(endpoint)
+        self.requests.inc(endpoint, str(status))
+        self.request_seconds.observe(timer.elapsed(), endpoint)
+        for stage, seconds in timer.durations.items():
+            self.stage_seconds.observe(seconds, stage)
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format"""
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Persistent result cache for the Learning Objectives Generator
+Stores generated objectives in an SQLite database (WAL mode) so they survive
+restarts and are shared by every process that opens the same file.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+DEFAULT_PERSISTENT_CACHE_SIZE = 100000
+
+# New results are written in one transaction once this many are waiting, or
+# with the next result stored after FLUSH_INTERVAL seconds
+WRITE_BATCH = 256
+FLUSH_INTERVAL = 1.0
+
+# Entries are trimmed back to max_entries after this many writes by one process
+EVICT_EVERY = 1024
+
+# Seconds a writer waits for another process's write to finish
+BUSY_TIMEOUT = 5.0
+
+class PersistentCache:
+    """Size-bounded, multi-process result cache in an SQLite file
+
+    Keys hash the normalized goal together with the ruleset version, so a
+    change to the taxonomy tables makes old entries unreachable; they are
+    the oldest rows and are evicted first. New results wait in memory and are
+    written in batches, so other processes see them after the next flush().
+    The cache is best effort: database errors count as misses instead of
+    failing generation.
+    """
+
+    def __init__(self, path: str, version: str, max_entries: int = DEFAULT_PERSISTENT_CACHE_SIZE):
+        self.path = path
+        self.version = version
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+        
+        # key -> JSON value of results not yet written, and when the last batch was
+        self._pending = {}
+        self._flushed = time.monotonic()
+        atexit.register(self.flush)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening a new one after a fork"""
+        local = self._local
+        if getattr(local, 'pid', None) != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None,
+                                         check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            local.connection = connection
+            local.pid = os.getpid()
+        return local.connection
+
+    def key(self, normalized_goal: str) -> str:
+        """Hash a normalized goal with the ruleset version"""
+        return hashlib.sha256(f"{self.version}\0{normalized_goal}".encode('utf-8')).hexdigest()
+
+    def get(self, normalized_goal: str) -> Optional[Dict[str, any]]:
+        """Return the stored result for a normalized goal, or None"""
+        key = self.key(normalized_goal)
+        with self._lock:
+            value = self._pending.get(key)
+            if value is not None:
+                self.hits += 1
+                return json.loads(value)
+        try:
+            row = self._connection().execute(
+                "SELECT value FROM results WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            with self._lock:
+                self.errors += 1
+                self.misses += 1
+            return None
+
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, normalized_goal: str, result: Dict[str, any]) -> None:
+        """Queue a result to be stored, writing the queue once it is full or old enough"""
+        if self.max_entries <= 0:
+            return
+
+        key = self.key(normalized_goal)
+        value = json.dumps(result)
+        with self._lock:
+            self._pending[key] = value
+            due = (len(self._pending) >= WRITE_BATCH
+                   or time.monotonic() - self._flushed >= FLUSH_INTERVAL)
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write every queued result in one transaction, trimming the oldest entries every EVICT_EVERY writes"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._flushed = time.monotonic()
+            if not pending:
+                return
+            evict = (self.writes + len(pending)) // EVICT_EVERY > self.writes // EVICT_EVERY
+
+        try:
+            connection = self._connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany("INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)",
+                                       pending.items())
+                if evict:
+                    self.evict()
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        except sqlite3.Error:
+            with self._lock:
+                self.errors += 1
+            return
+        with self._lock:
+            self.writes += len(pending)
+
+    def evict(self) -> None:
+        """Delete the oldest rows so at most max_entries remain"""
+        # Rowids only grow and a replaced row gets a new one, so rowid order is
+        # write order and keeping the last max_entries rowids bounds the size
+        self._connection().execute(
+            "DELETE FROM results WHERE rowid <= (SELECT MAX(rowid) FROM results) - ?",
+            (self.max_entries,)
+        )
+
+    def clear(self) -> bool:
+        """Remove every entry, keeping the counters; returns False when the database could not be changed"""
+        with self._lock:
+            self._pending.clear()
+        try:
+            self._connection().execute("DELETE FROM results")
+        except sqlite3.Error:
+            with self._lock:
+                self.errors += 1
+            return False
+        return True
+
+    def stats(self) -> Dict[str, any]:
+        """Return this process's cache counters for health reporting"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'path': self.path,
+                'max_entries': self.max_entries,
+                'writes': self.writes,
+                'pending': len(self._pending),
+                'hits': self.hits,
+                'misses': self.misses,
+                'errors': self.errors,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0
+            }
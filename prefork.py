@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Prefork process supervisor for the Learning Objectives Generator web server
+Runs several copies of the server in forked worker processes, restarts
+workers that die, and drains them all on SIGTERM or Ctrl+C.
+"""
+
+import gc
+import os
+import signal
+import sys
+import time
+from typing import Callable, Dict, List
+
+# Seconds workers get to finish in-flight requests after SIGTERM before being killed
+DEFAULT_GRACEFUL_TIMEOUT = 30.0
+
+# A worker that exits sooner than this after starting counts as failing to start
+MIN_WORKER_UPTIME = 1.0
+RESTART_DELAY = 1.0
+MAX_FAILED_STARTS = 5
+
+def process_exists(pid: int) -> bool:
+    """Whether a process with this pid is still running"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # it exists but belongs to another user
+    return True
+
+def _stop_worker(signum, frame):
+    """Turn the first SIGTERM or SIGINT into KeyboardInterrupt; ignore the rest while draining"""
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    raise KeyboardInterrupt
+
+class PreforkSupervisor:
+    """Fork `processes` workers that each call serve(), and keep them running
+
+    Anything built before run() is shared copy-on-write with the workers, so
+    callers should warm expensive state (such as the generator) first.
+    """
+
+    def __init__(self, serve: Callable[[], None], processes: int,
+                 graceful_timeout: float = DEFAULT_GRACEFUL_TIMEOUT):
+        self.serve = serve
+        self.processes = processes
+        self.graceful_timeout = graceful_timeout
+        self.workers: Dict[int, float] = {}  # pid -> start time
+        self.stopping = False
+        self.failed_starts = 0
+        self._restarts: List[float] = []  # times at which to replace workers that failed to start
+        self._deadline = None
+
+    def run(self) -> int:
+        """Start the workers and supervise them until they have all exited; returns an exit status"""
+        previous_handlers = (signal.signal(signal.SIGTERM, self._handle_stop),
+                             signal.signal(signal.SIGINT, self._handle_stop))
+
+        # Keep the garbage collector from touching (and so copying) objects shared with the workers
+        gc.freeze()
+        try:
+            for _ in range(self.processes):
+                self._spawn()
+            self._supervise()
+        finally:
+            # The caller (such as start.py's menu) may keep running afterwards
+            gc.unfreeze()
+            signal.signal(signal.SIGTERM, previous_handlers[0])
+            signal.signal(signal.SIGINT, previous_handlers[1])
+
+        return 1 if self.failed_starts >= MAX_FAILED_STARTS else 0
+
+    def _supervise(self) -> None:
+        while self.workers or self._restarts:
+            pid, status = os.waitpid(-1, os.WNOHANG) if self.workers else (0, 0)
+            if pid == 0:
+                now = time.monotonic()
+                if self._deadline is not None and now > self._deadline:
+                    self._signal_workers(signal.SIGKILL)
+                    self._deadline = None
+                while self._restarts and self._restarts[0] <= now:
+                    self._restarts.pop(0)
+                    self._spawn()
+                time.sleep(0.1)
+                continue
+            self._reap(pid, status)
+
+    def _spawn(self) -> None:
+        # Anything still buffered would otherwise be written once by every process
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, _stop_worker)
+            signal.signal(signal.SIGINT, _stop_worker)
+            status = 0
+            try:
+                self.serve()
+            except KeyboardInterrupt:
+                pass
+            except BaseException:
+                import traceback
+                traceback.print_exc()
+                status = 1
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(status)
+        self.workers[pid] = time.monotonic()
+
+    def _reap(self, pid: int, status: int) -> None:
+        started = self.workers.pop(pid, None)
+        if started is None or self.stopping:
+            return
+
+        print(f"Worker {pid} exited with status {os.waitstatus_to_exitcode(status)}; restarting")
+        now = time.monotonic()
+        if now - started >= MIN_WORKER_UPTIME:
+            self.failed_starts = 0
+            self._spawn()
+            return
+
+        self.failed_starts += 1
+        if self.failed_starts >= MAX_FAILED_STARTS:
+            print(f"Workers keep failing to start; stopping after {MAX_FAILED_STARTS} attempts")
+            self._stop()
+        else:
+            self._restarts.append(now + RESTART_DELAY)
+
+    def _handle_stop(self, signum, frame):
+        if not self.stopping:
+            print("\nShutting down workers, finishing in-flight requests...")
+            self._stop()
+
+    def _stop(self) -> None:
+        self.stopping = True
+        self._restarts.clear()
+        self._deadline = time.monotonic() + self.graceful_timeout
+        self._signal_workers(signal.SIGTERM)
+
+    def _signal_workers(self, signum: int) -> None:
+        for pid in list(self.workers):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
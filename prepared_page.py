@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Prepared static pages for the Learning Objectives Generator web servers
+Encodes and compresses a page once at startup so each request only has to
+pick the right variant.
+"""
+
+import gzip
+import hashlib
+from typing import Dict, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+# Browsers revalidate the page with If-None-Match once this expires
+DEFAULT_CACHE_CONTROL = "public, max-age=300"
+
+# Preferred order when a client accepts several encodings equally
+ENCODING_PREFERENCE = ("br", "gzip", "identity")
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """Parse an Accept-Encoding header into a mapping of encoding to quality"""
+    accepted = {}
+    if not header:
+        return accepted
+
+    for part in header.split(','):
+        fields = part.strip().split(';')
+        coding = fields[0].strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in fields[1:]:
+            name, _, value = param.strip().partition('=')
+            if name.strip() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+class PreparedPage:
+    """A page held as ready-to-send bytes in every supported content encoding"""
+
+    def __init__(self, html: str, content_type: str = "text/html; charset=utf-8",
+                 cache_control: str = DEFAULT_CACHE_CONTROL):
+        self.content_type = content_type
+        self.cache_control = cache_control
+
+        body = html.encode('utf-8')
+        digest = hashlib.sha256(body).hexdigest()[:20]
+
+        # encoding -> (body, strong ETag); each representation gets its own ETag
+        self.variants = {'identity': (body, f'"{digest}"')}
+        self.variants['gzip'] = (gzip.compress(body, compresslevel=9, mtime=0), f'"{digest}-gzip"')
+        if brotli is not None:
+            self.variants['br'] = (brotli.compress(body, quality=11), f'"{digest}-br"')
+
+    def select(self, accept_encoding: Optional[str]) -> Tuple[str, bytes, str]:
+        """Pick the best variant for an Accept-Encoding header as (encoding, body, etag)"""
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get('*')
+
+        best = 'identity'
+        best_quality = 0.0
+        for encoding in ENCODING_PREFERENCE:
+            if encoding not in self.variants:
+                continue
+            quality = accepted.get(encoding, wildcard)
+            if quality is None and encoding == 'identity':
+                quality = 0.001  # identity is acceptable unless explicitly refused
+            if quality and quality > best_quality:
+                best, best_quality = encoding, quality
+
+        body, etag = self.variants[best]
+        return best, body, etag
+
+    def headers(self, encoding: str, etag: str) -> Dict[str, str]:
+        """Return the caching and content headers for a selected variant"""
+        headers = {
+            'Content-Type': self.content_type,
+            'Cache-Control': self.cache_control,
+            'ETag': etag,
+            'Vary': 'Accept-Encoding',
+        }
+        if encoding != 'identity':
+            headers['Content-Encoding'] = encoding
+        return headers
+
+    @staticmethod
+    def is_not_modified(if_none_match: Optional[str], etag: str) -> bool:
+        """Return True when an If-None-Match header matches the variant's ETag"""
+        if not if_none_match:
+            return False
+        for tag in if_none_match.split(','):
+            tag = tag.strip()
+            if tag.startswith('W/'):
+                tag = tag[2:]  # If-None-Match uses weak comparison
+            if tag == '*' or tag == etag:
+                return True
+        return False
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Opt-in profiling for the Learning Objectives Generator
+Runs a single request or CLI invocation under cProfile and saves the
+statistics as a .pstats file for inspection with pstats or snakeviz.
+"""
+
+import os
+import re
+import time
+import uuid
+from typing import Callable, Optional, Tuple
+
+# Servers only honour the profile request header when this is set
+PROFILING_ENABLED = os.environ.get('LEARNING_OBJECTIVES_PROFILE', '').lower() in ('1', 'true', 'yes')
+
+# Where .pstats files are written
+PROFILE_DIR = os.environ.get('LEARNING_OBJECTIVES_PROFILE_DIR', 'profiles')
+
+# Request header that asks for a profile, and the headers naming it
+PROFILE_HEADER = 'X-Profile'
+REQUEST_ID_HEADER = 'X-Request-ID'
+PROFILE_ID_HEADER = 'X-Profile-Id'
+
+_UNSAFE_ID_CHARS = re.compile(r'[^A-Za-z0-9_.-]')
+
+def wants_profile(headers) -> bool:
+    """Return True when a request's headers ask for it to be profiled"""
+    return (headers.get(PROFILE_HEADER) or '').lower() in ('1', 'true', 'yes')
+
+def request_id_from(headers) -> str:
+    """Use the client's request id when it sent one, otherwise make a new one"""
+    request_id = _UNSAFE_ID_CHARS.sub('', headers.get(REQUEST_ID_HEADER) or '')[:64]
+    return request_id or uuid.uuid4().hex
+
+def run_profiled(func: Callable, *args, request_id: Optional[str] = None,
+                 directory: str = None, **kwargs) -> Tuple[object, str]:
+    """Call func under cProfile and save the profile; returns (result, profile path)"""
+    import cProfile
+
+    directory = directory or PROFILE_DIR
+    request_id = request_id or uuid.uuid4().hex
+    os.makedirs(directory, exist_ok=True)
+    # Request ids can repeat and timestamps only resolve seconds, so add a random suffix
+    path = os.path.join(directory, f"{time.strftime('%Y%m%dT%H%M%S')}-{request_id}-{uuid.uuid4().hex[:8]}.pstats")
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+    return result, path
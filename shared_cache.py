@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Cross-process result cache for the Learning Objectives Generator web server
+Keeps results in a multiprocessing.shared_memory block created before the
+prefork workers are started, so a result generated by one worker is a hit in
+every other. Reads take no lock; writes are serialized by one process-shared
+lock and skipped rather than waited on when it is busy.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import threading
+import time
+import weakref
+from multiprocessing import Lock
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Optional
+
+from config import env_int
+from prefork import process_exists
+
+# Entries and bytes per entry (header included); a size of 0 disables the cache
+DEFAULT_SHARED_CACHE_SIZE = env_int('LEARNING_OBJECTIVES_SHARED_CACHE_SIZE', 4096)
+DEFAULT_SHARED_CACHE_SLOT_SIZE = env_int('LEARNING_OBJECTIVES_SHARED_CACHE_SLOT_SIZE', 2048, minimum=1)
+
+# Slots per hash bucket; a key can only live in its bucket, and the clock hand
+# of the bucket picks which of them to replace
+WAYS = 8
+
+# Processes that can report hit and miss counts at once; a restarted worker
+# takes over the counts of one that has exited
+MAX_PROCESSES = 64
+
+# Seconds a writer waits for the lock before giving up on storing a result
+WRITE_LOCK_TIMEOUT = 0.05
+
+# Seconds before a process that found no free counter slot looks again
+COUNTER_CLAIM_RETRY = 1.0
+
+# Block header: evictions, results too large for a slot, processes without a counter slot
+BLOCK_HEADER = struct.Struct('<QQQ')
+# Per-process counters: pid, hits, misses
+COUNTERS = struct.Struct('<QQQ')
+# Slot header: sequence number (odd while being written), referenced flag, key hash, payload length
+SLOT_HEADER = struct.Struct('<IB3xQI4x')
+SEQUENCE = struct.Struct('<I')
+
+class SharedResultCache:
+    """Fixed-size, hash-indexed result cache in shared memory with clock eviction
+
+    Each slot holds the goal key and the JSON result. Readers check a slot's
+    sequence number before and after copying it and treat a torn read as a
+    miss, so they never wait for a writer. Create the cache in the parent
+    before forking; the workers inherit the mapping and the lock.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_SHARED_CACHE_SIZE,
+                 slot_size: int = DEFAULT_SHARED_CACHE_SLOT_SIZE):
+        if slot_size <= SLOT_HEADER.size:
+            raise ValueError(f"Slot size must be larger than {SLOT_HEADER.size} bytes")
+
+        self.buckets = max(1, -(-max_entries // WAYS))
+        self.max_entries = self.buckets * WAYS
+        self.slot_size = slot_size
+        self._counters_offset = BLOCK_HEADER.size
+        self._hands_offset = self._counters_offset + MAX_PROCESSES * COUNTERS.size
+        self._slots_offset = self._hands_offset + self.buckets
+        self._memory = SharedMemory(create=True, size=self._slots_offset + self.max_entries * slot_size)
+        self._buffer = self._memory.buf  # new shared memory starts zeroed, so every slot is empty
+        self._write_lock = Lock()
+
+        # Counted per process without a lock and published to that process's
+        # counter slot by publish(), never during a lookup
+        self._reset_counts()
+        cache = weakref.ref(self)
+        os.register_at_fork(after_in_child=lambda: cache() and cache()._reset_counts())
+
+    def _reset_counts(self) -> None:
+        self._publish_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._counter_offset = None
+        self._published_base = (0, 0)
+        self._next_claim = 0.0
+        self._uncounted = False
+
+    def _hash(self, key: bytes) -> int:
+        return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'little') or 1
+
+    def _slot_offset(self, bucket: int, way: int) -> int:
+        return self._slots_offset + (bucket * WAYS + way) * self.slot_size
+
+    def publish(self) -> None:
+        """Write this process's hit and miss counts to its counter slot
+
+        Called after requests and by stats(); lookups only bump plain integers.
+        A process that finds no free slot tries again COUNTER_CLAIM_RETRY
+        seconds later and is reported as uncounted until it gets one.
+        """
+        if not self._publish_lock.acquire(blocking=False):
+            return  # another thread of this process is publishing
+        try:
+            if self._counter_offset is None:
+                if time.monotonic() < self._next_claim:
+                    return
+                self._counter_offset = self._claim_counter_slot(os.getpid())
+                if self._counter_offset is None:
+                    self._next_claim = time.monotonic() + COUNTER_CLAIM_RETRY
+                    return
+            base_hits, base_misses = self._published_base
+            COUNTERS.pack_into(self._buffer, self._counter_offset, os.getpid(),
+                               base_hits + self.hits, base_misses + self.misses)
+        finally:
+            self._publish_lock.release()
+
+    def _claim_counter_slot(self, pid: int) -> Optional[int]:
+        if not self._write_lock.acquire(timeout=WRITE_LOCK_TIMEOUT):
+            return None
+        try:
+            evictions, too_large, uncounted = BLOCK_HEADER.unpack_from(self._buffer, 0)
+            for index in range(MAX_PROCESSES):
+                offset = self._counters_offset + index * COUNTERS.size
+                owner, hits, misses = COUNTERS.unpack_from(self._buffer, offset)
+                if owner == 0 or not process_exists(owner):
+                    # Keep the counts of the exited process this one replaces
+                    COUNTERS.pack_into(self._buffer, offset, pid, hits, misses)
+                    self._published_base = (hits, misses)
+                    if self._uncounted:
+                        self._uncounted = False
+                        BLOCK_HEADER.pack_into(self._buffer, 0, evictions, too_large, uncounted - 1)
+                    return offset
+            if not self._uncounted:
+                self._uncounted = True
+                BLOCK_HEADER.pack_into(self._buffer, 0, evictions, too_large, uncounted + 1)
+            return None
+        finally:
+            self._write_lock.release()
+
+    def get(self, key: str):
+        """Return the cached value for key, or None when absent"""
+        encoded = key.encode('utf-8')
+        key_hash = self._hash(encoded)
+        buffer = self._buffer
+        payload_size = self.slot_size - SLOT_HEADER.size
+        for way in range(WAYS):
+            offset = self._slot_offset(key_hash % self.buckets, way)
+            sequence, _, slot_hash, length = SLOT_HEADER.unpack_from(buffer, offset)
+            if slot_hash != key_hash or sequence & 1 or length > payload_size:
+                continue
+            start = offset + SLOT_HEADER.size
+            payload = bytes(buffer[start:start + length])
+            if SEQUENCE.unpack_from(buffer, offset)[0] != sequence:
+                continue  # overwritten while being copied
+            stored_key, _, value = payload.partition(b'\n')
+            if stored_key != encoded:
+                continue
+            buffer[offset + SEQUENCE.size] = 1
+            self.hits += 1
+            return json.loads(value)
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, value) -> None:
+        """Store value under key, replacing an unreferenced entry of its bucket if full"""
+        encoded = key.encode('utf-8')
+        payload = encoded + b'\n' + json.dumps(value).encode('utf-8')
+        oversized = len(payload) > self.slot_size - SLOT_HEADER.size or b'\n' in encoded
+        key_hash = self._hash(encoded)
+        bucket = key_hash % self.buckets
+        if not self._write_lock.acquire(timeout=WRITE_LOCK_TIMEOUT):
+            return  # another worker holds the lock; the cache is best effort
+        try:
+            if oversized:
+                evictions, too_large, uncounted = BLOCK_HEADER.unpack_from(self._buffer, 0)
+                BLOCK_HEADER.pack_into(self._buffer, 0, evictions, too_large + 1, uncounted)
+                return
+            offset = self._choose_slot(bucket, key_hash)
+            sequence = SEQUENCE.unpack_from(self._buffer, offset)[0]
+            SEQUENCE.pack_into(self._buffer, offset, (sequence + 1) & 0xFFFFFFFF)
+            start = offset + SLOT_HEADER.size
+            self._buffer[start:start + len(payload)] = payload
+            SLOT_HEADER.pack_into(self._buffer, offset, (sequence + 2) & 0xFFFFFFFF, 1, key_hash, len(payload))
+        finally:
+            self._write_lock.release()
+
+    def _choose_slot(self, bucket: int, key_hash: int) -> int:
+        """Pick the slot to write in a bucket; call with the write lock held"""
+        empty = None
+        for way in range(WAYS):
+            offset = self._slot_offset(bucket, way)
+            slot_hash = SLOT_HEADER.unpack_from(self._buffer, offset)[2]
+            if slot_hash == key_hash:
+                return offset
+            if slot_hash == 0 and empty is None:
+                empty = offset
+        if empty is not None:
+            return empty
+
+        # Clock: clear referenced flags from the hand until an unreferenced slot turns up
+        hand_offset = self._hands_offset + bucket
+        hand = self._buffer[hand_offset]
+        while True:
+            offset = self._slot_offset(bucket, hand)
+            hand = (hand + 1) % WAYS
+            if self._buffer[offset + SEQUENCE.size]:
+                self._buffer[offset + SEQUENCE.size] = 0
+                continue
+            self._buffer[hand_offset] = hand
+            evictions, too_large, uncounted = BLOCK_HEADER.unpack_from(self._buffer, 0)
+            BLOCK_HEADER.pack_into(self._buffer, 0, evictions + 1, too_large, uncounted)
+            return offset
+
+    def clear(self) -> None:
+        """Remove every entry, keeping the counters"""
+        with self._write_lock:
+            for index in range(self.max_entries):
+                offset = self._slots_offset + index * self.slot_size
+                sequence = SEQUENCE.unpack_from(self._buffer, offset)[0]
+                SLOT_HEADER.pack_into(self._buffer, offset, (sequence + 2) & 0xFFFFFFFF, 0, 0, 0)
+
+    def stats(self) -> Dict[str, any]:
+        """Return counters summed over every worker, for health reporting
+
+        Other workers' counts are as of their last publish().
+        """
+        self.publish()
+        hits = misses = 0
+        for index in range(MAX_PROCESSES):
+            _, process_hits, process_misses = COUNTERS.unpack_from(
+                self._buffer, self._counters_offset + index * COUNTERS.size)
+            hits += process_hits
+            misses += process_misses
+        size = sum(1 for index in range(self.max_entries)
+                   if SLOT_HEADER.unpack_from(self._buffer, self._slots_offset + index * self.slot_size)[2])
+        evictions, too_large, uncounted = BLOCK_HEADER.unpack_from(self._buffer, 0)
+        lookups = hits + misses
+        return {
+            'size': size,
+            'max_entries': self.max_entries,
+            'slot_size': self.slot_size,
+            'hits': hits,
+            'misses': misses,
+            'evictions': evictions,
+            'too_large': too_large,
+            'uncounted_processes': uncounted,
+            'hit_ratio': round(hits / lookups, 4) if lookups else 0.0
+        }
+
+    def close(self) -> None:
+        """Release the shared memory; call once, from the process that created it"""
+        self._buffer = None
+        self._memory.close()
+        self._memory.unlink()
@@ -4,337 +4,392 @@ Simple web server for the Learning Objectives Generator
 Uses only Python standard library - no external dependencies required
 """
 
+import html
 import http.server
+import socket
 import socketserver
+import threading
+import time
+import argparse
 import json
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator
 import sys
 import os
 
 # Add the current directory to Python path to import our generator
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from learning_objectives_generator import LearningObjectivesGenerator
+from learning_objectives_generator import get_generator, parse_goal_batch, BatchTooLargeError
+from prepared_page import PreparedPage
+from page_template import HTML_TEMPLATE
+from metrics import ServerMetrics, StageTimer, PROMETHEUS_CONTENT_TYPE, server_timing_header
+from admission import (AdmissionController, OVERLOADED_MESSAGE,
+                       DEFAULT_MAX_IN_FLIGHT, DEFAULT_MAX_QUEUE, DEFAULT_QUEUE_TIMEOUT)
+from config import DEFAULT_MAX_BODY_SIZE
+from profiling import PROFILING_ENABLED, PROFILE_ID_HEADER, wants_profile, request_id_from, run_profiled
+from prefork import PreforkSupervisor, DEFAULT_GRACEFUL_TIMEOUT
+from shared_cache import SharedResultCache, DEFAULT_SHARED_CACHE_SIZE, DEFAULT_SHARED_CACHE_SLOT_SIZE
+from jobs import (JobManager, JobError, DEFAULT_JOBS_DIR, DEFAULT_JOB_WORKERS, DEFAULT_MAX_QUEUED_JOBS,
+                  DEFAULT_MAX_UPLOAD_SIZE, DEFAULT_PAGE_SIZE, FINISHED_STATES)
 
-# HTML template for the web interface
-HTML_TEMPLATE = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Learning Objectives Generator</title>
-    <style>
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-            line-height: 1.6;
-        }
-        
-        .container {
-            background: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-        
-        h1 {
-            color: #2c3e50;
-            text-align: center;
-            margin-bottom: 10px;
-        }
-        
-        .subtitle {
-            text-align: center;
-            color: #7f8c8d;
-            margin-bottom: 30px;
-        }
-        
-        .form-group {
-            margin-bottom: 20px;
-        }
-        
-        label {
-            display: block;
-            margin-bottom: 5px;
-            font-weight: bold;
-            color: #34495e;
-        }
-        
-        textarea {
-            width: 100%;
-            padding: 12px;
-            border: 2px solid #ddd;
-            border-radius: 5px;
-            font-size: 16px;
-            resize: vertical;
-            min-height: 100px;
-            box-sizing: border-box;
-        }
-        
-        textarea:focus {
-            border-color: #3498db;
-            outline: none;
-        }
-        
-        button {
-            background-color: #3498db;
-            color: white;
-            padding: 12px 30px;
-            border: none;
-            border-radius: 5px;
-            font-size: 16px;
-            cursor: pointer;
-            transition: background-color 0.3s;
-        }
-        
-        button:hover {
-            background-color: #2980b9;
-        }
-        
-        button:disabled {
-            background-color: #95a5a6;
-            cursor: not-allowed;
-        }
-        
-        .results {
-            margin-top: 30px;
-            padding: 20px;
-            background-color: #ecf0f1;
-            border-radius: 5px;
-            border-left: 4px solid #3498db;
-        }
-        
-        .results h3 {
-            color: #2c3e50;
-            margin-top: 0;
-        }
-        
-        .goal-info {
-            background-color: #e8f5e8;
-            padding: 10px;
-            border-radius: 5px;
-            margin-bottom: 15px;
-        }
-        
-        .objectives {
-            background-color: white;
-            padding: 15px;
-            border-radius: 5px;
-            font-family: 'Courier New', monospace;
-            white-space: pre-line;
-            line-height: 1.5;
-        }
-        
-        .loading {
-            text-align: center;
-            color: #7f8c8d;
-        }
-        
-        .error {
-            background-color: #f8d7da;
-            color: #721c24;
-            padding: 15px;
-            border-radius: 5px;
-            border-left: 4px solid #dc3545;
-        }
-        
-        .examples {
-            margin-top: 20px;
-            padding: 15px;
-            background-color: #f8f9fa;
-            border-radius: 5px;
-        }
-        
-        .examples h4 {
-            margin-top: 0;
-            color: #495057;
-        }
-        
-        .example {
-            margin: 10px 0;
-            padding: 8px;
-            background-color: white;
-            border-radius: 3px;
-            cursor: pointer;
-            transition: background-color 0.2s;
-        }
-        
-        .example:hover {
-            background-color: #e9ecef;
-        }
-        
-        .bloom-levels {
-            margin-top: 20px;
-            font-size: 14px;
-            color: #6c757d;
-        }
-        
-        .bloom-levels h4 {
-            margin-bottom: 10px;
-            color: #495057;
-        }
-        
-        .bloom-level {
-            margin: 5px 0;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🎯 Learning Objectives Generator</h1>
-        <p class="subtitle">Generate clear learning objectives aligned to Bloom's Taxonomy</p>
-        
-        <form id="objectiveForm">
-            <div class="form-group">
-                <label for="goal">Enter your course goal:</label>
-                <textarea 
-                    id="goal" 
-                    name="goal" 
-                    placeholder="Example: The goal is for learners to know the supplies needed for each emergency procedure"
-                    required
-                ></textarea>
-            </div>
-            
-            <button type="submit" id="generateBtn">Generate Learning Objectives</button>
-        </form>
-        
-        <div class="examples">
-            <h4>📚 Example Goals (click to use):</h4>
-            <div class="example" onclick="setGoal('The goal is for learners to know the supplies needed for each emergency procedure')">
-                Emergency procedure supplies
-            </div>
-            <div class="example" onclick="setGoal('Students will design a user interface for a mobile application')">
-                UI design for mobile apps
-            </div>
-            <div class="example" onclick="setGoal('Students will create a marketing plan for a new product')">
-                Marketing plan development
-            </div>
-            <div class="example" onclick="setGoal('Learners will analyze data to identify trends and patterns')">
-                Data analysis and pattern recognition
-            </div>
-        </div>
-        
-        <div class="bloom-levels">
-            <h4>🧠 Bloom's Taxonomy Levels:</h4>
-            <div class="bloom-level"><strong>Remember:</strong> Recall facts and basic concepts</div>
-            <div class="bloom-level"><strong>Understand:</strong> Explain ideas or concepts</div>
-            <div class="bloom-level"><strong>Apply:</strong> Use information in new situations</div>
-            <div class="bloom-level"><strong>Analyze:</strong> Draw connections among ideas</div>
-            <div class="bloom-level"><strong>Evaluate:</strong> Justify a stand or decision</div>
-            <div class="bloom-level"><strong>Create:</strong> Produce new or original work</div>
-        </div>
-        
-        <div id="results" style="display: none;"></div>
-    </div>
+DEFAULT_PORT = 8080
+DEFAULT_WORKERS = 16
+DEFAULT_BACKLOG = 128
+DEFAULT_IDLE_TIMEOUT = 5.0  # seconds an idle keep-alive connection holds a worker thread
+DEFAULT_MAX_REQUESTS_PER_CONNECTION = 100
 
-    <script>
-        function setGoal(goalText) {
-            document.getElementById('goal').value = goalText;
-        }
-        
-        document.getElementById('objectiveForm').addEventListener('submit', async function(e) {
-            e.preventDefault();
-            
-            const goal = document.getElementById('goal').value.trim();
-            const generateBtn = document.getElementById('generateBtn');
-            const resultsDiv = document.getElementById('results');
-            
-            if (!goal) {
-                alert('Please enter a course goal.');
-                return;
-            }
-            
-            // Show loading state
-            generateBtn.disabled = true;
-            generateBtn.textContent = 'Generating...';
-            resultsDiv.style.display = 'block';
-            resultsDiv.innerHTML = '<div class="loading">🔄 Generating learning objectives...</div>';
-            
-            try {
-                const response = await fetch('/api/generate', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify({ goal: goal })
-                });
-                
-                const data = await response.json();
-                
-                if (data.success) {
-                    resultsDiv.innerHTML = `
-                        <div class="results">
-                            <h3>📋 Generated Learning Objectives</h3>
-                            <div class="goal-info">
-                                <strong>Original Goal:</strong> ${data.result.goal}<br>
-                                <strong>Target Bloom's Level:</strong> ${data.result.target_level_name.charAt(0).toUpperCase() + data.result.target_level_name.slice(1)} (Level ${data.result.target_level})
-                            </div>
-                            <div class="objectives">${data.result.formatted_output}</div>
-                        </div>
-                    `;
-                } else {
-                    resultsDiv.innerHTML = `
-                        <div class="error">
-                            <strong>Error:</strong> ${data.error}
-                        </div>
-                    `;
-                }
-            } catch (error) {
-                resultsDiv.innerHTML = `
-                    <div class="error">
-                        <strong>Error:</strong> Failed to generate objectives. Please try again.
-                    </div>
-                `;
-            } finally {
-                generateBtn.disabled = false;
-                generateBtn.textContent = 'Generate Learning Objectives';
-            }
-        });
-    </script>
-</body>
-</html>'''
+# Longest chunk-size line accepted in a chunked request body
+MAX_CHUNK_LINE = 1024
+
+# Bytes read from the socket at a time when streaming an upload to disk
+UPLOAD_READ_SIZE = 64 * 1024
+
+# The page encoded and compressed once at startup
+INDEX_PAGE = PreparedPage(HTML_TEMPLATE)
+
+# Request counts and latencies, exposed on /metrics
+METRICS = ServerMetrics(('/', '/index.html', '/health', '/metrics', '/api/generate', '/api/generate/batch',
+                         '/api/jobs'))
+
+# Limits on concurrent and waiting generation requests; main() applies the command line options
+ADMISSION = AdmissionController()
+METRICS.add_collector(ADMISSION.render_metrics)
+
+# Background batch jobs spooled to disk; main() applies the command line options
+JOBS = JobManager()
+
+class RequestBodyError(Exception):
+    """A request body that cannot be read, with the status code to answer it with"""
+    
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
 
 class LearningObjectivesHandler(http.server.SimpleHTTPRequestHandler):
-    """Custom HTTP request handler for the learning objectives generator"""
+    """Custom HTTP request handler for the learning objectives generator
+    
+    Connections are kept alive between requests (HTTP/1.1) until they sit idle
+    for `timeout` seconds or have served max_requests_per_connection requests.
+    """
+    
+    protocol_version = "HTTP/1.1"
+    
+    # Headers and body are separate writes; with Nagle on, a reused connection
+    # stalls ~40 ms per response waiting for the client's delayed ACK
+    disable_nagle_algorithm = True
+    
+    # Connection and body limits; main() applies the command line options
+    timeout = DEFAULT_IDLE_TIMEOUT
+    max_requests_per_connection = DEFAULT_MAX_REQUESTS_PER_CONNECTION
+    max_body_size = DEFAULT_MAX_BODY_SIZE
+    max_upload_size = DEFAULT_MAX_UPLOAD_SIZE
+    
+    # Set once the current request has been read in full, so the connection can be reused
+    request_read = False
+    
+    # Set while a request runs under the profiler; end_headers() names the profile
+    profile_id = None
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
     
+    def handle(self):
+        """Serve requests on one connection until it closes"""
+        self.requests_served = 0
+        self._response_started = False
+        try:
+            super().handle()
+        except (ConnectionResetError, BrokenPipeError):
+            pass  # the client went away, often while the connection sat idle
+    
+    def send_response(self, code, message=None):
+        """Send the status line, remembering the code for metrics"""
+        self.status_code = code
+        self.requests_served += 1
+        self._response_started = True
+        super().send_response(code, message)
+    
+    def end_headers(self):
+        """Finish the headers, closing the connection if it cannot serve another request"""
+        if self._response_started:
+            self._response_started = False
+            reusable = self.request_read and self.requests_served < self.max_requests_per_connection
+            if not reusable and not self.close_connection:
+                self.send_header('Connection', 'close')
+            if self.profile_id:
+                self.send_header(PROFILE_ID_HEADER, self.profile_id)
+        super().end_headers()
+    
+    def send_error(self, code, message=None, explain=None):
+        """Send an error page with a Content-Length
+        
+        Unlike the base class this does not always close the connection;
+        end_headers() keeps it open when the request was read in full.
+        """
+        try:
+            shortmsg, longmsg = self.responses[code]
+        except KeyError:
+            shortmsg, longmsg = '???', '???'
+        if message is None:
+            message = shortmsg
+        if explain is None:
+            explain = longmsg
+        self.log_error("code %d, message %s", code, message)
+        
+        body = (self.error_message_format % {
+            'code': code,
+            'message': html.escape(message, quote=False),
+            'explain': html.escape(explain, quote=False)
+        }).encode('UTF-8', 'replace')
+        self.send_response(code, message)
+        self.send_header('Content-Type', self.error_content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+    
+    def handle_expect_100(self):
+        """Refuse an oversized body before the client sends it"""
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = 0
+        limit = self._body_limit()
+        if length > limit:
+            self.send_error(413, f"Request body cannot be larger than {limit} bytes")
+            return False
+        return super().handle_expect_100()
+    
+    def _body_limit(self) -> int:
+        """Largest body accepted for this request; job uploads may be bigger than API requests"""
+        if self.command == 'POST' and self.path == '/api/jobs' and not self._is_json():
+            return self.max_upload_size
+        return self.max_body_size
+    
+    def _has_body(self) -> bool:
+        return bool(self.headers.get('Transfer-Encoding')) or self.headers.get('Content-Length', '0').strip() != '0'
+    
+    def _is_json(self) -> bool:
+        return (self.headers.get('Content-Type') or '').split(';', 1)[0].strip().lower() == 'application/json'
+    
     def do_GET(self):
         """Handle GET requests"""
+        self._handle_with_metrics(self._handle_get)
+    
+    def do_DELETE(self):
+        """Handle DELETE requests"""
+        self._handle_with_metrics(self._handle_delete)
+    
+    def do_POST(self):
+        """Handle POST requests"""
+        handle = self._handle_post
+        if PROFILING_ENABLED and self.path == '/api/generate' and wants_profile(self.headers):
+            handle = self._handle_post_profiled
+        self._handle_with_metrics(handle)
+    
+    def _admit(self) -> bool:
+        """Wait for an admission slot for generation, answering 503 when none frees up
+        
+        Call once the request has been read and checked, so slow or invalid
+        uploads never hold a slot; release the slot with ADMISSION.release().
+        """
+        if ADMISSION.acquire():
+            return True
+        self._send_overloaded()
+        return False
+    
+    def _send_overloaded(self):
+        """Tell the client the server is overloaded and when to retry"""
+        response = json.dumps({
+            'success': False,
+            'error': OVERLOADED_MESSAGE
+        }).encode('utf-8')
+        
+        self.send_response(503)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(response)))
+        self.send_header('Retry-After', str(ADMISSION.retry_after))
+        self.end_headers()
+        self.wfile.write(response)
+    
+    def _handle_post_profiled(self):
+        """Handle the request under cProfile and name the profile in a response header"""
+        self.profile_id = request_id_from(self.headers)
+        try:
+            _, path = run_profiled(self._handle_post, request_id=self.profile_id)
+        finally:
+            self.profile_id = None
+        self.log_message("Profile written to %s", path)
+    
+    def _handle_with_metrics(self, handle, *args):
+        """Run a request handler, recording its status and stage timings"""
+        endpoint = METRICS.endpoint_label(self.path)
+        self.status_code = None
+        self.timer = StageTimer()
+        # A GET or DELETE body is never read, so its connection must close,
+        # or the body would be parsed as the next request
+        self.request_read = self.command in ('GET', 'DELETE') and not self._has_body()
+        METRICS.request_started(endpoint)
+        try:
+            handle(*args)
+        finally:
+            self.request_read = False
+            METRICS.request_finished(endpoint, self.status_code or 500, self.timer)
+            shared_cache = get_generator().shared_cache
+            if shared_cache is not None:
+                shared_cache.publish()
+    
+    def _read_body(self) -> bytes:
+        """Read the request body, enforcing max_body_size before reading any of it"""
+        return b''.join(self._iter_body(self.max_body_size))
+    
+    def _iter_body(self, limit: int) -> Iterator[bytes]:
+        """Check the body's framing and size, then return an iterator over its pieces
+        
+        Bodies sent with Transfer-Encoding: chunked are decoded chunk by chunk,
+        stopping as soon as they grow past the limit.
+        """
+        transfer_encoding = (self.headers.get('Transfer-Encoding') or '').lower()
+        if transfer_encoding:
+            if transfer_encoding != 'chunked':
+                raise RequestBodyError(501, f"Unsupported Transfer-Encoding: {transfer_encoding}")
+            return self._iter_chunked_body(limit)
+        
+        content_length = self.headers.get('Content-Length')
+        if content_length is None:
+            raise RequestBodyError(411, "Content-Length required")
+        try:
+            length = int(content_length)
+        except ValueError:
+            length = -1
+        if length < 0:
+            raise RequestBodyError(400, "Invalid Content-Length")
+        if length > limit:
+            raise RequestBodyError(413, f"Request body cannot be larger than {limit} bytes")
+        return self._iter_fixed_body(length)
+    
+    def _iter_fixed_body(self, length: int) -> Iterator[bytes]:
+        """Read a body of known length, a piece at a time"""
+        remaining = length
+        while remaining:
+            piece = self.rfile.read(min(remaining, UPLOAD_READ_SIZE))
+            if not piece:
+                raise RequestBodyError(400, "Request body ended early")
+            remaining -= len(piece)
+            yield piece
+        self.request_read = True
+    
+    def _iter_chunked_body(self, limit: int) -> Iterator[bytes]:
+        """Decode a chunked request body, stopping once it exceeds limit"""
+        size_read = 0
+        while True:
+            line = self.rfile.readline(MAX_CHUNK_LINE + 1)
+            if len(line) > MAX_CHUNK_LINE or not line.endswith(b'\n'):
+                raise RequestBodyError(400, "Malformed chunked request body")
+            try:
+                size = int(line.split(b';', 1)[0].strip(), 16)
+            except ValueError:
+                raise RequestBodyError(400, "Malformed chunked request body")
+            if size < 0:
+                raise RequestBodyError(400, "Malformed chunked request body")
+            
+            if size == 0:
+                break
+            size_read += size
+            if size_read > limit:
+                raise RequestBodyError(413, f"Request body cannot be larger than {limit} bytes")
+            
+            # A chunk may be as large as the whole limit, so it is passed on a piece at a time too
+            remaining = size
+            while remaining:
+                piece = self.rfile.read(min(remaining, UPLOAD_READ_SIZE))
+                if not piece:
+                    raise RequestBodyError(400, "Malformed chunked request body")
+                remaining -= len(piece)
+                yield piece
+            if self.rfile.readline(MAX_CHUNK_LINE + 1).strip():
+                raise RequestBodyError(400, "Malformed chunked request body")
+        
+        # Skip any trailer fields up to the blank line that ends the body
+        while True:
+            line = self.rfile.readline(MAX_CHUNK_LINE + 1)
+            if line in (b'\r\n', b'\n', b''):
+                self.request_read = True
+                return
+            if len(line) > MAX_CHUNK_LINE:
+                raise RequestBodyError(400, "Malformed chunked request body")
+    
+    def _handle_get(self):
+        """Serve the page, health check and metrics"""
         if self.path == '/' or self.path == '/index.html':
+            encoding, body, etag = INDEX_PAGE.select(self.headers.get('Accept-Encoding'))
+            headers = INDEX_PAGE.headers(encoding, etag)
+            
+            if INDEX_PAGE.is_not_modified(self.headers.get('If-None-Match'), etag):
+                self.send_response(304)
+                for name in ('ETag', 'Cache-Control', 'Vary'):
+                    self.send_header(name, headers[name])
+                self.end_headers()
+                return
+            
             self.send_response(200)
-            self.send_header('Content-type', 'text/html')
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(body)))
             self.end_headers()
-            self.wfile.write(HTML_TEMPLATE.encode('utf-8'))
+            self.wfile.write(body)
         elif self.path == '/health':
+            generator = get_generator()
+            response = json.dumps({
+                'status': 'healthy',
+                'cache': generator.cache.stats(),
+                'shared_cache': generator.shared_cache.stats() if generator.shared_cache else None,
+                'persistent_cache': generator.persistent_cache.stats() if generator.persistent_cache else None,
+                'admission': ADMISSION.stats(),
+                'jobs': JOBS.stats()
+            }).encode('utf-8')
             self.send_response(200)
             self.send_header('Content-type', 'application/json')
+            self.send_header('Content-Length', str(len(response)))
+            self.end_headers()
+            self.wfile.write(response)
+        elif self.path == '/metrics':
+            body = METRICS.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-type', PROMETHEUS_CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
             self.end_headers()
-            response = json.dumps({'status': 'healthy'})
-            self.wfile.write(response.encode('utf-8'))
+            self.wfile.write(body)
+        elif self.path.startswith('/api/jobs/'):
+            self._handle_job_get()
         else:
             self.send_error(404, "File not found")
     
-    def do_POST(self):
-        """Handle POST requests"""
+    def _handle_post(self):
+        """Generate objectives for one goal or a batch of goals"""
+        timer = self.timer
         if self.path == '/api/generate':
             try:
                 # Read the request body
-                content_length = int(self.headers['Content-Length'])
-                post_data = self.rfile.read(content_length)
+                post_data = self._read_body()
+                timer.lap('read')
                 
                 # Parse JSON data
                 data = json.loads(post_data.decode('utf-8'))
+                timer.lap('parse')
                 
-                if 'goal' not in data:
+                if not isinstance(data, dict) or 'goal' not in data:
                     self.send_error(400, "No goal provided")
                     return
                 
+                if not isinstance(data['goal'], str):
+                    self.send_error(400, "Goal must be a string")
+                    return
+                
                 goal = data['goal'].strip()
                 
                 if not goal:
@@ -342,38 +397,425 @@ class LearningObjectivesHandler(http.server.SimpleHTTPRequestHandler):
                     return
                 
                 # Generate objectives
-                generator = LearningObjectivesGenerator()
-                result = generator.generate_learning_objectives(goal)
+                if not self._admit():
+                    return
+                try:
+                    result = get_generator().generate_learning_objectives(goal, timer)
+                finally:
+                    ADMISSION.release()
+                
+                response = json.dumps({
+                    'success': True,
+                    'result': result
+                }).encode('utf-8')
+                timer.lap('serialize')
                 
                 # Send successful response
                 self.send_response(200)
                 self.send_header('Content-type', 'application/json')
+                self.send_header('Content-Length', str(len(response)))
+                self.send_header('Server-Timing', server_timing_header(timer))
                 self.end_headers()
+                self.wfile.write(response)
                 
-                response = json.dumps({
-                    'success': True,
-                    'result': result
-                })
-                self.wfile.write(response.encode('utf-8'))
-                
-            except json.JSONDecodeError:
+            except RequestBodyError as e:
+                self.send_error(e.status, e.message)
+            except (json.JSONDecodeError, UnicodeDecodeError):
                 self.send_error(400, "Invalid JSON data")
             except Exception as e:
+                response = json.dumps({
+                    'success': False,
+                    'error': str(e)
+                }).encode('utf-8')
+                
                 self.send_response(500)
                 self.send_header('Content-type', 'application/json')
+                self.send_header('Content-Length', str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
+        elif self.path == '/api/generate/batch':
+            try:
+                # Read the request body
+                post_data = self._read_body()
+                timer.lap('read')
+                
+                # Parse JSON data, stopping as soon as the batch is too large
+                goals = parse_goal_batch(post_data.decode('utf-8'))
+                timer.lap('parse')
+                
+                if goals is None:
+                    self.send_error(400, "Request body must be a JSON array of goals")
+                    return
+                
+                # Generate objectives for every goal, keeping per-item errors
+                if not self._admit():
+                    return
+                try:
+                    results = get_generator().generate_learning_objectives_batch(goals, timer)
+                finally:
+                    ADMISSION.release()
+                
+                response = json.dumps({
+                    'success': True,
+                    'results': results
+                }).encode('utf-8')
+                timer.lap('serialize')
+                
+                # Send successful response
+                self.send_response(200)
+                self.send_header('Content-type', 'application/json')
+                self.send_header('Content-Length', str(len(response)))
+                self.send_header('Server-Timing', server_timing_header(timer))
                 self.end_headers()
+                self.wfile.write(response)
                 
+            except RequestBodyError as e:
+                self.send_error(e.status, e.message)
+            except BatchTooLargeError as e:
+                self.send_error(413, str(e))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                self.send_error(400, "Invalid JSON data")
+            except Exception as e:
                 response = json.dumps({
                     'success': False,
                     'error': str(e)
-                })
-                self.wfile.write(response.encode('utf-8'))
+                }).encode('utf-8')
+                
+                self.send_response(500)
+                self.send_header('Content-type', 'application/json')
+                self.send_header('Content-Length', str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
+        elif self.path == '/api/jobs':
+            self._handle_job_submit()
         else:
             self.send_error(404, "Endpoint not found")
+    
+    def _send_json(self, status: int, response: bytes, headers=()):
+        self.send_response(status)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(response)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(response)
+    
+    def _handle_job_submit(self):
+        """Queue a batch job for a JSON list of goals or an uploaded goal file"""
+        content_type = (self.headers.get('Content-Type') or '').lower()
+        try:
+            if self._is_json():
+                data = json.loads(self._read_body().decode('utf-8'))
+                goals = data.get('goals') if isinstance(data, dict) else data
+                if not isinstance(goals, list):
+                    self.send_error(400, 'Request body must be a JSON array of goals or an object with a "goals" array')
+                    return
+                job = JOBS.submit_goals(goals)
+            elif content_type.startswith('multipart/'):
+                self.send_error(415, "Send the goal file itself as the request body, one goal per line")
+                return
+            else:
+                # Any other body is a goal file, streamed to disk without holding it in memory
+                job = JOBS.submit_upload(self._iter_body(self.max_upload_size))
+        except (RequestBodyError, JobError) as e:
+            self.send_error(e.status, e.message)
+            return
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            self.send_error(400, "Invalid JSON data")
+            return
+        except Exception as e:
+            self._send_json(500, json.dumps({'success': False, 'error': str(e)}).encode('utf-8'))
+            return
+        
+        response = json.dumps({'success': True, 'job': job}).encode('utf-8')
+        self._send_json(202, response, [('Location', f"/api/jobs/{job['id']}")])
+    
+    def _handle_job_get(self):
+        """Report a job's progress, or serve one page of its results"""
+        url = urllib.parse.urlsplit(self.path)
+        parts = url.path[len('/api/jobs/'):].split('/')
+        try:
+            if len(parts) == 1:
+                response = json.dumps({'success': True, 'job': JOBS.status(parts[0])}).encode('utf-8')
+            elif len(parts) == 2 and parts[1] == 'results':
+                query = urllib.parse.parse_qs(url.query)
+                try:
+                    offset = int(query.get('offset', ['0'])[0])
+                    limit = int(query.get('limit', [str(DEFAULT_PAGE_SIZE)])[0])
+                except ValueError:
+                    raise JobError(400, "offset and limit must be integers")
+                job, records = JOBS.results(parts[0], offset, limit)
+                
+                # next_offset is null once a finished job has no more records
+                end = offset + len(records)
+                more = job['state'] not in FINISHED_STATES or end < job['processed']
+                page = json.dumps({
+                    'success': True,
+                    'job': job,
+                    'offset': offset,
+                    'limit': limit,
+                    'next_offset': end if more else None
+                })
+                # The records are spliced in as stored, without decoding them
+                response = page[:-1].encode('utf-8') + b', "results": [' + b', '.join(records) + b']}'
+            else:
+                raise JobError(404, "Endpoint not found")
+        except JobError as e:
+            self.send_error(e.status, e.message)
+            return
+        self._send_json(200, response)
+    
+    def _handle_delete(self):
+        """Cancel a batch job"""
+        path = urllib.parse.urlsplit(self.path).path
+        job_id = path[len('/api/jobs/'):] if path.startswith('/api/jobs/') else ''
+        try:
+            if not job_id or '/' in job_id:
+                raise JobError(404, "Endpoint not found")
+            job = JOBS.cancel(job_id)
+        except JobError as e:
+            self.send_error(e.status, e.message)
+            return
+        self._send_json(200, json.dumps({'success': True, 'job': job}).encode('utf-8'))
 
-def main():
+class ThreadPoolHTTPServer(socketserver.TCPServer):
+    """TCP server that handles each connection on a bounded pool of worker threads
+    
+    When every worker is busy the accept loop waits for one to free up, so
+    further connections queue in the listen backlog instead of in memory.
+    With reuse_port, several processes can each bind their own server to the
+    same port and the kernel spreads connections between them.
+    """
+    
+    allow_reuse_address = True
+    
+    def __init__(self, server_address, handler_class, workers: int = DEFAULT_WORKERS,
+                 backlog: int = DEFAULT_BACKLOG, reuse_port: bool = False):
+        self.request_queue_size = backlog
+        self.workers = workers
+        self.reuse_port = reuse_port
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="http-worker")
+        self._slots = threading.BoundedSemaphore(workers)
+        super().__init__(server_address, handler_class)
+    
+    def server_bind(self):
+        """Bind the socket, first enabling SO_REUSEPORT when requested"""
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+    
+    def process_request(self, request, client_address):
+        """Hand the connection to a worker thread"""
+        self._slots.acquire()
+        try:
+            self._executor.submit(self._process_request_worker, request, client_address)
+        except Exception:
+            self._slots.release()
+            raise
+    
+    def _process_request_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self._slots.release()
+    
+    def server_close(self):
+        """Stop accepting connections and wait for in-flight requests to finish"""
+        super().server_close()
+        self._executor.shutdown(wait=True)
+
+def build_parser(add_help: bool = True) -> argparse.ArgumentParser:
+    """Build the parser for the web server's command line options
+    
+    start.py reuses it (with add_help=False) as a parent parser.
+    """
+    parser = argparse.ArgumentParser(
+        description="Web interface for the Learning Objectives Generator",
+        add_help=add_help
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=int(os.environ.get('PORT', DEFAULT_PORT)),
+        help=f"Port to listen on (default: {DEFAULT_PORT})"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of worker threads handling requests (default: {DEFAULT_WORKERS})"
+    )
+    parser.add_argument(
+        "--backlog",
+        type=int,
+        default=DEFAULT_BACKLOG,
+        help=f"Listen backlog for pending connections (default: {DEFAULT_BACKLOG})"
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="Worker processes sharing the port with SO_REUSEPORT; 0 means one per CPU core (default: 1)"
+    )
+    parser.add_argument(
+        "--graceful-timeout",
+        type=float,
+        default=DEFAULT_GRACEFUL_TIMEOUT,
+        help=f"Seconds worker processes get to finish requests on shutdown (default: {DEFAULT_GRACEFUL_TIMEOUT})"
+    )
+    parser.add_argument(
+        "--shared-cache-size",
+        type=int,
+        default=DEFAULT_SHARED_CACHE_SIZE,
+        help=f"Results cached in shared memory for all worker processes; 0 disables (default: {DEFAULT_SHARED_CACHE_SIZE})"
+    )
+    parser.add_argument(
+        "--shared-cache-slot-size",
+        type=int,
+        default=DEFAULT_SHARED_CACHE_SLOT_SIZE,
+        help=f"Bytes per shared cache entry; larger results are not shared (default: {DEFAULT_SHARED_CACHE_SLOT_SIZE})"
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT,
+        help=f"Seconds before an idle keep-alive connection is closed (default: {DEFAULT_IDLE_TIMEOUT})"
+    )
+    parser.add_argument(
+        "--max-requests-per-connection",
+        type=int,
+        default=DEFAULT_MAX_REQUESTS_PER_CONNECTION,
+        help=f"Requests served on one connection before it is closed (default: {DEFAULT_MAX_REQUESTS_PER_CONNECTION})"
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=DEFAULT_MAX_IN_FLIGHT,
+        help=f"Generation requests processed at once (default: {DEFAULT_MAX_IN_FLIGHT})"
+    )
+    parser.add_argument(
+        "--max-queue",
+        type=int,
+        default=DEFAULT_MAX_QUEUE,
+        help=f"Generation requests allowed to wait for a slot before getting 503 (default: {DEFAULT_MAX_QUEUE})"
+    )
+    parser.add_argument(
+        "--queue-timeout",
+        type=float,
+        default=DEFAULT_QUEUE_TIMEOUT,
+        help=f"Seconds a request may wait for a slot before getting 503 (default: {DEFAULT_QUEUE_TIMEOUT})"
+    )
+    parser.add_argument(
+        "--max-body-size",
+        type=int,
+        default=DEFAULT_MAX_BODY_SIZE,
+        help=f"Largest request body in bytes; bigger requests get 413 (default: {DEFAULT_MAX_BODY_SIZE})"
+    )
+    parser.add_argument(
+        "--jobs-dir",
+        default=DEFAULT_JOBS_DIR,
+        help=f"Directory batch jobs are spooled to (default: {DEFAULT_JOBS_DIR})"
+    )
+    parser.add_argument(
+        "--job-workers",
+        type=int,
+        default=DEFAULT_JOB_WORKERS,
+        help=f"Threads per process running batch jobs (default: {DEFAULT_JOB_WORKERS})"
+    )
+    parser.add_argument(
+        "--max-queued-jobs",
+        type=int,
+        default=DEFAULT_MAX_QUEUED_JOBS,
+        help=f"Batch jobs allowed to wait per process before submissions get 503 (default: {DEFAULT_MAX_QUEUED_JOBS})"
+    )
+    parser.add_argument(
+        "--max-upload-size",
+        type=int,
+        default=DEFAULT_MAX_UPLOAD_SIZE,
+        help=f"Largest goal file in bytes accepted by POST /api/jobs (default: {DEFAULT_MAX_UPLOAD_SIZE})"
+    )
+    return parser
+
+# Smallest value each numeric option accepts, matching its environment variable where it has one
+OPTION_MINIMUMS = (
+    ('--port', 'port', 0),
+    ('--workers', 'workers', 1),
+    ('--backlog', 'backlog', 0),
+    ('--graceful-timeout', 'graceful_timeout', 0),
+    ('--shared-cache-size', 'shared_cache_size', 0),
+    ('--shared-cache-slot-size', 'shared_cache_slot_size', 1),
+    ('--max-requests-per-connection', 'max_requests_per_connection', 1),
+    ('--max-in-flight', 'max_in_flight', 1),
+    ('--max-queue', 'max_queue', 0),
+    ('--queue-timeout', 'queue_timeout', 0),
+    ('--max-body-size', 'max_body_size', 1),
+    ('--job-workers', 'job_workers', 1),
+    ('--max-queued-jobs', 'max_queued_jobs', 1),
+    ('--max-upload-size', 'max_upload_size', 1),
+)
+
+def check_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> argparse.Namespace:
+    """Exit with a usage error for option values out of range; start.py checks its options with it too"""
+    if args.processes < 0:
+        parser.error("--processes must be 0 (every core) or a positive number of processes")
+    if args.idle_timeout <= 0:
+        parser.error("--idle-timeout must be more than 0")
+    for option, name, minimum in OPTION_MINIMUMS:
+        if getattr(args, name) < minimum:
+            parser.error(f"{option} must be at least {minimum}")
+    return args
+
+def parse_args(argv=None):
+    """Parse the web server's command line options"""
+    parser = build_parser()
+    return check_args(parser, parser.parse_args(argv))
+
+def serve(args, reuse_port: bool = False):
+    """Run one server until interrupted, then let in-flight requests finish"""
+    PORT = args.port
+    worker = f" (process {os.getpid()})" if reuse_port else ""
+    stopped = None
+    try:
+        with ThreadPoolHTTPServer(("", PORT), LearningObjectivesHandler, workers=args.workers,
+                                  backlog=args.backlog, reuse_port=reuse_port) as httpd:
+            print(f"Server running on port {PORT} with {args.workers} worker threads{worker}")
+            try:
+                httpd.serve_forever()
+            except KeyboardInterrupt:
+                stopped = time.monotonic()
+                print(f"\nShutting down server{worker}, finishing in-flight requests...")
+    except Exception as e:
+        print(f"Error starting server{worker}: {e}")
+    finally:
+        # Batch jobs get what is left of the graceful timeout, then fail at their next checkpoint
+        remaining = args.graceful_timeout - (time.monotonic() - stopped) if stopped is not None else 0.0
+        JOBS.shutdown(max(0.0, remaining))
+        # Prefork workers leave with os._exit(), skipping the cache's exit handler
+        persistent_cache = get_generator().persistent_cache
+        if persistent_cache is not None:
+            persistent_cache.flush()
+
+def main(argv=None):
     """Start the web server"""
-    PORT = 8080
+    return run(parse_args(argv))
+
+def run(args: argparse.Namespace):
+    """Start the web server with parsed command line options"""
+    PORT = args.port
+    
+    ADMISSION.max_in_flight = args.max_in_flight
+    ADMISSION.max_queue = args.max_queue
+    ADMISSION.queue_timeout = args.queue_timeout
+    LearningObjectivesHandler.max_body_size = args.max_body_size
+    LearningObjectivesHandler.timeout = args.idle_timeout
+    LearningObjectivesHandler.max_requests_per_connection = args.max_requests_per_connection
+    LearningObjectivesHandler.max_upload_size = args.max_upload_size
+    JOBS.directory = args.jobs_dir
+    JOBS.workers = args.job_workers
+    JOBS.max_queued = args.max_queued_jobs
     
     print("🎯 Learning Objectives Generator Web Interface")
     print("=" * 50)
@@ -382,14 +824,36 @@ def main():
     print("Press Ctrl+C to stop the server")
     print("=" * 50)
     
+    if args.workers <= args.max_in_flight + args.max_queue:
+        print("Warning: --workers should exceed --max-in-flight plus --max-queue, "
+              "or waiting connections queue in the listen backlog instead")
+    
+    processes = args.processes or os.cpu_count() or 1
+    if processes == 1:
+        serve(args)
+        return 0
+    
+    if not hasattr(os, 'fork') or not hasattr(socket, 'SO_REUSEPORT'):
+        print("Error starting server: --processes needs fork() and SO_REUSEPORT")
+        return 1
+    
+    # Build the generator once so every worker starts with it already warm
+    generator = get_generator()
+    if args.shared_cache_size > 0:
+        try:
+            generator.shared_cache = SharedResultCache(args.shared_cache_size, args.shared_cache_slot_size)
+        except (ValueError, OSError) as e:
+            print(f"Error starting server: {e}")
+            return 1
+    print(f"Starting {processes} worker processes on port {PORT}")
+    supervisor = PreforkSupervisor(lambda: serve(args, reuse_port=True), processes,
+                                   graceful_timeout=args.graceful_timeout)
     try:
-        with socketserver.TCPServer(("", PORT), LearningObjectivesHandler) as httpd:
-            print(f"Server running on port {PORT}")
-            httpd.serve_forever()
-    except KeyboardInterrupt:
-        print("\nShutting down server...")
-    except Exception as e:
-        print(f"Error starting server: {e}")
+        return supervisor.run()
+    finally:
+        if generator.shared_cache is not None:
+            generator.shared_cache.close()
+            generator.shared_cache = None
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
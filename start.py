@@ -5,8 +5,14 @@ Provides easy access to all available modes
 """
 
 import sys
-import subprocess
 import os
+import argparse
+
+# Add the current directory to Python path to import the generator and server
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import learning_objectives_generator
+import simple_web_server
 
 def print_header():
     print("🎯 Learning Objectives Generator")
@@ -31,48 +37,76 @@ def print_options():
     print("5. 🚪 Exit")
     print()
 
-def start_web_interface():
+def exit_status(code) -> int:
+    """Turn a SystemExit code into an exit status, as the interpreter would"""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+def run_mode(func, *args) -> int:
+    """Run a mode in this process and return its exit status
+    
+    The modes' main functions may call sys.exit(), and argparse exits on bad
+    arguments; either way the launcher goes back to its menu.
+    """
+    try:
+        return func(*args) or 0
+    except SystemExit as e:
+        return exit_status(e.code)
+
+def start_web_interface(args):
+    url = f"http://localhost:{args.port}"
     print("Starting web interface...")
-    print("Your browser should open automatically.")
-    print("If not, go to: http://localhost:8080")
+    if not args.no_browser:
+        print("Your browser should open automatically.")
+    print(f"If not, go to: {url}")
     print("Press Ctrl+C to stop the server when done.")
     print()
     
     try:
-        # Try to open browser automatically
-        import webbrowser
-        import threading
-        import time
-        
-        def open_browser():
-            time.sleep(2)  # Wait for server to start
-            webbrowser.open('http://localhost:8080')
-        
-        # Start browser opener in background
-        threading.Thread(target=open_browser, daemon=True).start()
+        if not args.no_browser:
+            # Try to open browser automatically
+            import webbrowser
+            import threading
+            import time
+            
+            def open_browser():
+                time.sleep(2)  # Wait for server to start
+                webbrowser.open(url)
+            
+            # Start browser opener in background
+            threading.Thread(target=open_browser, daemon=True).start()
         
-        # Start web server
-        subprocess.run([sys.executable, 'simple_web_server.py'])
+        # Start web server in this process, sharing its generator
+        return run_mode(simple_web_server.run, args)
     except KeyboardInterrupt:
         print("\nWeb server stopped.")
+        return 0
     except Exception as e:
         print(f"Error starting web interface: {e}")
+        return 1
 
 def start_command_line():
     goal = input("Enter your course goal: ").strip()
-    if goal:
-        try:
-            subprocess.run([sys.executable, 'learning_objectives_generator.py', goal])
-        except Exception as e:
-            print(f"Error: {e}")
-    else:
+    if not goal:
         print("No goal provided.")
+        return 1
+    try:
+        # "--" keeps a goal starting with "-" from being read as an option
+        return run_mode(learning_objectives_generator.main, ['--', goal])
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
 
 def start_interactive():
     try:
-        subprocess.run([sys.executable, 'learning_objectives_generator.py', '-i'])
+        return run_mode(learning_objectives_generator.main, ['-i'])
     except Exception as e:
         print(f"Error: {e}")
+        return 1
 
 def show_help():
     print("📚 Learning Objectives Generator Help")
@@ -104,8 +138,26 @@ def show_help():
     print("  python3 learning_objectives_generator.py -i  # interactive mode")
     print("  python3 simple_web_server.py  # web interface")
     print()
+    print("LAUNCHER OPTIONS:")
+    print("  python3 start.py --help  # web server options, e.g. --port 8000 --processes 4")
+    print()
 
-def main():
+def parse_args(argv=None):
+    """Parse the launcher's options: the web server's, plus --no-browser"""
+    parser = argparse.ArgumentParser(
+        description="Launcher for the Learning Objectives Generator",
+        parents=[simple_web_server.build_parser(add_help=False)]
+    )
+    parser.add_argument(
+        "--no-browser",
+        action="store_true",
+        help="Do not open a browser when starting the web interface"
+    )
+    return simple_web_server.check_args(parser, parser.parse_args(argv))
+
+def main(argv=None):
+    args = parse_args(argv)
+    
     while True:
         print_header()
         print_options()
@@ -115,7 +167,7 @@ def main():
             print()
             
             if choice == '1':
-                start_web_interface()
+                start_web_interface(args)
             elif choice == '2':
                 start_command_line()
             elif choice == '3':
@@ -0,0 +1,24 @@
+import pytest
+
+from learning_objectives_generator import LearningObjectivesGenerator
+
+@pytest.fixture
+def generator():
+    """A generator without a result cache, so every call generates"""
+    return LearningObjectivesGenerator(cache_size=0)
+
+@pytest.fixture
+def server_port():
+    """Run simple_web_server on an ephemeral port for the duration of a test"""
+    import threading
+    from simple_web_server import LearningObjectivesHandler, ThreadPoolHTTPServer
+
+    server = ThreadPoolHTTPServer(('127.0.0.1', 0), LearningObjectivesHandler, workers=8)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.server_address[1]
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
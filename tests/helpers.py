@@ -0,0 +1,41 @@
+"""Small clients for driving the servers from tests"""
+
+import http.client
+import io
+import json
+import sys
+
+def http_request(port, method, path, body=None, headers=None, encode_chunked=False):
+    """Send one request on a new connection; returns (status, headers, body)"""
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+    try:
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body)
+            headers = {'Content-Type': 'application/json', **(headers or {})}
+        connection.request(method, path, body, headers or {}, encode_chunked=encode_chunked)
+        response = connection.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        connection.close()
+
+def wsgi_request(application, method, path, body=b'', headers=None):
+    """Call a WSGI application directly; returns (status code, headers, body)"""
+    if isinstance(body, (dict, list)):
+        body = json.dumps(body).encode('utf-8')
+    path, _, query = path.partition('?')
+    environ = {
+        'REQUEST_METHOD': method, 'PATH_INFO': path, 'QUERY_STRING': query, 'SCRIPT_NAME': '',
+        'SERVER_NAME': 'localhost', 'SERVER_PORT': '80', 'SERVER_PROTOCOL': 'HTTP/1.1',
+        'CONTENT_TYPE': 'application/json', 'CONTENT_LENGTH': str(len(body)),
+        'wsgi.version': (1, 0), 'wsgi.url_scheme': 'http', 'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr, 'wsgi.multithread': False, 'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+    }
+    for name, value in (headers or {}).items():
+        environ['HTTP_' + name.upper().replace('-', '_')] = value
+    started = []
+    chunks = application(environ, lambda status, response_headers, exc_info=None:
+                         started.append((status, response_headers)))
+    data = b''.join(chunks)
+    status, response_headers = started[0]
+    return int(status.split()[0]), dict(response_headers), data
@@ -0,0 +1,103 @@
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+import simple_web_server
+from admission import AdmissionController
+from config import ConfigError, env_float, env_int
+from tests.helpers import http_request
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_acquire_queues_then_times_out():
+    admission = AdmissionController(max_in_flight=1, max_queue=1, queue_timeout=0.05)
+    assert admission.acquire()
+    assert not admission.acquire()  # waited in the queue, then timed out
+    assert admission.stats()['rejected_timeout'] == 1
+
+def test_full_queue_rejects_at_once():
+    admission = AdmissionController(max_in_flight=1, max_queue=0, queue_timeout=5)
+    assert admission.acquire()
+    started = time.monotonic()
+    assert not admission.acquire()
+    assert time.monotonic() - started < 1
+    assert admission.stats()['rejected_queue_full'] == 1
+
+def test_release_wakes_a_waiting_request():
+    admission = AdmissionController(max_in_flight=1, max_queue=1, queue_timeout=5)
+    assert admission.acquire()
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(admission.acquire()))
+    waiter.start()
+    time.sleep(0.05)
+    admission.release()
+    waiter.join()
+    assert results == [True]
+    assert admission.stats()['in_flight'] == 1
+
+@pytest.fixture
+def admission(monkeypatch):
+    """The server's admission controller with one slot and no queue"""
+    controller = AdmissionController(max_in_flight=1, max_queue=0, queue_timeout=0, retry_after=7)
+    monkeypatch.setattr(simple_web_server, 'ADMISSION', controller)
+    return controller
+
+def test_overloaded_server_answers_503_with_retry_after(server_port, admission):
+    assert admission.acquire()  # every slot busy
+    try:
+        status, headers, _ = http_request(server_port, 'POST', '/api/generate', {'goal': 'design a bridge'})
+    finally:
+        admission.release()
+    assert status == 503
+    assert headers['Retry-After'] == '7'
+
+    status, _, _ = http_request(server_port, 'POST', '/api/generate', {'goal': 'design a bridge'})
+    assert status == 200
+
+def test_slow_upload_does_not_hold_a_slot(server_port, admission):
+    slow = socket.create_connection(('127.0.0.1', server_port))
+    try:
+        # Headers promise a body that never arrives
+        slow.sendall(b'POST /api/generate HTTP/1.1\r\nHost: localhost\r\n'
+                     b'Content-Type: application/json\r\nContent-Length: 100\r\n\r\n{"goal": ')
+        time.sleep(0.2)
+        assert admission.stats()['in_flight'] == 0
+        status, _, _ = http_request(server_port, 'POST', '/api/generate/batch', ['design a bridge'])
+        assert status == 200
+    finally:
+        slow.close()
+
+def test_invalid_request_never_takes_a_slot(server_port, admission):
+    status, _, _ = http_request(server_port, 'POST', '/api/generate', '{not json',
+                                headers={'Content-Type': 'application/json'})
+    assert status == 400
+    assert admission.stats()['admitted'] == 0
+
+def test_env_numbers(monkeypatch):
+    monkeypatch.setenv('TEST_SETTING', ' 12 ')
+    assert env_int('TEST_SETTING', 3) == 12
+    monkeypatch.setenv('TEST_SETTING', '')
+    assert env_float('TEST_SETTING', 2.5) == 2.5
+    monkeypatch.setenv('TEST_SETTING', 'lots')
+    with pytest.raises(ConfigError, match="TEST_SETTING must be an integer, got 'lots'"):
+        env_int('TEST_SETTING', 3)
+    monkeypatch.setenv('TEST_SETTING', '0')
+    with pytest.raises(ConfigError, match="TEST_SETTING must be at least 1"):
+        env_int('TEST_SETTING', 3, minimum=1)
+
+@pytest.mark.parametrize("name, value", [
+    ('LEARNING_OBJECTIVES_MAX_IN_FLIGHT', 'four'),
+    ('LEARNING_OBJECTIVES_MAX_IN_FLIGHT', '0'),
+    ('LEARNING_OBJECTIVES_QUEUE_TIMEOUT', '-1'),
+    ('LEARNING_OBJECTIVES_MAX_BODY_SIZE', '1MB'),
+])
+def test_bad_environment_fails_at_import_with_the_variable_name(name, value):
+    result = subprocess.run([sys.executable, '-c', 'import admission, config'], cwd=PROJECT_DIR,
+                            env={**os.environ, name: value}, capture_output=True, text=True)
+    assert result.returncode != 0
+    assert f"ConfigError: {name} must be" in result.stderr
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+import wsgi
+from learning_objectives_generator import MAX_BATCH_SIZE, BatchTooLargeError, parse_goal_batch
+from tests.helpers import http_request, wsgi_request
+
+def test_batch_keeps_order_and_per_item_errors(generator):
+    results = generator.generate_learning_objectives_batch(["design a bridge", "", 5, "  list the planets  "])
+    assert [item['success'] for item in results] == [True, False, False, True]
+    assert results[1]['error'] == 'Goal cannot be empty'
+    assert results[2]['error'] == 'Goal must be a string'
+    assert results[3]['result']['goal'] == 'list the planets'
+
+def test_batch_over_the_limit_is_rejected(generator):
+    with pytest.raises(ValueError):
+        generator.generate_learning_objectives_batch(["goal"] * (MAX_BATCH_SIZE + 1))
+
+@pytest.mark.parametrize("text, goals", [
+    ('[]', []),
+    (' [ "a" , 1, {"goal": ["x"]} ] ', ["a", 1, {"goal": ["x"]}]),
+])
+def test_parse_goal_batch(text, goals):
+    assert parse_goal_batch(text) == goals
+
+@pytest.mark.parametrize("text", ['{"goal": "a"}', '"a"', '3'])
+def test_parse_goal_batch_returns_none_for_other_json(text):
+    assert parse_goal_batch(text) is None
+
+@pytest.mark.parametrize("text", ['', '[', '[1,]', '[1 2]', '[1] x', '["a"'])
+def test_parse_goal_batch_rejects_invalid_json(text):
+    with pytest.raises(json.JSONDecodeError):
+        parse_goal_batch(text)
+
+def test_parse_goal_batch_stops_at_the_limit():
+    # The item after the limit is invalid; the count is checked before it is reached
+    with pytest.raises(BatchTooLargeError):
+        parse_goal_batch('["a", "b", "c", oops]', max_goals=2)
+    assert len(parse_goal_batch(json.dumps(["a"] * MAX_BATCH_SIZE))) == MAX_BATCH_SIZE
+
+def test_simple_server_batch(server_port):
+    status, _, body = http_request(server_port, 'POST', '/api/generate/batch', ["design a bridge", ""])
+    results = json.loads(body)['results']
+    assert status == 200
+    assert [item['success'] for item in results] == [True, False]
+
+@pytest.mark.parametrize("body, status", [
+    (json.dumps(["a"] * (MAX_BATCH_SIZE + 1)), 413),
+    ('[1,', 400),
+    ('{"goal": "a"}', 400),
+    (b'\xff', 400),
+])
+def test_simple_server_batch_errors(server_port, body, status):
+    assert http_request(server_port, 'POST', '/api/generate/batch', body)[0] == status
+
+@pytest.mark.parametrize("body, status", [
+    (json.dumps(["a"] * (MAX_BATCH_SIZE + 1)).encode(), 413),
+    (b'[1,', 400),
+    (b'{"goal": "a"}', 400),
+])
+def test_wsgi_batch_errors(body, status):
+    assert wsgi_request(wsgi.application, 'POST', '/api/generate/batch', body)[0] == status
+
+class TestFlaskApp:
+    @pytest.fixture
+    def client(self):
+        pytest.importorskip('flask')
+        import app
+        return app.app.test_client()
+
+    def test_invalid_json_is_a_bad_request(self, client):
+        response = client.post('/api/generate', data='{oops', content_type='application/json')
+        assert response.status_code == 400
+
+    def test_batch_errors(self, client):
+        too_many = json.dumps(["a"] * (MAX_BATCH_SIZE + 1))
+        assert client.post('/api/generate/batch', data=too_many, content_type='application/json').status_code == 413
+        assert client.post('/api/generate/batch', data='[1,', content_type='application/json').status_code == 400
@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+import benchmark
+
+def _report(calibration_us, **means):
+    return {
+        'calibration_us': calibration_us,
+        'results': {name: {'mean_us': mean} for name, mean in means.items()},
+    }
+
+def test_no_regression_within_tolerance():
+    baseline = _report(10.0, stage=100.0)
+    current = _report(10.0, stage=125.0)
+    assert benchmark.compare(current, baseline, 0.3) == []
+
+def test_regression_beyond_tolerance_is_reported():
+    baseline = _report(10.0, stage=100.0)
+    current = _report(10.0, stage=150.0)
+    regressions = benchmark.compare(current, baseline, 0.3)
+    assert len(regressions) == 1
+    assert regressions[0].startswith('stage:')
+    assert '+50%' in regressions[0]
+
+def test_times_are_scaled_by_calibration():
+    # The current machine is twice as slow, so twice the time is no regression
+    baseline = _report(10.0, stage=100.0)
+    current = _report(20.0, stage=200.0)
+    assert benchmark.compare(current, baseline, 0.3) == []
+
+def test_stages_missing_from_baseline_are_skipped():
+    baseline = _report(10.0, other=100.0, empty=0.0)
+    current = _report(10.0, stage=500.0, empty=500.0)
+    assert benchmark.compare(current, baseline, 0.3) == []
+
+def _relative_report(**relatives):
+    return {
+        'calibration_us': 10.0,
+        'results': {name: {'mean_us': 1.0, 'relative': relative} for name, relative in relatives.items()},
+    }
+
+def test_interleaved_ratio_is_compared_when_both_runs_have_it():
+    # The mean doubled, but so did the calibration loop measured beside it
+    baseline = _relative_report(stage=0.1)
+    current = _relative_report(stage=0.1)
+    current['results']['stage']['mean_us'] = 2.0
+    assert benchmark.compare(current, baseline, 0.3) == []
+    assert benchmark.regressed(_relative_report(stage=0.14), baseline, 0.3) == {'stage': pytest.approx(0.4)}
+
+def test_median_report_keeps_the_median_run_of_each_stage():
+    runs = [_relative_report(a=0.3, b=0.1), _relative_report(a=0.1, b=0.2), _relative_report(a=0.2, b=0.9)]
+    combined = benchmark.median_report(runs)
+    assert combined['results']['a']['relative'] == 0.2
+    assert combined['results']['b']['relative'] == 0.2
+
+def test_recheck_keeps_the_fastest_run_of_a_noisy_stage(monkeypatch):
+    baseline = _relative_report(noisy=0.1, slow=0.1, steady=0.1)
+    report = _relative_report(noisy=0.2, slow=0.2, steady=0.1)
+    measured = []
+    def run_benchmarks(rounds, warmup, only=None):
+        measured.append(sorted(only))
+        return _relative_report(noisy=0.105, slow=0.19)
+    monkeypatch.setattr(benchmark, 'run_benchmarks', run_benchmarks)
+    benchmark.recheck(report, baseline, 0.3, rounds=1, warmup=0)
+    assert measured == [['noisy', 'slow']] + [['slow']] * (benchmark.RECHECKS - 1)
+    assert list(benchmark.regressed(report, baseline, 0.3)) == ['slow']
+
+def test_percentile():
+    values = [1, 2, 3, 4, 5]
+    assert benchmark.percentile(values, 0.0) == 1
+    assert benchmark.percentile(values, 0.5) == 3
+    assert benchmark.percentile(values, 1.0) == 5
+
+def test_baseline_covers_every_stage():
+    with open(benchmark.DEFAULT_BASELINE) as f:
+        baseline = json.load(f)
+    generator = benchmark.LearningObjectivesGenerator(cache_size=0)
+    expected = {f"{stage}[{group}]"
+                for group, goals in benchmark.CORPUS.items()
+                for stage in benchmark.build_stages(generator, goals[:1])}
+    assert set(baseline['results']) == expected
+
+def test_run_benchmarks_report_shape():
+    report = benchmark.run_benchmarks(rounds=1, warmup=0)
+    assert report['calibration_us'] > 0
+    assert all(stats['calls'] > 0 and stats['relative'] > 0 for stats in report['results'].values())
+
+def test_short_stages_repeat_their_calls_per_pass():
+    calls = []
+    benchmark.measure([lambda: calls.append(1)], rounds=2, warmup=0)
+    # One sizing pass, then at least two passes long enough to hide the timer
+    assert len(calls) > 100
@@ -0,0 +1,151 @@
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+import cli_daemon
+import learning_objectives_cli
+from cli_daemon import check_private, check_socket, serve_daemon
+from learning_objectives_cli import run_client
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@pytest.fixture
+def private_dir(tmp_path):
+    directory = tmp_path / 'run'
+    directory.mkdir(mode=0o700)
+    return directory
+
+def _stale_socket(path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(str(path))  # closed without listening, as after a crash
+
+def test_check_private_rejects_shared_directories(private_dir):
+    check_private(str(private_dir))
+    private_dir.chmod(0o777)
+    with pytest.raises(PermissionError, match="writable by other users"):
+        check_private(str(private_dir))
+
+def test_check_private_rejects_other_owners(private_dir, monkeypatch):
+    other_uid = os.getuid() + 1
+    monkeypatch.setattr(cli_daemon.os, 'getuid', lambda: other_uid)
+    with pytest.raises(PermissionError, match="owned by another user"):
+        check_private(str(private_dir))
+
+def test_check_socket_requires_a_socket(private_dir):
+    path = private_dir / 'not-a-socket'
+    path.write_text('')
+    path.chmod(0o600)
+    with pytest.raises(PermissionError, match="not a socket"):
+        check_socket(str(path))
+
+@pytest.mark.parametrize("argv", [[], ['a', 'b'], ['--file', 'x'], ['']])
+def test_client_only_handles_a_single_goal(argv, private_dir):
+    assert run_client(argv, str(private_dir / 'missing.sock')) is None
+
+def test_client_ignores_a_socket_in_a_shared_directory(private_dir):
+    path = private_dir / 'daemon.sock'
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(path))
+        server.listen()
+        private_dir.chmod(0o777)  # another user could have planted this socket
+        assert run_client(['design a bridge'], str(path)) is None
+        server.setblocking(False)
+        with pytest.raises(BlockingIOError):
+            server.accept()  # the client never connected
+
+def _serve_once(path, reply):
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    server.listen()
+
+    def answer():
+        connection, _ = server.accept()
+        with connection:
+            connection.settimeout(5)
+            cli_daemon.read_all(connection, 1024)
+            try:
+                connection.sendall(reply)
+            except OSError:
+                pass
+        server.close()
+
+    thread = threading.Thread(target=answer)
+    thread.start()
+    return thread
+
+def test_client_prints_the_reply(private_dir, capfdbinary):
+    path = private_dir / 'daemon.sock'
+    thread = _serve_once(path, b'objectives\n')
+    assert run_client(['design a bridge'], str(path)) == 0
+    thread.join()
+    assert capfdbinary.readouterr().out == b'objectives\n'
+
+def test_client_refuses_an_oversized_reply(private_dir, monkeypatch, capfdbinary):
+    monkeypatch.setattr(learning_objectives_cli, 'MAX_REPLY_BYTES', 100)
+    path = private_dir / 'daemon.sock'
+    thread = _serve_once(path, b'x' * 1000)
+    assert run_client(['design a bridge'], str(path)) is None
+    thread.join()
+    assert capfdbinary.readouterr().out == b''
+
+def test_daemon_refuses_a_shared_directory(private_dir, capsys):
+    private_dir.chmod(0o777)
+    assert serve_daemon(str, str(private_dir / 'daemon.sock')) == 1
+    assert "writable by other users" in capsys.readouterr().err
+
+def test_daemon_reports_a_stale_socket_it_cannot_remove(private_dir, monkeypatch, capsys):
+    path = private_dir / 'daemon.sock'
+    _stale_socket(path)
+
+    def unlink(path):
+        raise PermissionError(13, "Permission denied", path)
+
+    monkeypatch.setattr(cli_daemon.os, 'unlink', unlink)
+    assert serve_daemon(str, str(path)) == 1
+    assert "cannot remove the stale socket" in capsys.readouterr().err
+
+def test_daemon_answers_the_launcher(private_dir):
+    path = private_dir / 'sub' / 'daemon.sock'
+    env = {**os.environ, 'LEARNING_OBJECTIVES_SOCKET': str(path)}
+    daemon = subprocess.Popen([sys.executable, 'learning_objectives_generator.py', '--daemon', '--socket', str(path)],
+                              cwd=PROJECT_DIR, stderr=subprocess.PIPE)
+    try:
+        deadline = time.monotonic() + 20
+        while not path.exists() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert oct(path.parent.stat().st_mode & 0o777) == '0o700'
+
+        launched = subprocess.run([sys.executable, 'learning_objectives_cli.py', 'design a bridge'],
+                                  cwd=PROJECT_DIR, env=env, capture_output=True, text=True)
+        direct = subprocess.run([sys.executable, 'learning_objectives_generator.py', 'design a bridge'],
+                                cwd=PROJECT_DIR, capture_output=True, text=True)
+        assert launched.returncode == 0
+        assert launched.stdout == direct.stdout
+        assert launched.stdout.startswith('1.0.0. Design a bridge.')
+    finally:
+        daemon.terminate()
+        daemon.wait(timeout=10)
+    assert not path.exists()
+
+def test_launcher_falls_back_without_a_daemon(private_dir):
+    env = {**os.environ, 'LEARNING_OBJECTIVES_SOCKET': str(private_dir / 'none.sock')}
+    result = subprocess.run([sys.executable, 'learning_objectives_cli.py', 'design a bridge'],
+                            cwd=PROJECT_DIR, env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.startswith('1.0.0. Design a bridge.')
+
+def test_generator_script_asks_the_daemon_first(private_dir):
+    # Scripts call the generator directly; its reply must come from the daemon
+    path = private_dir / 'daemon.sock'
+    thread = _serve_once(path, b'from the daemon\n')
+    env = {**os.environ, 'LEARNING_OBJECTIVES_SOCKET': str(path)}
+    result = subprocess.run([sys.executable, 'learning_objectives_generator.py', 'design a bridge'],
+                            cwd=PROJECT_DIR, env=env, capture_output=True, text=True)
+    thread.join()
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == 'from the daemon\n'
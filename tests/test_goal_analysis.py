@@ -0,0 +1,38 @@
+from learning_objectives_generator import GoalAnalysis
+
+def test_analysis_normalizes_once_for_every_stage(generator):
+    analysis = generator.analyze_goal("Students will be able to  Design a Bridge for the river")
+    assert analysis == GoalAnalysis(
+        goal="Students will be able to  Design a Bridge for the river",
+        cleaned_goal="design a bridge for the river",
+        tokens=('students', 'will', 'be', 'able', 'to', 'design', 'a', 'bridge', 'for', 'the', 'river'),
+        keywords=frozenset({'design'}),
+        key_concepts="bridge river",
+        target_level=6,
+    )
+
+def test_stages_give_the_same_text_with_or_without_a_shared_analysis(generator):
+    goal = "Students will compare renewable energy sources"
+    analysis = generator.analyze_goal(goal)
+    level = analysis.target_level
+    main = generator.generate_objective_text(goal, level)
+    assert generator.generate_objective_text(goal, level, analysis=analysis) == main
+    assert (generator.generate_supporting_objectives(main, level, goal, analysis=analysis)
+            == generator.generate_supporting_objectives(main, level, goal))
+
+def test_generated_objectives(generator):
+    assert generator.generate_learning_objectives("Students will know the procedures for fire safety") == {
+        'goal': "Students will know the procedures for fire safety",
+        'target_level': 3,
+        'target_level_name': 'apply',
+        'main_objective': "Demonstrate the procedures for fire safety. (apply)",
+        'supporting_objectives': [
+            "Identify the steps in the procedures for fire safety. (remember)",
+            "Describe the rationale for the procedures for fire safety. (understand)",
+        ],
+        'formatted_output': (
+            "1.0.0. Demonstrate the procedures for fire safety. (apply)\n"
+            "   1.1.0. Identify the steps in the procedures for fire safety. (remember)\n"
+            "       1.1.1. Describe the rationale for the procedures for fire safety. (understand)"
+        ),
+    }
@@ -0,0 +1,143 @@
+import json
+import os
+import time
+import uuid
+
+import pytest
+
+import jobs
+from jobs import JobError, JobManager, COMPLETED, FAILED, FINISHED_STATES, STOPPED_ERROR
+from tests.helpers import http_request
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = JobManager(str(tmp_path / 'jobs'))
+    yield manager
+    manager.shutdown(0)
+
+def wait_for(manager, job_id, states=FINISHED_STATES, timeout=10):
+    deadline = time.monotonic() + timeout
+    while True:
+        status = manager.status(job_id)
+        if status['state'] in states or time.monotonic() > deadline:
+            return status
+        time.sleep(0.01)
+
+def slow_records(monkeypatch, delay=0.005):
+    generate_record = jobs.generate_record
+    def slow(*args):
+        time.sleep(delay)
+        return generate_record(*args)
+    monkeypatch.setattr(jobs, 'generate_record', slow)
+
+def test_job_results_are_paged(manager):
+    job = manager.submit_goals([f'design bridge {i}' for i in range(5)] + [7])
+    status = wait_for(manager, job['id'])
+    assert (status['state'], status['processed'], status['errors']) == (COMPLETED, 6, 1)
+    _, records = manager.results(job['id'], offset=4, limit=10)
+    assert [json.loads(record)['line'] for record in records] == [5, 6]
+
+def test_results_are_closed_before_their_index(manager, monkeypatch):
+    closed = []
+    class Recording:
+        def __init__(self, f):
+            self.f = f
+        def __getattr__(self, name):
+            return getattr(self.f, name)
+        def __iter__(self):
+            return iter(self.f)
+        def __enter__(self):
+            return self
+        def __exit__(self, *exc):
+            closed.append(os.path.basename(self.f.name))
+            return self.f.__exit__(*exc)
+    monkeypatch.setattr(jobs, 'open', lambda *args, **kwargs: Recording(open(*args, **kwargs)), raising=False)
+    job = manager.submit_goals(['design a bridge'])
+    wait_for(manager, job['id'])
+    assert closed.index('results.jsonl') < closed.index('results.idx')
+
+def test_delete_with_a_query_string(server_port, tmp_path, monkeypatch):
+    import simple_web_server
+    manager = JobManager(str(tmp_path / 'jobs'))
+    monkeypatch.setattr(simple_web_server, 'JOBS', manager)
+    try:
+        status, _, body = http_request(server_port, 'POST', '/api/jobs', [f'design {uuid.uuid4().hex}'])
+        assert status == 202
+        job_id = json.loads(body)['job']['id']
+        status, _, body = http_request(server_port, 'DELETE', f'/api/jobs/{job_id}?reason=test')
+        assert status == 200
+        assert json.loads(body)['job']['id'] == job_id
+    finally:
+        manager.shutdown(0)
+
+def test_a_directory_others_can_write_is_refused(manager):
+    os.makedirs(manager.directory, mode=0o700)
+    os.chmod(manager.directory, 0o777)
+    with pytest.raises(JobError) as error:
+        manager.submit_goals(['design a bridge'])
+    assert error.value.status == 500
+    assert "writable by other users" in error.value.message
+    with pytest.raises(JobError):
+        manager.status(uuid.uuid4().hex)
+
+def test_a_directory_of_another_user_is_refused(manager, monkeypatch):
+    os.makedirs(manager.directory, mode=0o700)
+    uid = os.getuid()
+    monkeypatch.setattr(os, 'getuid', lambda: uid + 1)
+    with pytest.raises(JobError, match="owned by another user"):
+        manager.submit_goals(['design a bridge'])
+
+def test_a_symlinked_directory_is_refused(manager, tmp_path):
+    os.mkdir(tmp_path / 'elsewhere', mode=0o700)
+    os.symlink(tmp_path / 'elsewhere', manager.directory)
+    with pytest.raises(JobError, match="not a directory"):
+        manager.submit_goals(['design a bridge'])
+
+def test_a_missing_directory_means_no_job(manager):
+    with pytest.raises(JobError) as error:
+        manager.status(uuid.uuid4().hex)
+    assert error.value.status == 404
+
+def test_shutdown_lets_short_jobs_finish(manager):
+    job = manager.submit_goals([f'design bridge {i}' for i in range(20)])
+    manager.shutdown(10)
+    assert manager.status(job['id'])['state'] == COMPLETED
+
+def test_shutdown_fails_running_and_queued_jobs(manager, monkeypatch):
+    monkeypatch.setattr(jobs, 'CHECKPOINT_EVERY', 1)
+    slow_records(monkeypatch)
+    running = manager.submit_goals([f'design bridge {i}' for i in range(1000)])
+    queued = manager.submit_goals(['design a bridge'])
+    wait_for(manager, running['id'], states={'running'})
+
+    manager.shutdown(0)
+    status = manager.status(running['id'])
+    assert (status['state'], status['error']) == (FAILED, STOPPED_ERROR)
+    assert 0 < status['processed'] < 1000
+    _, records = manager.results(running['id'], limit=status['processed'])
+    assert len(records) == status['processed']
+    assert manager.status(queued['id'])['state'] == FAILED
+
+def test_shutdown_without_jobs_is_a_no_op(manager):
+    manager.shutdown(0)
+    assert manager.stats()['running'] == 0
+
+def test_submissions_work_again_after_a_shutdown(manager):
+    first = manager.submit_goals(['design a bridge'])
+    manager.shutdown(1)
+    assert manager.status(first['id'])['state'] == COMPLETED
+    # As when start.py returns to its menu and the web interface is started again
+    second = manager.submit_goals(['design a road'])
+    assert wait_for(manager, second['id'])['state'] == COMPLETED
+
+@pytest.mark.parametrize('upload, expected', [
+    (b'design a bridge\rdesign a road\rdesign a tunnel\n', 1),
+    (b'design a bridge\r\ndesign a road\r\n', 2),
+    ('design a bridge\n\u00a0\ndesign a road\n'.encode('utf-8'), 2),
+    (b'design a bridge\n\n  \ndesign a road', 2),
+])
+def test_upload_total_matches_the_records_produced(manager, upload, expected):
+    job = manager.submit_upload(iter([upload[:7], upload[7:]]))
+    assert job['total'] == expected
+    status = wait_for(manager, job['id'])
+    assert (status['state'], status['processed']) == (COMPLETED, expected)
@@ -0,0 +1,101 @@
+import http.client
+import json
+import socket
+import time
+
+import pytest
+
+import simple_web_server
+
+GOAL = json.dumps({'goal': 'design a bridge'})
+
+@pytest.fixture
+def connection(server_port):
+    connection = http.client.HTTPConnection('127.0.0.1', server_port, timeout=10)
+    yield connection
+    connection.close()
+
+def _post(connection, body=GOAL):
+    connection.request('POST', '/api/generate', body, {'Content-Type': 'application/json'})
+    response = connection.getresponse()
+    response.read()
+    return response
+
+def _local_port(connection):
+    return connection.sock.getsockname()[1]
+
+def test_requests_reuse_one_connection(connection):
+    _post(connection)
+    port = _local_port(connection)
+    for _ in range(3):
+        response = _post(connection)
+        assert response.status == 200
+        assert response.getheader('Connection') is None
+        assert _local_port(connection) == port
+
+def test_error_after_reading_the_body_keeps_the_connection(connection):
+    response = _post(connection, '{bad json')
+    assert response.status == 400
+    assert response.getheader('Connection') is None
+    port = _local_port(connection)
+    assert _post(connection).status == 200
+    assert _local_port(connection) == port
+
+def test_connection_closes_after_max_requests(connection, monkeypatch):
+    monkeypatch.setattr(simple_web_server.LearningObjectivesHandler, 'max_requests_per_connection', 2)
+    assert _post(connection).getheader('Connection') is None
+    assert _post(connection).getheader('Connection') == 'close'
+
+def test_unread_body_closes_the_connection(server_port):
+    sock = socket.create_connection(('127.0.0.1', server_port), timeout=10)
+    try:
+        sock.sendall(b'POST /api/generate HTTP/1.1\r\nHost: localhost\r\n'
+                     b'Content-Type: application/json\r\nContent-Length: 999999999\r\n\r\n')
+        response = http.client.HTTPResponse(sock)
+        response.begin()
+        assert response.status == 413
+        assert response.getheader('Connection') == 'close'
+        response.read()
+        assert sock.recv(1) == b''  # closed by the server
+    finally:
+        sock.close()
+
+def test_idle_connection_is_closed(server_port, monkeypatch):
+    monkeypatch.setattr(simple_web_server.LearningObjectivesHandler, 'timeout', 0.2)
+    sock = socket.create_connection(('127.0.0.1', server_port), timeout=10)
+    try:
+        started = time.monotonic()
+        assert sock.recv(1) == b''
+        assert time.monotonic() - started < 5
+    finally:
+        sock.close()
+
+@pytest.mark.parametrize('framing', ['Content-Length: {length}', 'Transfer-Encoding: chunked'])
+def test_get_body_is_not_parsed_as_a_request(server_port, framing):
+    inner = b'GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n'
+    if 'chunked' in framing:
+        body = b'%x\r\n' % len(inner) + inner + b'\r\n0\r\n\r\n'
+    else:
+        body = inner
+    head = f'GET /index.html HTTP/1.1\r\nHost: localhost\r\n{framing.format(length=len(body))}\r\n\r\n'
+    sock = socket.create_connection(('127.0.0.1', server_port), timeout=10)
+    try:
+        sock.sendall(head.encode('ascii') + body)
+        response = http.client.HTTPResponse(sock)
+        response.begin()
+        assert response.status == 200
+        assert response.getheader('Connection') == 'close'
+        response.read()
+        assert sock.recv(1) == b''  # no second response for the smuggled request
+    finally:
+        sock.close()
+
+def test_get_with_an_empty_body_keeps_the_connection(connection):
+    connection.request('GET', '/health', headers={'Content-Length': '0'})
+    response = connection.getresponse()
+    response.read()
+    assert response.getheader('Connection') is None
+    port = _local_port(connection)
+    connection.request('GET', '/health')
+    connection.getresponse().read()
+    assert _local_port(connection) == port
@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+import load_test
+
+def test_parse_mix():
+    assert load_test.parse_mix("generate:9, batch") == [('generate', 9), ('batch', 1)]
+    with pytest.raises(ValueError, match="Unknown request kind"):
+        load_test.parse_mix("upload:1")
+
+@pytest.mark.parametrize("argv", [
+    ['--server', 'flask', '--', '--workers', '4'],
+    ['--url', 'http://localhost:1', '--', '--workers', '4'],
+])
+def test_server_args_only_go_to_a_local_simple_server(argv, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        load_test.main(argv)
+    assert exit_info.value.code == 2
+    assert "--server simple" in capsys.readouterr().err
+
+@pytest.mark.skipif(not os.path.isdir('/proc'), reason="needs /proc")
+def test_peak_rss_includes_child_processes():
+    script = "import subprocess, sys, time; subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); time.sleep(30)"
+    parent = subprocess.Popen([sys.executable, '-c', script])
+    try:
+        deadline = 50
+        while not load_test.descendant_pids(parent.pid) and deadline:
+            time.sleep(0.1)
+            deadline -= 1
+        children = load_test.descendant_pids(parent.pid)
+        assert len(children) == 1
+        total = load_test.server_peak_rss_kb(parent.pid)
+        assert total > load_test.peak_rss_kb(parent.pid)
+    finally:
+        for pid in load_test.descendant_pids(parent.pid):
+            os.kill(pid, 9)
+        parent.kill()
+        parent.wait()
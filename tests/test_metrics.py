@@ -0,0 +1,109 @@
+import uuid
+
+import metrics
+from metrics import Counter, Histogram, ServerMetrics, StageTimer, server_timing_header
+from tests.helpers import http_request, wsgi_request
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_laps_add_up_per_stage(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(metrics.time, 'perf_counter', clock)
+    timer = StageTimer()
+    clock.now = 1.0
+    timer.lap('parse')
+    clock.now = 3.0
+    timer.lap('format')
+    clock.now = 6.0
+    timer.lap('format')
+    assert timer.durations == {'parse': 1.0, 'format': 5.0}
+    assert timer.elapsed() == 6.0
+
+def test_restart_leaves_the_gap_out_of_every_stage(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(metrics.time, 'perf_counter', clock)
+    timer = StageTimer()
+    clock.now = 1.0
+    timer.lap('format')
+    clock.now = 5.0
+    timer.restart()
+    clock.now = 6.0
+    timer.lap('format')
+    assert timer.durations == {'format': 2.0}
+    assert timer.elapsed() == 6.0
+
+class RecordingTimer:
+    def __init__(self):
+        self.events = []
+
+    def lap(self, stage):
+        self.events.append(stage)
+
+    def restart(self):
+        self.events.append('restart')
+
+def test_batch_restarts_the_lap_for_each_goal(generator):
+    timer = RecordingTimer()
+    generator.generate_learning_objectives_batch(["design a bridge", 5, "", "compare poems"], timer)
+    assert timer.events.count('restart') == 2
+    starts = [i for i, event in enumerate(timer.events) if event == 'restart']
+    assert starts[0] == 0
+    assert timer.events[starts[1] - 1] == 'format'
+
+def test_server_timing_header_orders_known_stages():
+    timer = StageTimer()
+    timer.durations = {'format': 0.002, 'read': 0.001}
+    header = server_timing_header(timer)
+    assert header.startswith('read;desc="Read request body";dur=1.000, format;')
+    assert ', total;dur=' in header
+
+def test_counter_and_histogram_render():
+    counter = Counter("requests_total", "Requests", ("endpoint",))
+    counter.inc("/a")
+    counter.inc("/a", amount=2)
+    assert counter.render() == ['requests_total{endpoint="/a"} 3']
+
+    histogram = Histogram("seconds", "Seconds", buckets=(0.1, 1.0))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5.0)
+    lines = histogram.render()
+    assert lines[:3] == ['seconds_bucket{le="0.1"} 1', 'seconds_bucket{le="1.0"} 2', 'seconds_bucket{le="+Inf"} 3']
+    assert lines[-1] == 'seconds_count 3'
+
+def test_unknown_paths_share_one_label():
+    server_metrics = ServerMetrics(('/api/generate',))
+    assert server_metrics.endpoint_label('/api/generate?x=1') == '/api/generate'
+    assert server_metrics.endpoint_label('/anything') == 'other'
+
+def test_metrics_endpoint_counts_requests(server_port):
+    http_request(server_port, 'POST', '/api/generate', {'goal': 'design a bridge'})
+    status, headers, body = http_request(server_port, 'GET', '/metrics')
+    assert status == 200
+    text = body.decode('utf-8')
+    assert 'learning_objectives_requests_total{endpoint="/api/generate",status="200"}' in text
+    assert 'learning_objectives_stage_duration_seconds_count{stage="format"}' in text
+
+def _timing_stages(header):
+    return [entry.split(';', 1)[0] for entry in header.split(', ')]
+
+def test_generate_response_has_server_timing(server_port):
+    # A goal no other test sends, so it is generated rather than found in the cache
+    goal = f'design a bridge over river {uuid.uuid4().hex}'
+    status, headers, _ = http_request(server_port, 'POST', '/api/generate', {'goal': goal})
+    assert status == 200
+    stages = _timing_stages(headers['Server-Timing'])
+    assert stages[-1] == 'total'
+    assert {'read', 'parse', 'analyze_goal', 'main_objective', 'format', 'serialize'} <= set(stages)
+    assert 'desc="Goal analysis and Bloom level"' in headers['Server-Timing']
+
+def test_wsgi_generate_response_has_server_timing():
+    from wsgi import application
+    status, headers, _ = wsgi_request(application, 'POST', '/api/generate', {'goal': f'compare two poems {uuid.uuid4().hex}'})
+    assert status == 200
+    assert 'analyze_goal' in _timing_stages(headers['Server-Timing'])
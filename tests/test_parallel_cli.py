@@ -0,0 +1,32 @@
+import io
+import json
+
+import pytest
+
+from learning_objectives_generator import main, stream_objectives, stream_objectives_parallel
+
+GOALS = ["design a bridge\n", "\n", '{"goal": 5}\n'] + [f"compare poems {index}\n" for index in range(40)]
+
+def test_parallel_output_matches_sequential_order(generator):
+    sequential, parallel = io.StringIO(), io.StringIO()
+    expected = stream_objectives(generator, GOALS, sequential)
+    assert stream_objectives_parallel(GOALS, parallel, jobs=2, chunk_size=7) == expected
+    assert parallel.getvalue() == sequential.getvalue()
+
+@pytest.mark.parametrize("args, message", [
+    (["--file", "-", "--jobs", "-2"], "--jobs must be 0"),
+    (["--file", "-", "--chunk-size", "0"], "--chunk-size must be at least 1"),
+])
+def test_invalid_worker_options_are_usage_errors(capsys, args, message):
+    with pytest.raises(SystemExit) as exit_info:
+        main(args)
+    assert exit_info.value.code == 2
+    assert message in capsys.readouterr().err
+
+def test_file_mode_with_jobs(tmp_path, capsys):
+    path = tmp_path / "goals.txt"
+    path.write_text("".join(GOALS))
+    main(["--file", str(path), "--jobs", "2", "--chunk-size", "5"])
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(records) == 42
+    assert records[0]['line'] == 1 and records[-1]['line'] == 43
@@ -0,0 +1,112 @@
+import os
+import sqlite3
+import subprocess
+import sys
+
+import pytest
+
+import learning_objectives_generator
+import persistent_cache
+from persistent_cache import PersistentCache
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RESULT = {'goal': 'design a bridge', 'main_objective': 'Design a bridge. (create)'}
+
+@pytest.fixture
+def cache(tmp_path):
+    return PersistentCache(str(tmp_path / 'cache.db'), 'v1', max_entries=100)
+
+def _rows(cache):
+    # The table is created with the cache's first connection
+    with sqlite3.connect(cache.path) as connection:
+        if not connection.execute("SELECT 1 FROM sqlite_master WHERE name = 'results'").fetchone():
+            return 0
+        return connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+def test_results_are_queued_until_flushed(cache):
+    cache.put('design a bridge', RESULT)
+    assert cache.get('design a bridge') == RESULT  # served from the queue
+    assert _rows(cache) == 0
+    cache.flush()
+    assert _rows(cache) == 1
+    assert cache.stats()['writes'] == 1
+    assert cache.stats()['pending'] == 0
+
+def test_a_full_queue_is_written_in_one_transaction(cache, monkeypatch):
+    monkeypatch.setattr(persistent_cache, 'WRITE_BATCH', 3)
+    for i in range(3):
+        cache.put(f'goal {i}', RESULT)
+    assert _rows(cache) == 3
+
+def test_an_old_queue_is_written_with_the_next_result(cache, monkeypatch):
+    monkeypatch.setattr(persistent_cache, 'FLUSH_INTERVAL', 0.0)
+    cache.put('design a bridge', RESULT)
+    assert _rows(cache) == 1
+
+def test_another_process_sees_flushed_results(cache):
+    cache.put('design a bridge', RESULT)
+    cache.flush()
+    other = PersistentCache(cache.path, 'v1')
+    assert other.get('design a bridge') == RESULT
+    assert PersistentCache(cache.path, 'v2').get('design a bridge') is None
+
+def test_eviction_keeps_the_newest_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(persistent_cache, 'EVICT_EVERY', 10)
+    cache = PersistentCache(str(tmp_path / 'cache.db'), 'v1', max_entries=5)
+    for i in range(10):
+        cache.put(f'goal {i}', RESULT)
+    cache.flush()
+    assert _rows(cache) == 5
+    assert cache.get('goal 9') == RESULT
+    assert cache.get('goal 0') is None
+
+def test_clear(cache):
+    cache.put('queued', RESULT)
+    cache.put('stored', RESULT)
+    cache.flush()
+    cache.put('queued', RESULT)
+    assert cache.clear() is True
+    assert cache.get('queued') is None
+    assert _rows(cache) == 0
+
+def test_database_errors_are_counted_not_raised(tmp_path):
+    cache = PersistentCache(str(tmp_path / 'missing' / 'cache.db'), 'v1')
+    cache.put('design a bridge', RESULT)
+    cache.flush()
+    assert cache.get('other goal') is None
+    assert cache.clear() is False
+    stats = cache.stats()
+    assert stats['errors'] == 3
+    assert stats['writes'] == 0
+
+def test_disabled_cache_stores_nothing(tmp_path):
+    cache = PersistentCache(str(tmp_path / 'cache.db'), 'v1', max_entries=0)
+    cache.put('design a bridge', RESULT)
+    assert cache.stats()['pending'] == 0
+
+def test_generator_uses_an_explicit_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(learning_objectives_generator, '_shared_generator', None)
+    monkeypatch.delenv('LEARNING_OBJECTIVES_PERSISTENT_CACHE', raising=False)
+    path = str(tmp_path / 'explicit.db')
+    generator = learning_objectives_generator.get_generator(path)
+    assert generator.persistent_cache.path == path
+
+def test_cache_db_reaches_the_jobs_workers_without_the_environment(tmp_path):
+    goals = tmp_path / 'goals.txt'
+    goals.write_text("".join(f"design bridge number {i}\n" for i in range(40)))
+    path = tmp_path / 'objectives.db'
+    env = {name: value for name, value in os.environ.items() if name != 'LEARNING_OBJECTIVES_PERSISTENT_CACHE'}
+    result = subprocess.run([sys.executable, 'learning_objectives_generator.py', '-f', str(goals), '-j', '2',
+                             '--chunk-size', '10', '--cache-db', str(path)],
+                            cwd=PROJECT_DIR, env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 40
+
+def test_bad_cache_size_is_reported(tmp_path, monkeypatch):
+    from config import ConfigError
+    monkeypatch.setattr(learning_objectives_generator, '_shared_generator', None)
+    monkeypatch.setenv('LEARNING_OBJECTIVES_PERSISTENT_CACHE_SIZE', 'many')
+    with pytest.raises(ConfigError, match="LEARNING_OBJECTIVES_PERSISTENT_CACHE_SIZE"):
+        learning_objectives_generator.get_generator(str(tmp_path / 'cache.db'))
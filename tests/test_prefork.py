@@ -0,0 +1,74 @@
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+import prefork
+from prefork import PreforkSupervisor, process_exists
+
+def test_process_exists():
+    assert process_exists(os.getpid())
+    child = subprocess.Popen([sys.executable, '-c', 'pass'])
+    child.wait()
+    assert not process_exists(child.pid)
+
+@pytest.fixture
+def fast_restarts(monkeypatch):
+    # The supervisor polls every 0.1 s, so a shorter uptime would pass crashed workers off as healthy
+    monkeypatch.setattr(prefork, 'MIN_WORKER_UPTIME', 0.5)
+    monkeypatch.setattr(prefork, 'RESTART_DELAY', 0.01)
+
+def test_workers_that_keep_failing_stop_the_supervisor(fast_restarts, capfd):
+    def serve():
+        raise RuntimeError("cannot bind")
+
+    supervisor = PreforkSupervisor(serve, processes=1)
+    assert supervisor.run() == 1
+    assert supervisor.failed_starts == prefork.MAX_FAILED_STARTS
+    assert "keep failing to start" in capfd.readouterr().out
+
+def test_exited_workers_are_replaced_until_stopped(fast_restarts, tmp_path):
+    started = tmp_path / 'started'
+
+    def serve():
+        with open(started, 'a') as f:
+            f.write(f"{os.getpid()}\n")
+        time.sleep(0.7)  # then exit, as if the worker crashed after serving a while
+
+    def stop_after_restarts():
+        deadline = time.monotonic() + 20
+        while time.monotonic() < deadline:
+            if started.exists() and len(started.read_text().split()) >= 4:
+                break
+            time.sleep(0.05)
+        os.kill(os.getpid(), signal.SIGTERM)
+
+    stopper = threading.Thread(target=stop_after_restarts)
+    stopper.start()
+    supervisor = PreforkSupervisor(serve, processes=2, graceful_timeout=5)
+    status = supervisor.run()
+    stopper.join()
+
+    pids = started.read_text().split()
+    assert status == 0
+    assert len(pids) >= 4
+    assert len(set(pids)) == len(pids)
+    assert supervisor.workers == {}
+    assert signal.getsignal(signal.SIGTERM) is not supervisor._handle_stop
+
+def test_workers_that_ignore_sigterm_are_killed(fast_restarts):
+    def serve():
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        while True:
+            time.sleep(1)
+
+    threading.Timer(0.3, os.kill, (os.getpid(), signal.SIGTERM)).start()
+    started = time.monotonic()
+    supervisor = PreforkSupervisor(serve, processes=1, graceful_timeout=0.2)
+    assert supervisor.run() == 0
+    assert time.monotonic() - started < 10
+    assert supervisor.workers == {}
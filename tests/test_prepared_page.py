@@ -0,0 +1,87 @@
+import gzip
+
+import pytest
+
+import prepared_page
+from prepared_page import PreparedPage, parse_accept_encoding
+from tests.helpers import http_request, wsgi_request
+
+HTML = "<html><body>" + "Learning objectives " * 50 + "</body></html>"
+
+@pytest.fixture
+def page():
+    return PreparedPage(HTML)
+
+def test_parse_accept_encoding():
+    assert parse_accept_encoding(None) == {}
+    assert parse_accept_encoding("gzip, br;q=0.5, *;q=0") == {'gzip': 1.0, 'br': 0.5, '*': 0.0}
+    assert parse_accept_encoding("gzip;q=bad") == {'gzip': 0.0}
+
+@pytest.mark.parametrize("header, encoding", [
+    (None, 'identity'),
+    ("gzip", 'gzip'),
+    ("gzip;q=0, identity", 'identity'),
+    ("deflate", 'identity'),
+    ("identity;q=0.5, gzip;q=0.9", 'gzip'),
+])
+def test_select_gzip_or_identity(page, header, encoding):
+    assert page.select(header)[0] == encoding
+
+def test_select_prefers_brotli_when_available(page):
+    expected = 'br' if prepared_page.brotli is not None else 'gzip'
+    assert page.select("gzip, br")[0] == expected
+
+def test_gzip_variant_decompresses_to_page(page):
+    _, body, _ = page.select("gzip")
+    assert gzip.decompress(body).decode('utf-8') == HTML
+
+def test_each_variant_has_its_own_etag(page):
+    etags = [etag for _, etag in page.variants.values()]
+    assert len(set(etags)) == len(etags)
+    assert PreparedPage(HTML).select(None)[2] == page.select(None)[2]
+
+def test_headers(page):
+    encoding, _, etag = page.select("gzip")
+    headers = page.headers(encoding, etag)
+    assert headers['Content-Encoding'] == 'gzip'
+    assert headers['Vary'] == 'Accept-Encoding'
+    assert headers['ETag'] == etag
+    assert 'Content-Encoding' not in page.headers('identity', page.select(None)[2])
+
+@pytest.mark.parametrize("header, matches", [
+    (None, False),
+    ('"other"', False),
+    ('*', True),
+    ('"other", {etag}', True),
+    ('W/{etag}', True),
+])
+def test_is_not_modified(page, header, matches):
+    etag = page.select(None)[2]
+    if header:
+        header = header.format(etag=etag)
+    assert PreparedPage.is_not_modified(header, etag) is matches
+
+def test_server_index_etag_and_304(server_port):
+    status, headers, body = http_request(server_port, 'GET', '/', headers={'Accept-Encoding': 'gzip'})
+    assert status == 200
+    assert headers['Content-Encoding'] == 'gzip'
+    assert headers['Vary'] == 'Accept-Encoding'
+    assert int(headers['Content-Length']) == len(body)
+    assert b'<html' in gzip.decompress(body).lower()
+
+    status, not_modified, body = http_request(server_port, 'GET', '/', headers={
+        'Accept-Encoding': 'gzip', 'If-None-Match': headers['ETag']})
+    assert status == 304
+    assert body == b''
+    assert not_modified['ETag'] == headers['ETag']
+
+def test_wsgi_index_etag_and_304():
+    from wsgi import application
+    status, headers, body = wsgi_request(application, 'GET', '/')
+    assert status == 200
+    assert 'Content-Encoding' not in headers
+    assert b'<html' in body.lower()
+
+    status, _, body = wsgi_request(application, 'GET', '/', headers={'If-None-Match': headers['ETag']})
+    assert status == 304
+    assert body == b''
@@ -0,0 +1,64 @@
+import os
+import pstats
+import subprocess
+import sys
+import time
+
+import profiling
+import simple_web_server
+from tests.helpers import http_request
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_request_id_is_sanitized():
+    assert profiling.request_id_from({'X-Request-ID': 'a/b c;d'}) == 'abcd'
+    assert len(profiling.request_id_from({})) == 32
+
+def test_wants_profile():
+    assert profiling.wants_profile({'X-Profile': 'true'})
+    assert not profiling.wants_profile({})
+
+def test_profiles_with_the_same_id_get_separate_files(tmp_path):
+    _, first = profiling.run_profiled(sum, [1, 2], request_id='same', directory=str(tmp_path))
+    result, second = profiling.run_profiled(sum, [1, 2], request_id='same', directory=str(tmp_path))
+    assert result == 3
+    assert first != second
+    assert os.path.basename(first).split('-')[1] == 'same'
+    pstats.Stats(second)  # a readable profile
+
+def test_profiled_request_names_its_profile(server_port, tmp_path, monkeypatch):
+    monkeypatch.setattr(simple_web_server, 'PROFILING_ENABLED', True)
+    monkeypatch.setattr(profiling, 'PROFILE_DIR', str(tmp_path))
+    status, headers, _ = http_request(server_port, 'POST', '/api/generate', {'goal': 'design a bridge'},
+                                      headers={'X-Profile': '1', 'X-Request-ID': 'req-1'})
+    assert status == 200
+    assert headers['X-Profile-Id'] == 'req-1'
+
+    # The profile is saved once the handler returns, just after the response is sent
+    deadline = time.monotonic() + 5
+    while not os.listdir(tmp_path) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(os.listdir(tmp_path)) == 1
+
+    # The header belongs to the profiled request only
+    status, headers, _ = http_request(server_port, 'POST', '/api/generate', {'goal': 'design a bridge'})
+    assert status == 200
+    assert 'X-Profile-Id' not in headers
+
+def test_cli_profile_option(tmp_path, monkeypatch, capsys):
+    from learning_objectives_generator import main
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv('LEARNING_OBJECTIVES_PROFILE_DIR', raising=False)
+    monkeypatch.setattr(profiling, 'PROFILE_DIR', 'profiles')
+    assert main(['--profile', '--', 'design a bridge']) in (0, None)
+    assert len(list((tmp_path / 'profiles').glob('*.pstats'))) == 1
+    assert main(['--profile', str(tmp_path / 'elsewhere'), 'design a bridge']) in (0, None)
+    assert len(list((tmp_path / 'elsewhere').glob('*.pstats'))) == 1
+    assert 'Profile written to' in capsys.readouterr().err
+
+def test_importing_the_generator_skips_optional_modules():
+    # sqlite3 and uuid cost milliseconds; only the persistent cache and --profile need them
+    code = ("import sys, learning_objectives_generator; "
+            "print(sorted(m for m in ('sqlite3', 'uuid', 'profiling', 'persistent_cache') if m in sys.modules))")
+    result = subprocess.run([sys.executable, '-c', code], cwd=PROJECT_DIR, capture_output=True, text=True)
+    assert result.stdout.strip() == '[]', result.stderr
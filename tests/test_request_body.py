@@ -0,0 +1,112 @@
+import http.client
+import io
+import json
+import socket
+
+import pytest
+
+from tests.helpers import http_request, wsgi_request
+
+GOAL = json.dumps({'goal': 'design a bridge'}).encode('utf-8')
+
+def raw_request(port, data, read_body=True):
+    """Send raw bytes and parse one response; returns (status, headers, body)"""
+    sock = socket.create_connection(('127.0.0.1', port), timeout=10)
+    try:
+        sock.sendall(data)
+        response = http.client.HTTPResponse(sock)
+        response.begin()
+        return response.status, dict(response.getheaders()), response.read() if read_body else b''
+    finally:
+        sock.close()
+
+def post_head(path, *headers):
+    return (f'POST {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n'
+            + ''.join(f'{header}\r\n' for header in headers) + '\r\n').encode('ascii')
+
+def test_chunked_body_is_decoded(server_port):
+    status, _, body = http_request(server_port, 'POST', '/api/generate', iter([GOAL[:10], GOAL[10:]]),
+                                   headers={'Content-Type': 'application/json'}, encode_chunked=True)
+    assert status == 200
+    assert json.loads(body)['success'] is True
+
+def test_chunked_body_with_extensions_and_trailers(server_port):
+    data = (post_head('/api/generate', 'Transfer-Encoding: chunked')
+            + b'%x;name=value\r\n' % len(GOAL) + GOAL + b'\r\n0\r\nX-Trailer: 1\r\n\r\n')
+    assert raw_request(server_port, data)[0] == 200
+
+def test_oversized_chunked_body_gets_413(server_port, monkeypatch):
+    import simple_web_server
+    monkeypatch.setattr(simple_web_server.LearningObjectivesHandler, 'max_body_size', 16)
+    data = post_head('/api/generate', 'Transfer-Encoding: chunked') + b'%x\r\n' % len(GOAL) + GOAL + b'\r\n0\r\n\r\n'
+    assert raw_request(server_port, data)[0] == 413
+
+def test_malformed_chunk_size_gets_400(server_port):
+    data = post_head('/api/generate', 'Transfer-Encoding: chunked') + b'zz\r\n{}\r\n0\r\n\r\n'
+    assert raw_request(server_port, data)[0] == 400
+
+def test_missing_length_gets_411(server_port):
+    assert raw_request(server_port, post_head('/api/generate'))[0] == 411
+
+def test_unsupported_transfer_encoding_gets_501(server_port):
+    assert raw_request(server_port, post_head('/api/generate', 'Transfer-Encoding: gzip'))[0] == 501
+
+def test_oversized_content_length_gets_413_without_reading(server_port):
+    status, headers, _ = raw_request(server_port, post_head('/api/generate', 'Content-Length: 999999999'))
+    assert status == 413
+    assert headers.get('Connection') == 'close'
+
+def test_expect_continue_accepts_a_small_body(server_port):
+    sock = socket.create_connection(('127.0.0.1', server_port), timeout=10)
+    try:
+        sock.sendall(post_head('/api/generate', f'Content-Length: {len(GOAL)}', 'Expect: 100-continue'))
+        interim = sock.recv(1024)
+        assert interim.startswith(b'HTTP/1.1 100')
+        sock.sendall(GOAL)
+        response = http.client.HTTPResponse(sock)
+        response.begin()
+        assert response.status == 200
+    finally:
+        sock.close()
+
+def test_expect_continue_refuses_an_oversized_body(server_port):
+    status, _, _ = raw_request(server_port, post_head(
+        '/api/generate', 'Content-Length: 999999999', 'Expect: 100-continue'))
+    assert status == 413
+
+@pytest.mark.parametrize("body, status", [
+    (GOAL, 200),
+    (b'x' * (2 * 1024 * 1024), 413),
+])
+def test_wsgi_body_limit(body, status):
+    from wsgi import application
+    assert wsgi_request(application, 'POST', '/api/generate', body)[0] == status
+
+def test_wsgi_chunked_body_is_read_to_the_end():
+    # Servers that decode chunked input pass no Content-Length and set wsgi.input_terminated
+    from metrics import StageTimer
+    from wsgi import _read_body
+    environ = {'CONTENT_LENGTH': '', 'wsgi.input_terminated': True, 'wsgi.input': io.BytesIO(GOAL)}
+    assert _read_body(environ, StageTimer()) == GOAL
+
+def _chunked_reader(data):
+    import simple_web_server
+    handler = simple_web_server.LearningObjectivesHandler.__new__(simple_web_server.LearningObjectivesHandler)
+    handler.rfile = io.BytesIO(data)
+    return handler
+
+def test_a_large_chunk_is_read_a_piece_at_a_time():
+    from simple_web_server import UPLOAD_READ_SIZE
+    body = b'g' * (3 * UPLOAD_READ_SIZE + 5)
+    handler = _chunked_reader(b'%x\r\n' % len(body) + body + b'\r\n0\r\n\r\n')
+    pieces = list(handler._iter_chunked_body(len(body)))
+    assert max(len(piece) for piece in pieces) == UPLOAD_READ_SIZE
+    assert b''.join(pieces) == body
+    assert handler.request_read
+
+@pytest.mark.parametrize('data', [b'a\r\nshort', b'3\r\nabcXY\r\n0\r\n\r\n'])
+def test_a_truncated_or_overlong_chunk_gets_400(data):
+    from simple_web_server import RequestBodyError
+    with pytest.raises(RequestBodyError) as error:
+        list(_chunked_reader(data)._iter_chunked_body(1000))
+    assert error.value.status == 400
@@ -0,0 +1,58 @@
+import pytest
+
+import learning_objectives_generator
+from config import ConfigError, env_float, env_int
+from learning_objectives_generator import LearningObjectivesGenerator, ResultCache, get_generator
+
+def test_evicts_least_recently_used():
+    cache = ResultCache(max_entries=2, ttl=0)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1 and cache.get('c') == 3
+    assert cache.stats()['evictions'] == 1
+
+def test_expired_entries_are_misses(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(learning_objectives_generator.time, 'monotonic', lambda: now[0])
+    cache = ResultCache(max_entries=4, ttl=10)
+    cache.put('a', 1)
+    now[0] += 11
+    assert cache.get('a') is None
+    stats = cache.stats()
+    assert (stats['expirations'], stats['misses'], stats['size']) == (1, 1, 0)
+
+def test_disabled_cache_counts_nothing():
+    cache = ResultCache(max_entries=0)
+    cache.put('a', 1)
+    assert cache.get('a') is None
+    assert cache.stats()['misses'] == 0
+
+def test_generator_caches_on_the_normalized_goal():
+    generator = LearningObjectivesGenerator(cache_size=8)
+    first = generator.generate_learning_objectives("Design a  Bridge")
+    second = generator.generate_learning_objectives("design a bridge")
+    assert generator.cache.stats()['hits'] == 1
+    assert second['goal'] == "design a bridge" and first['goal'] == "Design a  Bridge"
+    second['supporting_objectives'].append("changed")
+    assert "changed" not in generator.generate_learning_objectives("design a bridge")['supporting_objectives']
+
+def test_env_settings_are_validated(monkeypatch):
+    monkeypatch.setenv('SETTING', ' 12 ')
+    assert env_int('SETTING', 1) == 12
+    monkeypatch.setenv('SETTING', '')
+    assert env_float('SETTING', 2.5) == 2.5
+    monkeypatch.setenv('SETTING', 'lots')
+    with pytest.raises(ConfigError, match="SETTING must be an integer"):
+        env_int('SETTING', 1)
+    monkeypatch.setenv('SETTING', '-1')
+    with pytest.raises(ConfigError, match="at least 0"):
+        env_float('SETTING', 1.0)
+
+def test_bad_cache_size_names_the_variable(monkeypatch):
+    monkeypatch.setattr(learning_objectives_generator, '_shared_generator', None)
+    monkeypatch.setenv('LEARNING_OBJECTIVES_CACHE_SIZE', '1k')
+    with pytest.raises(ConfigError, match="LEARNING_OBJECTIVES_CACHE_SIZE"):
+        get_generator()
@@ -0,0 +1,74 @@
+import pytest
+
+from learning_objectives_generator import (
+    BLOOMS_LEVELS, GOAL_KEYWORDS, MAIN_VERB_RULES, OBJECTIVE_RULES, SUPPORTING_RULES,
+    ObjectiveRuleEngine, ObjectiveTemplate, ruleset_version,
+)
+
+def test_template_without_fields_is_rendered_up_front():
+    template = ObjectiveTemplate("list the supplies", " (remember)")
+    assert template.rendered == "List the supplies. (remember)"
+    assert template.render({}) == template.rendered
+
+def test_template_fills_fields():
+    template = ObjectiveTemplate("Apply knowledge to {cleaned_goal}", " (apply)")
+    assert template.rendered is None
+    assert template.render({'cleaned_goal': "bridge design"}) == "Apply knowledge to bridge design. (apply)"
+
+def test_keywords_cover_every_rule():
+    expected = set()
+    for rules in list(MAIN_VERB_RULES.values()) + list(SUPPORTING_RULES.values()):
+        for keywords, _ in rules:
+            expected.update(keywords)
+    assert set(GOAL_KEYWORDS) == expected
+
+def test_every_level_has_a_fallback_rule():
+    for rules in list(MAIN_VERB_RULES.values()) + list(SUPPORTING_RULES.values()):
+        assert rules[-1][0] == ()
+
+def test_first_matching_rule_wins():
+    engine = ObjectiveRuleEngine(
+        {1: ((("a", "b"), "Both"), (("a",), "First"), ((), "Default"))},
+        {},
+        {1: BLOOMS_LEVELS[1]},
+    )
+    assert engine._select(frozenset({"a", "b"}))[0][1] == "Both"
+    assert engine._select(frozenset({"a"}))[0][1] == "First"
+    assert engine._select(frozenset({"b"}))[0][1] == "Default"
+
+def test_selection_is_memoized_per_keyword_set():
+    engine = ObjectiveRuleEngine(MAIN_VERB_RULES, SUPPORTING_RULES, BLOOMS_LEVELS)
+    first = engine._select(frozenset({"design"}))
+    assert engine._select(frozenset({"design"})) is first
+    assert len(engine._selections) == 1
+
+@pytest.mark.parametrize("goal, supporting", [
+    ("Students will design a user interface for a mobile app", [
+        "Recall the principles of user interface design. (remember)",
+        "Explain user experience design principles. (understand)",
+        "Apply design principles to create interface prototypes. (apply)",
+        "Analyze existing applications for design patterns. (analyze)",
+        "Evaluate the effectiveness of different ui approaches. (evaluate)",
+    ]),
+    ("Students will write a marketing plan", [
+        "Identify the components of marketing strategy. (remember)",
+        "Explain marketing principles and strategies. (understand)",
+        "Apply marketing concepts to develop campaign strategies. (apply)",
+        "Analyze market conditions and competitive landscape. (analyze)",
+        "Evaluate the potential success of marketing strategies. (evaluate)",
+    ]),
+    ("Students will know the emergency supplies", [
+        "List the supplies needed for each emergency procedure. (remember)",
+        "Explain the purpose of each supply item. (understand)",
+    ]),
+])
+def test_supporting_objectives_follow_domain_rules(generator, goal, supporting):
+    assert generator.generate_learning_objectives(goal)['supporting_objectives'] == supporting
+
+def test_main_objective_does_not_repeat_the_verb(generator):
+    analysis = generator.analyze_goal("Design a bridge")
+    assert OBJECTIVE_RULES.main_objective(analysis, 6) == "Design a bridge. (create)"
+
+def test_ruleset_version_is_stable():
+    assert ruleset_version() == ruleset_version()
+    assert len(ruleset_version()) == 16
@@ -0,0 +1,25 @@
+import pytest
+
+import simple_web_server
+import start
+
+@pytest.mark.parametrize('argv, message', [
+    (['--processes', '-2'], "--processes must be 0"),
+    (['--workers', '0'], "--workers must be at least 1"),
+    (['--max-in-flight', '0'], "--max-in-flight must be at least 1"),
+    (['--max-queue', '-1'], "--max-queue must be at least 0"),
+    (['--queue-timeout', '-0.5'], "--queue-timeout must be at least 0"),
+    (['--idle-timeout', '0'], "--idle-timeout must be more than 0"),
+    (['--max-queued-jobs', '0'], "--max-queued-jobs must be at least 1"),
+])
+@pytest.mark.parametrize('parse_args', [simple_web_server.parse_args, start.parse_args])
+def test_out_of_range_options_are_usage_errors(parse_args, argv, message, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        parse_args(argv)
+    assert exit_info.value.code == 2
+    assert message in capsys.readouterr().err
+
+def test_boundary_values_are_accepted():
+    args = simple_web_server.parse_args(['--processes', '0', '--workers', '1', '--max-in-flight', '1',
+                                         '--max-queue', '0', '--queue-timeout', '0'])
+    assert (args.processes, args.workers, args.max_queue) == (0, 1, 0)
@@ -0,0 +1,108 @@
+import os
+
+import pytest
+
+import shared_cache
+from shared_cache import SharedResultCache
+
+RESULT = {'goal': 'design a bridge', 'main_objective': 'Design a bridge. (create)'}
+
+@pytest.fixture
+def cache():
+    cache = SharedResultCache(max_entries=16, slot_size=512)
+    yield cache
+    cache.close()
+
+def test_put_and_get(cache):
+    assert cache.get('design a bridge') is None
+    cache.put('design a bridge', RESULT)
+    assert cache.get('design a bridge') == RESULT
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['hit_ratio']) == (1, 1, 0.5)
+
+def test_lookups_take_no_lock(cache, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("lookup claimed a counter slot")
+    monkeypatch.setattr(cache, '_claim_counter_slot', fail)
+    cache.get('design a bridge')
+    assert cache.misses == 1
+
+def test_counts_are_published_outside_lookups(cache):
+    cache.get('design a bridge')
+    cache.get('design a bridge')
+    assert cache._counter_offset is None
+    cache.publish()
+    assert cache.stats()['misses'] == 2
+
+def test_oversized_results_are_counted(cache):
+    cache.put('design a bridge', {'text': 'x' * 1000})
+    assert cache.get('design a bridge') is None
+    assert cache.stats()['too_large'] == 1
+
+def test_clock_eviction_keeps_the_bucket_bounded():
+    cache = SharedResultCache(max_entries=8, slot_size=512)
+    try:
+        for i in range(20):
+            cache.put(f'goal {i}', RESULT)
+        stats = cache.stats()
+        assert stats['size'] == 8
+        assert stats['evictions'] == 12
+        assert cache.get('goal 19') == RESULT
+    finally:
+        cache.close()
+
+def test_exhausted_counter_slots_are_retried_and_reported(cache, monkeypatch):
+    monkeypatch.setattr(shared_cache, 'process_exists', lambda pid: True)
+    for index in range(shared_cache.MAX_PROCESSES):
+        shared_cache.COUNTERS.pack_into(cache._buffer, cache._counters_offset + index * shared_cache.COUNTERS.size,
+                                        1_000_000 + index, 0, 0)
+    cache.get('design a bridge')
+    assert cache.stats()['uncounted_processes'] == 1
+    cache.publish()
+    assert cache.stats()['uncounted_processes'] == 1  # reported once per process
+
+    # A slot frees up: the next attempt after the retry delay takes it
+    shared_cache.COUNTERS.pack_into(cache._buffer, cache._counters_offset, 0, 0, 0)
+    cache.publish()
+    assert cache._counter_offset is None
+    cache._next_claim = 0.0
+    stats = cache.stats()
+    assert stats['uncounted_processes'] == 0
+    assert stats['misses'] == 1
+
+def test_a_replacement_process_keeps_the_exited_counts(cache, monkeypatch):
+    shared_cache.COUNTERS.pack_into(cache._buffer, cache._counters_offset, 2 ** 40, 5, 7)
+    monkeypatch.setattr(shared_cache, 'process_exists', lambda pid: pid == os.getpid())
+    cache.get('design a bridge')
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses']) == (5, 8)
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason="needs os.fork")
+def test_forked_workers_count_separately(cache):
+    cache.put('design a bridge', RESULT)
+    cache.get('design a bridge')
+    cache.publish()
+    pid = os.fork()
+    if pid == 0:
+        status = 1
+        try:
+            if cache.hits == 0:
+                cache.get('design a bridge')
+                cache.get('missing goal')
+                cache.publish()
+                status = 0
+        finally:
+            os._exit(status)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses']) == (2, 1)
+
+def test_bad_size_setting_is_reported(monkeypatch):
+    import importlib
+    from config import ConfigError
+    monkeypatch.setenv('LEARNING_OBJECTIVES_SHARED_CACHE_SIZE', '-1')
+    with pytest.raises(ConfigError, match="LEARNING_OBJECTIVES_SHARED_CACHE_SIZE"):
+        importlib.reload(shared_cache)
+    monkeypatch.delenv('LEARNING_OBJECTIVES_SHARED_CACHE_SIZE')
+    importlib.reload(shared_cache)
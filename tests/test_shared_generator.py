@@ -0,0 +1,22 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from learning_objectives_generator import BLOOMS_LEVELS, LearningObjectivesGenerator, get_generator
+
+def test_get_generator_returns_one_instance():
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        generators = list(executor.map(lambda _: get_generator(), range(32)))
+    assert all(generator is generators[0] for generator in generators)
+
+def test_instances_share_the_immutable_tables():
+    first, second = LearningObjectivesGenerator(), LearningObjectivesGenerator()
+    assert first.blooms_levels is second.blooms_levels is BLOOMS_LEVELS
+    with pytest.raises(TypeError):
+        first.blooms_levels[1] = None
+
+def test_concurrent_generation_matches_sequential(generator):
+    goals = [f"Students will design a system for case {index}" for index in range(50)]
+    expected = [generator.generate_learning_objectives(goal) for goal in goals]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(generator.generate_learning_objectives, goals)) == expected
@@ -0,0 +1,41 @@
+import pytest
+
+import learning_objectives_generator
+import start
+
+@pytest.mark.parametrize("code, status", [(None, 0), (0, 0), (2, 2), ("fatal", 1)])
+def test_exit_status(code, status):
+    assert start.exit_status(code) == status
+
+def test_run_mode_turns_system_exit_into_a_status():
+    def exits():
+        raise SystemExit(2)
+    assert start.run_mode(exits) == 2
+    assert start.run_mode(lambda: None) == 0
+
+def _answers(monkeypatch, *answers):
+    replies = iter(answers)
+    monkeypatch.setattr('builtins.input', lambda prompt='': next(replies))
+
+def test_command_line_mode_survives_an_argparse_exit(monkeypatch, capsys):
+    def main(argv):
+        raise SystemExit(2)
+    monkeypatch.setattr(learning_objectives_generator, 'main', main)
+    _answers(monkeypatch, "design a bridge")
+    assert start.start_command_line() == 2
+
+def test_menu_continues_after_a_mode_exits(monkeypatch, capsys):
+    calls = []
+    def main(argv):
+        calls.append(argv)
+        raise SystemExit("Error: something went wrong")
+    monkeypatch.setattr(learning_objectives_generator, 'main', main)
+    _answers(monkeypatch, "2", "-starts with a dash", "y", "5")
+    start.main([])
+    assert calls == [['--', '-starts with a dash']]
+    assert "Goodbye" in capsys.readouterr().out
+
+def test_command_line_mode_prints_objectives(monkeypatch, capsys):
+    _answers(monkeypatch, "design a bridge")
+    assert start.start_command_line() == 0
+    assert "1.0.0. Design a bridge. (create)" in capsys.readouterr().out
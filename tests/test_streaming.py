@@ -0,0 +1,41 @@
+import io
+import json
+
+import pytest
+
+from learning_objectives_generator import parse_goal_line, stream_objectives
+
+@pytest.mark.parametrize("line, goal", [
+    ("design a bridge\n", "design a bridge"),
+    ('"design a bridge"\n', "design a bridge"),
+    ('{"goal": "  design a bridge "}', "design a bridge"),
+    ('"Quality" assurance basics', '"Quality" assurance basics'),
+    ('{braces} in a goal', "{braces} in a goal"),
+])
+def test_parse_goal_line(line, goal):
+    assert parse_goal_line(line) == goal
+
+@pytest.mark.parametrize("line, error", [
+    ('{"goal": 5}', "Goal must be a string"),
+    ('{"title": "x"}', "Goal must be a string"),
+    ('""', "Goal cannot be empty"),
+    ('   ', "Goal cannot be empty"),
+])
+def test_parse_goal_line_errors(line, error):
+    with pytest.raises(ValueError, match=error):
+        parse_goal_line(line)
+
+def test_stream_writes_one_record_per_goal_with_line_numbers(generator):
+    output = io.StringIO()
+    lines = ["design a bridge\n", "\n", '{"goal": 5}\n', '"Quality" assurance basics\n']
+    assert stream_objectives(generator, lines, output) == (3, 1)
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [(record['line'], record['success']) for record in records] == [(1, True), (3, False), (4, True)]
+    assert records[2]['result']['goal'] == '"Quality" assurance basics'
+
+def test_stream_text_format(generator):
+    output = io.StringIO()
+    stream_objectives(generator, ["design a bridge", '{"goal": 5}'], output, output_format='text')
+    text = output.getvalue()
+    assert text.startswith("1.0.0. Design a bridge. (create)")
+    assert "Line 2: Error: Goal must be a string" in text
@@ -0,0 +1,29 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from simple_web_server import LearningObjectivesHandler, ThreadPoolHTTPServer
+from tests.helpers import http_request
+
+def test_concurrent_requests_all_succeed(server_port):
+    def generate(index):
+        return http_request(server_port, 'POST', '/api/generate', {'goal': f"design a system {index}"})
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        responses = list(executor.map(generate, range(48)))
+    assert [status for status, _, _ in responses] == [200] * 48
+    assert json.loads(responses[5][2])['result']['goal'] == "design a system 5"
+
+def test_connections_beyond_the_pool_wait_instead_of_failing():
+    server = ThreadPoolHTTPServer(('127.0.0.1', 0), LearningObjectivesHandler, workers=1)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        port = server.server_address[1]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            statuses = list(executor.map(lambda _: http_request(port, 'GET', '/health')[0], range(8)))
+        assert statuses == [200] * 8
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
@@ -0,0 +1,29 @@
+import pytest
+
+from learning_objectives_generator import BLOOMS_LEVELS, VERB_INDEX
+
+@pytest.mark.parametrize("goal, level", [
+    ("Students will design a bridge", 6),
+    ("compare two poems", 4),
+    ("analyze-data", 4),
+    ("Students will DESIGN, build and evaluate", 6),
+    ("explain photosynthesis", 2),
+])
+def test_highest_verb_wins(generator, goal, level):
+    assert generator.identify_bloom_level(goal) == level
+
+def test_short_remember_goal_is_raised_to_understand(generator):
+    assert generator.identify_bloom_level("define x") == 2
+
+def test_know_with_procedures_is_apply(generator):
+    assert generator.identify_bloom_level("know the procedures for fire safety") == 3
+
+def test_index_covers_every_verb_and_its_inflections():
+    for level, info in BLOOMS_LEVELS.items():
+        for verb in info.verbs:
+            assert VERB_INDEX[verb] >= level
+    assert VERB_INDEX["designing"] == VERB_INDEX["design"]
+
+def test_index_is_read_only():
+    with pytest.raises(TypeError):
+        VERB_INDEX["design"] = 1
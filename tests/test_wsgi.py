@@ -0,0 +1,44 @@
+import pytest
+
+from tests.helpers import http_request, wsgi_request
+from wsgi import application
+
+@pytest.mark.parametrize("body, status, error", [
+    ({'goal': 5}, 400, 'Goal must be a string'),
+    ({'goal': None}, 400, 'Goal must be a string'),
+    ({'goal': '   '}, 400, 'Goal cannot be empty'),
+    ({'title': 'x'}, 400, 'No goal provided'),
+    (['design a bridge'], 400, 'No goal provided'),
+    (b'{oops', 400, 'Invalid JSON data'),
+    (b'\xff\xfe', 400, 'Invalid JSON data'),
+])
+def test_wsgi_generate_rejects_bad_input(body, status, error):
+    code, headers, response = wsgi_request(application, 'POST', '/api/generate', body)
+    assert code == status
+    assert error.encode('utf-8') in response
+
+@pytest.mark.parametrize("body", [{'goal': 5}, {'goal': ['a']}, [1], b'\xff\xfe'])
+def test_server_generate_rejects_bad_input(server_port, body):
+    status, _, _ = http_request(server_port, 'POST', '/api/generate', body,
+                                headers={'Content-Type': 'application/json'})
+    assert status == 400
+
+def test_wsgi_status_lines_come_from_http_status():
+    started = []
+    environ = {'REQUEST_METHOD': 'PUT', 'PATH_INFO': '/api/generate'}
+    application(environ, lambda status, headers: started.append((status, dict(headers))))
+    status, headers = started[0]
+    assert status == '405 Method Not Allowed'
+    assert headers['Allow'] == 'POST'
+
+def test_wsgi_unknown_path_and_head():
+    assert wsgi_request(application, 'GET', '/missing')[0] == 404
+    status, headers, body = wsgi_request(application, 'HEAD', '/')
+    assert status == 200
+    assert body == b''
+    assert int(headers['Content-Length']) > 0
+
+def test_wsgi_health():
+    status, _, body = wsgi_request(application, 'GET', '/health')
+    assert status == 200
+    assert b'"healthy"' in body
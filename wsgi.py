@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Flask-free WSGI entry point for the Learning Objectives Generator
+Serves the same page, generation and health endpoints as app.py using only
+the standard library, so serverless cold starts skip importing Flask.
+"""
+
+import json
+import sys
+import os
+from http import HTTPStatus
+from typing import Callable, Dict, List, Tuple
+
+# Add the current directory to Python path to import our generator
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from learning_objectives_generator import get_generator, parse_goal_batch, BatchTooLargeError
+from prepared_page import PreparedPage
+from page_template import HTML_TEMPLATE
+from metrics import StageTimer, server_timing_header
+from config import DEFAULT_MAX_BODY_SIZE
+
+# The page encoded and compressed once at startup
+INDEX_PAGE = PreparedPage(HTML_TEMPLATE)
+
+class RequestError(Exception):
+    """A request the client has to fix, with the status code to answer it with"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+def _json_response(status: int, payload: Dict, timer: StageTimer = None) -> Tuple[int, List[Tuple[str, str]], bytes]:
+    body = json.dumps(payload).encode('utf-8')
+    headers = [('Content-Type', 'application/json'), ('Content-Length', str(len(body)))]
+    if timer is not None:
+        timer.lap('serialize')
+        headers.append(('Server-Timing', server_timing_header(timer)))
+    return status, headers, body
+
+def _error_response(status: int, message: str):
+    return _json_response(status, {'success': False, 'error': message})
+
+def _read_body(environ: Dict, timer: StageTimer) -> bytes:
+    """Read the request body, refusing bodies over the size limit"""
+    try:
+        length = int(environ.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        raise RequestError(400, 'Invalid Content-Length')
+    if length > DEFAULT_MAX_BODY_SIZE:
+        raise RequestError(413, f'Request body cannot be larger than {DEFAULT_MAX_BODY_SIZE} bytes')
+
+    stream = environ['wsgi.input']
+    if length:
+        body = stream.read(length)
+    elif environ.get('wsgi.input_terminated'):
+        # Chunked bodies have no length; read one byte past the limit to detect oversize
+        body = stream.read(DEFAULT_MAX_BODY_SIZE + 1)
+        if len(body) > DEFAULT_MAX_BODY_SIZE:
+            raise RequestError(413, f'Request body cannot be larger than {DEFAULT_MAX_BODY_SIZE} bytes')
+    else:
+        body = b''
+    timer.lap('read')
+    return body
+
+def _read_json(environ: Dict, timer: StageTimer):
+    """Read and decode the JSON request body"""
+    body = _read_body(environ, timer)
+    try:
+        data = json.loads(body.decode('utf-8'))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        raise RequestError(400, 'Invalid JSON data')
+    timer.lap('parse')
+    return data
+
+def index(environ: Dict):
+    """Main page with the form"""
+    encoding, body, etag = INDEX_PAGE.select(environ.get('HTTP_ACCEPT_ENCODING'))
+    headers = INDEX_PAGE.headers(encoding, etag)
+
+    if INDEX_PAGE.is_not_modified(environ.get('HTTP_IF_NONE_MATCH'), etag):
+        return 304, [(name, headers[name]) for name in ('ETag', 'Cache-Control', 'Vary')], b''
+
+    return 200, list(headers.items()) + [('Content-Length', str(len(body)))], body
+
+def generate_objectives(environ: Dict):
+    """Generate learning objectives for the goal in the request body"""
+    timer = StageTimer()
+    data = _read_json(environ, timer)
+
+    if not isinstance(data, dict) or 'goal' not in data:
+        return _error_response(400, 'No goal provided')
+
+    if not isinstance(data['goal'], str):
+        return _error_response(400, 'Goal must be a string')
+
+    goal = data['goal'].strip()
+
+    if not goal:
+        return _error_response(400, 'Goal cannot be empty')
+
+    result = get_generator().generate_learning_objectives(goal, timer)
+    return _json_response(200, {'success': True, 'result': result}, timer)
+
+def generate_objectives_batch(environ: Dict):
+    """Generate learning objectives for a JSON array of goals"""
+    timer = StageTimer()
+    body = _read_body(environ, timer)
+
+    # Decoded one goal at a time, stopping as soon as the batch is too large
+    try:
+        goals = parse_goal_batch(body.decode('utf-8'))
+    except BatchTooLargeError as e:
+        return _error_response(413, str(e))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return _error_response(400, 'Invalid JSON data')
+    timer.lap('parse')
+
+    if goals is None:
+        return _error_response(400, 'Request body must be a JSON array of goals')
+
+    results = get_generator().generate_learning_objectives_batch(goals, timer)
+    return _json_response(200, {'success': True, 'results': results}, timer)
+
+def health_check(environ: Dict):
+    """Health check endpoint"""
+    generator = get_generator()
+    return _json_response(200, {
+        'status': 'healthy',
+        'cache': generator.cache.stats(),
+        'persistent_cache': generator.persistent_cache.stats() if generator.persistent_cache else None
+    })
+
+# path -> (allowed method, handler)
+ROUTES: Dict[str, Tuple[str, Callable]] = {
+    '/': ('GET', index),
+    '/api/generate': ('POST', generate_objectives),
+    '/api/generate/batch': ('POST', generate_objectives_batch),
+    '/health': ('GET', health_check),
+}
+
+def application(environ: Dict, start_response: Callable) -> List[bytes]:
+    """The WSGI callable"""
+    route = ROUTES.get(environ.get('PATH_INFO') or '/')
+    method = environ.get('REQUEST_METHOD', 'GET')
+
+    if route is None:
+        status, headers, body = _error_response(404, 'Endpoint not found')
+    elif method != route[0] and not (method == 'HEAD' and route[0] == 'GET'):
+        status, headers, body = _error_response(405, 'Method not allowed')
+        headers.append(('Allow', route[0]))
+    else:
+        try:
+            status, headers, body = route[1](environ)
+        except RequestError as e:
+            status, headers, body = _error_response(e.status, e.message)
+        except Exception as e:
+            status, headers, body = _error_response(500, str(e))
+
+    start_response(f'{status} {HTTPStatus(status).phrase}', headers)
+    return [] if method == 'HEAD' else [body]
+
+# Vercel's Python runtime looks for a WSGI callable named app
+app = application
+
+if __name__ == '__main__':
+    from wsgiref.simple_server import make_server
+
+    port = int(os.environ.get('PORT', 8000))
+    print(f"Serving the WSGI app on http://localhost:{port}")
+    with make_server('', port, application) as httpd:
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass